@@ -392,30 +392,26 @@ std::string NativeHandlers::GetMaterials(const std::string& params, MCPBridgeGUP
         std::vector<INode*> allNodes;
         CollectNodes(root, allNodes);
 
-        // Use a set to deduplicate by material pointer
-        std::set<Mtl*> seenMtls;
+        // One pass over the nodes: material pointer -> index in materials,
+        // so each node's name is appended to its material's users directly
+        std::map<Mtl*, size_t> mtlIndex;
         json materials = json::array();
 
         for (INode* node : allNodes) {
             Mtl* mtl = node->GetMtl();
             if (!mtl) continue;
-            if (seenMtls.count(mtl)) continue;
-            seenMtls.insert(mtl);
 
-            json matJ;
-            matJ["name"] = WideToUtf8(mtl->GetName().data());
-            matJ["class"] = WideToUtf8(mtl->ClassName().data());
-            matJ["subMtlCount"] = mtl->NumSubMtls();
-
-            // Collect which nodes use this material
-            json users = json::array();
-            for (INode* n2 : allNodes) {
-                if (n2->GetMtl() == mtl) {
-                    users.push_back(WideToUtf8(n2->GetName()));
-                }
+            auto found = mtlIndex.find(mtl);
+            if (found == mtlIndex.end()) {
+                json matJ;
+                matJ["name"] = WideToUtf8(mtl->GetName().data());
+                matJ["class"] = WideToUtf8(mtl->ClassName().data());
+                matJ["subMtlCount"] = mtl->NumSubMtls();
+                matJ["usedBy"] = json::array();
+                found = mtlIndex.emplace(mtl, materials.size()).first;
+                materials.push_back(std::move(matJ));
             }
-            matJ["usedBy"] = users;
-            materials.push_back(matJ);
+            materials[found->second]["usedBy"].push_back(WideToUtf8(node->GetName()));
         }
 
         json result;
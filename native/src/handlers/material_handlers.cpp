@@ -616,6 +616,7 @@ std::string NativeHandlers::CreateTextureMap(const std::string& params, MCPBridg
         std::string mapName = p.value("map_name", "");
         std::string msParams = p.value("params", "");
         auto properties = p.value("properties", json::object());
+        auto postProperties = p.value("post_properties", json::object());
         std::string globalVar = p.value("global_var", "");
 
         if (mapClass.empty())
@@ -641,17 +642,19 @@ std::string NativeHandlers::CreateTextureMap(const std::string& params, MCPBridg
 
         RunMAXScript(script);
 
-        // Set properties
+        // Set properties, then post_properties (e.g. OSL inputs exposed by OSLPath)
         json setProps = json::array();
         json errors = json::array();
-        for (auto& [key, val] : properties.items()) {
-            std::string propScript = "try (" + globalVar + "." + key + " = " +
-                                     val.get<std::string>() + "; true) catch (false)";
-            std::string r = RunMAXScript(propScript);
-            if (r == "true") {
-                setProps.push_back(key);
-            } else {
-                errors.push_back(key);
+        for (const json* pass : {&properties, &postProperties}) {
+            for (auto& [key, val] : pass->items()) {
+                std::string propScript = "try (" + globalVar + "." + key + " = " +
+                                         val.get<std::string>() + "; true) catch (false)";
+                std::string r = RunMAXScript(propScript);
+                if (r == "true") {
+                    setProps.push_back(key);
+                } else {
+                    errors.push_back(key);
+                }
             }
         }
 
@@ -117,9 +117,10 @@ std::string NativeHandlers::RemoveModifier(const std::string& params, MCPBridgeG
         json p = json::parse(params, nullptr, false);
         std::string name = p.value("name", "");
         std::string modName = p.value("modifier", "");
+        int modIndex = p.value("modifier_index", 0);
 
         if (name.empty()) throw std::runtime_error("name is required");
-        if (modName.empty()) throw std::runtime_error("modifier name is required");
+        if (modName.empty() && modIndex <= 0) throw std::runtime_error("modifier name or modifier_index is required");
 
         INode* node = FindNodeByName(name);
         if (!node) throw std::runtime_error("Object not found: " + name);
@@ -130,9 +131,20 @@ std::string NativeHandlers::RemoveModifier(const std::string& params, MCPBridgeG
         }
 
         IDerivedObject* dobj = (IDerivedObject*)objRef;
-        int idx = FindModifierIndex(node, modName);
-        if (idx < 0) {
-            throw std::runtime_error("Modifier \"" + modName + "\" not found on " + name);
+        int idx = -1;
+        if (modIndex > 0) {
+            // 1-based index from user → 0-based SDK index
+            idx = modIndex - 1;
+            if (idx >= dobj->NumModifiers()) {
+                throw std::runtime_error("Modifier index " + std::to_string(modIndex) +
+                    " out of range (has " + std::to_string(dobj->NumModifiers()) + ")");
+            }
+            modName = WideToUtf8(dobj->GetModifier(idx)->GetName(false).data());
+        } else {
+            idx = FindModifierIndex(node, modName);
+            if (idx < 0) {
+                throw std::runtime_error("Modifier \"" + modName + "\" not found on " + name);
+            }
         }
 
         dobj->DeleteModifier(idx);
@@ -1,5 +1,7 @@
 """Shared constants and math helpers for grid-based construction."""
 
+import math
+
 # ---------------------------------------------------------------------------
 # Architectural constants (centimetres)
 # ---------------------------------------------------------------------------
@@ -69,17 +71,14 @@ def circular_position(
     cx: float, cy: float, radius: float, angle_rad: float,
 ) -> tuple[float, float]:
     """Return (x, y) on a circle centred at (cx, cy)."""
-    import math
     return (cx + radius * math.cos(angle_rad), cy + radius * math.sin(angle_rad))
 
 
 def arch_z(angle_rad: float, radius: float) -> float:
     """Return Z offset for a semicircular arch at the given angle (0..pi)."""
-    import math
     return radius * math.sin(angle_rad)
 
 
 def arch_x(angle_rad: float, radius: float) -> float:
     """Return X offset for a semicircular arch at the given angle (0..pi)."""
-    import math
     return radius * math.cos(angle_rad)
@@ -0,0 +1,52 @@
+"""Short-lived cache for inspect_object/inspect_properties/get_materials results.
+
+Kept free of server imports so scene-mutating tool modules can invalidate it
+without a circular import through ``src.tools.inspect``.
+"""
+
+import time
+
+# Seconds an inspection result is reused before asking 3ds Max again
+INSPECT_CACHE_TTL = 2.0
+
+# (tool, name, target, modifier_index) -> (monotonic timestamp, result)
+_inspect_cache: dict[tuple, tuple[float, str]] = {}
+
+
+def invalidate_inspect_cache() -> int:
+    """Drop all cached inspection results and return how many were dropped."""
+    count = len(_inspect_cache)
+    _inspect_cache.clear()
+    return count
+
+
+def _cacheable(result: str) -> bool:
+    # Only successful JSON objects and arrays are cached so a missing object
+    # is looked up again as soon as it is created
+    return result.startswith(("{", "[")) and not result.startswith('{"error"')
+
+
+def peek_inspect(key: tuple) -> str | None:
+    """Return the fresh cached result for *key*, or None."""
+    hit = _inspect_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < INSPECT_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def store_inspect(key: tuple, result: str) -> None:
+    """Remember *result* for *key* if it is a successful inspection."""
+    if _cacheable(result):
+        _inspect_cache[key] = (time.monotonic(), result)
+
+
+def cached_inspect(key: tuple, fetch) -> str:
+    """Return a fresh cached result for *key*, or call *fetch* and remember it."""
+    now = time.monotonic()
+    hit = _inspect_cache.get(key)
+    if hit is not None and now - hit[0] < INSPECT_CACHE_TTL:
+        return hit[1]
+    result = fetch()
+    if _cacheable(result):
+        _inspect_cache[key] = (now, result)
+    return result
@@ -4,6 +4,7 @@ import json
 import socket
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, Optional
 from uuid import uuid4
 
@@ -11,6 +12,10 @@ DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8765
 DEFAULT_TIMEOUT = 120.0
 DEFAULT_PIPE_NAME = r"\\.\pipe\3dsmax-mcp"
+# Fallback scripts report failure in their result string rather than raising;
+# queued replies that look like one of these are kept as errors
+_QUEUED_FAILURE_PREFIXES = ("Error", "Object not found", "No material")
+_QUEUED_PARTIAL_FAILURE = " | Errors: "
 
 # Win32 constants for named pipe
 _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
@@ -85,6 +90,10 @@ class MaxClient:
         self.pipe_name = pipe_name
         self._pipe_handle: Optional[int] = None
         self._pipe_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._queue_executor: Optional[ThreadPoolExecutor] = None
+        self._queued: list[Future] = []
+        self._queued_errors: list[str] = []
 
     @property
     def native_available(self) -> bool:
@@ -97,6 +106,12 @@ class MaxClient:
 
     def _probe_pipe_available(self) -> bool:
         """Best-effort probe that treats a busy pipe as available."""
+        # Every tool checks availability before sending; while the persistent
+        # request handle is connected, that is proof enough and saves opening
+        # (and the bridge accepting) a throwaway pipe connection per call
+        if self._pipe_handle not in (None, 0, _INVALID_HANDLE):
+            return True
+
         handle = _kernel32.CreateFileW(
             self.pipe_name,
             _GENERIC_READ | _GENERIC_WRITE,
@@ -186,6 +201,63 @@ class MaxClient:
         timeout: Optional[float] = None,
     ) -> dict[str, Any]:
         """Send a command to 3ds Max and return the parsed JSON response."""
+        # Queued writes land first, so a read never sees the scene before them
+        self._wait_queued()
+        return self._send_command(command, cmd_type, timeout)
+
+    def send_command_async(
+        self,
+        command: str,
+        cmd_type: str = "maxscript",
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Queue a command and return without waiting for its reply.
+
+        Queued commands run in order on one worker thread, which still reads
+        each reply so the pipe stays in step. Failures, raised or reported
+        in the reply, are kept for wait_queued_commands.
+        """
+        with self._queue_lock:
+            if self._queue_executor is None:
+                self._queue_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="max-queue"
+                )
+            self._queued.append(
+                self._queue_executor.submit(self._run_queued, command, cmd_type, timeout)
+            )
+
+    def wait_queued_commands(self) -> list[str]:
+        """Wait for every queued command and return (and clear) their errors."""
+        self._wait_queued()
+        with self._queue_lock:
+            errors, self._queued_errors = self._queued_errors, []
+        return errors
+
+    def _run_queued(self, command: str, cmd_type: str, timeout: Optional[float]) -> None:
+        try:
+            result = self._send_command(command, cmd_type, timeout).get("result", "")
+        except Exception as exc:
+            result = str(exc)
+        else:
+            if not isinstance(result, str) or not (
+                result.startswith(_QUEUED_FAILURE_PREFIXES) or _QUEUED_PARTIAL_FAILURE in result
+            ):
+                return
+        with self._queue_lock:
+            self._queued_errors.append(result)
+
+    def _wait_queued(self) -> None:
+        with self._queue_lock:
+            queued, self._queued = self._queued, []
+        if queued:
+            wait(queued)
+
+    def _send_command(
+        self,
+        command: str,
+        cmd_type: str,
+        timeout: Optional[float],
+    ) -> dict[str, Any]:
         effective_timeout = timeout or self.timeout
         request_id = uuid4().hex
         started_at = time.perf_counter()
@@ -256,8 +328,13 @@ class MaxClient:
                             handle, buf, len(buf), ctypes.byref(bytes_read), None
                         )
                         if bytes_read.value > 0:
-                            response_data.extend(buf.raw[:bytes_read.value])
-                            if b"\n" in response_data:
+                            # Copy only the bytes read (buf.raw would copy the
+                            # whole 64 KiB buffer) and look for the terminator
+                            # in the new chunk rather than rescanning the
+                            # accumulated response.
+                            chunk_start = len(response_data)
+                            response_data.extend(memoryview(buf)[:bytes_read.value])
+                            if response_data.find(b"\n", chunk_start) != -1:
                                 return bytes(response_data)
 
                         if not ok:
@@ -294,16 +371,16 @@ class MaxClient:
             sock.connect((self.host, self.port))
             sock.sendall((request + "\n").encode("utf-8"))
 
-            response_data = b""
+            response_data = bytearray()
             while True:
-                chunk = sock.recv(4096)
+                chunk = sock.recv(65536)
                 if not chunk:
                     break
                 response_data += chunk
-                if b"\n" in response_data:
+                if b"\n" in chunk:
                     break
 
-            return response_data
+            return bytes(response_data)
 
         except socket.timeout:
             raise TimeoutError(
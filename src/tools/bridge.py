@@ -49,3 +49,12 @@ def get_bridge_status() -> str:
     payload["connected"] = True
     payload["legacyTransport"] = False
     return json.dumps(payload)
+
+
+@mcp.tool()
+def wait_for_queued_commands() -> str:
+    """Wait for setters sent with await_result=False and report their errors."""
+    errors = client.wait_queued_commands()
+    if not errors:
+        return "All queued commands finished"
+    return f"{len(errors)} queued command(s) failed: " + "; ".join(errors)
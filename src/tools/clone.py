@@ -2,7 +2,8 @@ import json as _json
 from typing import Optional
 from ..server import mcp, client
 from ..coerce import StrList, FloatList
-from src.helpers.maxscript import safe_string
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import string_array
 
 
 @mcp.tool()
@@ -12,6 +13,7 @@ def clone_objects(
     offset: Optional[FloatList] = None,
 ) -> str:
     """Clone (copy/instance/reference) objects in the scene."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             params: dict = {"names": names, "mode": mode}
@@ -28,7 +30,7 @@ def clone_objects(
 
     mode_map = {"copy": "#copy", "instance": "#instance", "reference": "#reference"}
     ms_mode = mode_map.get(mode, "#copy")
-    name_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in names) + ")"
+    name_arr = string_array(names)
 
     maxscript = f"""(
         local nameList = {name_arr}
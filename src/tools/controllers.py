@@ -9,6 +9,7 @@ from typing import Optional
 import json as _json
 from ..server import mcp, client
 from ..coerce import DictList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string, safe_name, normalize_subanim_path
 
 
@@ -96,6 +97,7 @@ def assign_controller(
     layer: bool = False,
 ) -> str:
     """Create and assign a controller to a sub-anim track."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = {
             "name": name,
@@ -537,6 +539,7 @@ def add_controller_target(
     frame: int = 0,
 ) -> str:
     """Add a node variable or constraint target to an existing controller."""
+    invalidate_inspect_cache()
     # Always use MAXScript TCP path — ctrl.addNode triggers script re-evaluation
     # which causes re-entrancy inside the native ExecuteSync handler.
     safe_obj = safe_name(name)
@@ -606,6 +609,7 @@ def set_controller_props(
     params: Optional[dict] = None,
 ) -> str:
     """Modify script text or properties on an existing controller."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = {
             "name": name,
@@ -9,6 +9,7 @@ position, selection, vertex color, UVs, normals, etc.
 from typing import Optional
 from ..server import mcp, client
 from ..coerce import DictList, IntList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string
 
 
@@ -62,6 +63,7 @@ def add_data_channel(
     display: bool = True,
 ) -> str:
     """Add a Data Channel modifier with a complete operator graph."""
+    invalidate_inspect_cache()
     safe = safe_string(name)
 
     # Build MAXScript to add DC modifier and configure operators
@@ -205,6 +207,7 @@ def set_data_channel_operator(
     modifier_index: int = 1,
 ) -> str:
     """Set properties on a specific operator in a Data Channel modifier."""
+    invalidate_inspect_cache()
     safe = safe_string(name)
 
     lines = [
@@ -248,6 +251,7 @@ def add_dc_script_operator(
     modifier_index: int = 0,
 ) -> str:
     """Add a Data Channel modifier with a MAXScript operator for custom per-vertex/face logic."""
+    invalidate_inspect_cache()
     safe = safe_string(name)
 
     # Wrap script if needed
@@ -362,6 +366,7 @@ def load_dc_preset(
     preset_name: str,
 ) -> str:
     """Load a Data Channel modifier preset onto an object."""
+    invalidate_inspect_cache()
     safe = safe_string(name)
     safe_preset = safe_string(preset_name)
     maxscript = f"""(
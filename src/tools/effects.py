@@ -7,6 +7,7 @@ not per-object.
 
 import json
 from ..server import mcp, client
+from src.helpers.inspect_cache import invalidate_inspect_cache
 
 
 @mcp.tool()
@@ -58,6 +59,7 @@ def toggle_effect(
     active: bool = True,
 ) -> str:
     """Enable or disable an atmospheric or render effect by index."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = json.dumps({"index": index, "effect_type": effect_type, "active": active})
         response = client.send_command(payload, cmd_type="native:toggle_effect")
@@ -95,6 +97,7 @@ def delete_effect(
     effect_type: str = "atmospheric",
 ) -> str:
     """Delete an atmospheric or render effect by index."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = json.dumps({"index": index, "effect_type": effect_type})
         response = client.send_command(payload, cmd_type="native:delete_effect")
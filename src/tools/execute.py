@@ -1,9 +1,11 @@
 from ..server import mcp, client
+from src.helpers.inspect_cache import invalidate_inspect_cache
 
 
 @mcp.tool()
 def execute_maxscript(code: str = "", command: str = "") -> str:
     """Execute arbitrary MAXScript code in 3ds Max and return the result."""
+    invalidate_inspect_cache()
     script = code or command
     if not script:
         return "Error: provide MAXScript code in the 'code' parameter"
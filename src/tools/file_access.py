@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 from ..server import mcp, client
 from ..coerce import StrList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 
 
 @mcp.tool()
@@ -33,6 +34,7 @@ def merge_from_file(
     duplicate_action: str = "rename",
 ) -> str:
     """Merge objects from an external .max file into the current scene."""
+    invalidate_inspect_cache()
     payload = {
         "file_path": file_path,
         "select_merged": select_merged,
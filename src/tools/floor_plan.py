@@ -9,199 +9,159 @@ All coordinate math is done in Python — MAXScript only creates the final objec
 
 from __future__ import annotations
 
+import heapq
 import json
+from collections import defaultdict
+from collections.abc import Iterator
+from itertools import count
+from operator import itemgetter
 from typing import Any
 
 from ..server import mcp, client
 from ..coerce import FloatList, DictList
 from ..helpers.construction import DOOR_OPENING_WIDTH, LABEL_SIZE
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string
 
+# Compact encoder built once; floor plan results can list many labels.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
 
 # ---------------------------------------------------------------------------
-# Internal helpers
+# Grid / wall logic (pure Python)
 # ---------------------------------------------------------------------------
 
+# Edge directions: each cell (col, row) has 4 edges.
+# Cell (col, row) occupies [col, col+1] x [row, row+1] in grid space.
+# Convention: edges are ((x1,y1), (x2,y2)) with the smaller tuple first, so
+# the same boundary seen from either side yields the same edge.
+#
+# Occupancy is keyed by a single packed int per cell (col * 2**32 + row), so
+# a neighbour lookup is one int add and an int hash instead of a new tuple.
+_ROW_SPAN = 1 << 32
+_ROW_BIAS = 1 << 31
 
-def _create_dummy(name: str, pos: list[float], box_size: list[float]) -> str:
-    safe = safe_string(name)
-    px, py, pz = pos
-    bx, by, bz = box_size
-    cmd = f"""(
-        local d = Dummy name:"{safe}" pos:[{px},{py},{pz}] boxsize:[{bx},{by},{bz}]
-        d.pivot = [{px},{py},{pz - bz / 2.0}]
-        d.name
-    )"""
-    resp = client.send_command(cmd)
-    return resp.get("result", name)
-
-
-def _parent_objects(children: list[str], parent: str) -> str:
-    names_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in children) + ")"
-    safe_p = safe_string(parent)
-    cmd = f"""(
-        local parentObj = getNodeByName "{safe_p}"
-        local childNames = {names_arr}
-        local cnt = 0
-        for n in childNames do (
-            local c = getNodeByName n
-            if c != undefined and parentObj != undefined do (
-                c.parent = parentObj
-                cnt += 1
-            )
-        )
-        "Parented " + (cnt as string) + " objects under " + parentObj.name
-    )"""
-    resp = client.send_command(cmd)
-    return resp.get("result", "")
 
+def _pack_cell(col: int, row: int) -> int:
+    """Pack a grid cell into one int key (rows must fit in signed 32 bits)."""
+    return col * _ROW_SPAN + row
 
-# ---------------------------------------------------------------------------
-# Grid / wall logic (pure Python)
-# ---------------------------------------------------------------------------
 
-# Edge directions: each cell (col, row) has 4 edges.
-# We normalise edges as tuples of two endpoints so shared edges are identical.
-# Convention: edges are ((x1,y1), (x2,y2)) with the smaller tuple first.
+def _unpack_cell(key: int) -> tuple[int, int]:
+    """Inverse of ``_pack_cell``."""
+    col, biased_row = divmod(key + _ROW_BIAS, _ROW_SPAN)
+    return col, biased_row - _ROW_BIAS
+
 
-def _cell_edges(col: int, row: int) -> list[tuple]:
-    """Return the 4 boundary edges of a cell as normalised endpoint pairs.
+# Per edge: corner offsets (dx1, dy1, dx2, dy2), packed neighbour-key delta,
+# and whether this cell owns the edge when the neighbour is another room
+# (the cell with the smaller (col, row) owns a shared edge).
+_EDGE_OFFSETS = (
+    (0, 0, 1, 0, -1, False),          # bottom — neighbour below
+    (1, 0, 1, 1, _ROW_SPAN, True),    # right  — neighbour right
+    (0, 1, 1, 1, 1, True),            # top    — neighbour above
+    (0, 0, 0, 1, -_ROW_SPAN, False),  # left   — neighbour left
+)
 
-    Cell (col, row) occupies [col, col+1] x [row, row+1] in grid space.
-    Returns: [(edge, direction), ...] where direction is the neighbouring
-    cell that shares this edge (or None for outer edges).
+
+def _build_occupancy(rooms: list[dict]) -> tuple[dict[int, int], list[str]]:
+    """Map packed cell key (see ``_pack_cell``) -> interned room id.
+
+    Returns ``(grid, id2name)``.  Room names are interned to small ints on
+    first sight so the wall passes hash and compare ints; rooms sharing a
+    name share an id.  ``id2name[i]`` recovers the name.
     """
-    # Corners: bottom-left (col, row), bottom-right (col+1, row),
-    #          top-right (col+1, row+1), top-left (col, row+1)
-    bottom = ((col, row), (col + 1, row))        # neighbor below: (col, row-1)
-    right  = ((col + 1, row), (col + 1, row + 1))  # neighbor right: (col+1, row)
-    top    = ((col, row + 1), (col + 1, row + 1))  # neighbor above: (col, row+1)
-    left   = ((col, row), (col, row + 1))          # neighbor left:  (col-1, row)
-    return [
-        (bottom, (col, row - 1)),
-        (right,  (col + 1, row)),
-        (top,    (col, row + 1)),
-        (left,   (col - 1, row)),
-    ]
-
-
-def _build_occupancy(rooms: list[dict]) -> dict[tuple, str]:
-    """Map (col, row) -> room name."""
-    grid = {}
+    grid: dict[int, int] = {}
+    name2id: dict[str, int] = {}
+    id2name: list[str] = []
     for room in rooms:
         name = room.get("name", "Room")
+        room_id = name2id.get(name)
+        if room_id is None:
+            room_id = name2id[name] = len(id2name)
+            id2name.append(name)
         for cell in room.get("cells", []):
-            col, row = int(cell[0]), int(cell[1])
-            grid[(col, row)] = name
-    return grid
+            grid[_pack_cell(int(cell[0]), int(cell[1]))] = room_id
+    return grid, id2name
 
 
-def _extract_wall_edges(grid: dict[tuple, str]) -> list[tuple]:
+def _extract_wall_edges(grid: dict[int, int]) -> list[tuple]:
     """Find all edges that are walls (boundary between different rooms or exterior).
 
-    Returns list of (edge, room_a, room_b) where room_b may be None (exterior).
-    edge is ((x1,y1), (x2,y2)) in grid coordinates.
-    """
-    walls = {}  # edge -> (room_a, room_b)
-    for (col, row), room_name in grid.items():
-        for edge, neighbor_cell in _cell_edges(col, row):
-            # Normalise edge so both sides agree on the same key
-            norm_edge = tuple(sorted(edge))
-            neighbor_room = grid.get(neighbor_cell)
-            if neighbor_room == room_name:
-                # Same room — not a wall; remove if previously added
-                walls.pop(norm_edge, None)
-            elif norm_edge not in walls:
-                walls[norm_edge] = (room_name, neighbor_room)
-    return [(e, ra, rb) for e, (ra, rb) in walls.items()]
-
-
-def _is_horizontal(edge: tuple) -> bool:
-    """Edge is horizontal if both endpoints have the same Y."""
-    return edge[0][1] == edge[1][1]
+    Returns list of (edge, room_a, room_b) room ids where room_b may be None
+    (exterior).  edge is ((x1,y1), (x2,y2)) in grid coordinates.
 
+    Each boundary is decided exactly once: exterior edges by their only cell,
+    shared edges by their owning cell (see ``_EDGE_OFFSETS``).  Edge tuples
+    are only built for actual walls.
+    """
+    walls = []
+    add = walls.append
+    room_at = grid.get
+    for key, room_id in grid.items():
+        col, row = _unpack_cell(key)
+        for dx1, dy1, dx2, dy2, nkey, owns in _EDGE_OFFSETS:
+            neighbor_room = room_at(key + nkey)
+            if neighbor_room is None:
+                add((((col + dx1, row + dy1), (col + dx2, row + dy2)), room_id, None))
+            elif owns and neighbor_room != room_id:
+                add((((col + dx1, row + dy1), (col + dx2, row + dy2)), room_id, neighbor_room))
+    return walls
 
-def _is_vertical(edge: tuple) -> bool:
-    """Edge is vertical if both endpoints have the same X."""
-    return edge[0][0] == edge[1][0]
 
+def _sweep_runs(runs: list[tuple], horizontal: bool) -> list[tuple]:
+    """Merge sorted ``(fixed, pair_id, start, end, ra, rb)`` runs in one sweep.
 
-def _merge_collinear(wall_edges: list[tuple]) -> list[tuple]:
+    Runs on the same line with the same room pair are unioned while they
+    touch or overlap; a change of line, pair or a gap flushes the current
+    run as a merged edge.
+    """
+    runs.sort(key=itemgetter(0, 1, 2))
+    spans = []  # (fixed, start, end, ra, rb)
+    add = spans.append
+
+    cur_fixed, cur_pair, cur_start, cur_end, cur_ra, cur_rb = runs[0]
+    for fixed, pair_id, start, end, ra, rb in runs[1:]:
+        if fixed == cur_fixed and pair_id == cur_pair and start <= cur_end:
+            if end > cur_end:
+                cur_end = end
+            continue
+        add((cur_fixed, cur_start, cur_end, cur_ra, cur_rb))
+        cur_fixed, cur_pair, cur_start, cur_end, cur_ra, cur_rb = fixed, pair_id, start, end, ra, rb
+    add((cur_fixed, cur_start, cur_end, cur_ra, cur_rb))
+
+    if horizontal:
+        return [(((a, f), (b, f)), ra, rb) for f, a, b, ra, rb in spans]
+    return [(((f, a), (f, b)), ra, rb) for f, a, b, ra, rb in spans]
+
+
+def _merge_collinear(wall_edges: list[tuple]) -> dict[int, tuple]:
     """Merge collinear, contiguous wall segments into longer lines.
 
     Input:  list of (edge, room_a, room_b)
-    Output: list of (merged_edge, room_a, room_b)
+    Output: {seg_id: (merged_edge, room_a, room_b)} with ids 0..n-1, so
+            door cuts can drop and add segments without shifting a list.
     Edges within a merged segment all share the same (room_a, room_b) pair
-    (normalised as a frozenset for matching).
+    (interned to a small int so the sweep compares ints, not frozensets).
     """
-    # Group by orientation + fixed coordinate + room pair
-    h_groups: dict[tuple, list] = {}  # (y, rooms_key) -> [edges]
-    v_groups: dict[tuple, list] = {}  # (x, rooms_key) -> [edges]
+    pair_ids: dict[frozenset, int] = {}
+    h_runs = []  # (y, pair_id, x_start, x_end, ra, rb)
+    v_runs = []  # (x, pair_id, y_start, y_end, ra, rb)
 
     for edge, ra, rb in wall_edges:
-        rooms_key = frozenset([ra, rb])
-        if _is_horizontal(edge):
-            y = edge[0][1]
-            key = (y, rooms_key)
-            h_groups.setdefault(key, []).append((edge, ra, rb))
-        elif _is_vertical(edge):
-            x = edge[0][0]
-            key = (x, rooms_key)
-            v_groups.setdefault(key, []).append((edge, ra, rb))
+        pair_id = pair_ids.setdefault(frozenset((ra, rb)), len(pair_ids))
+        (x1, y1), (x2, y2) = edge
+        if y1 == y2:
+            h_runs.append((y1, pair_id, min(x1, x2), max(x1, x2), ra, rb))
+        elif x1 == x2:
+            v_runs.append((x1, pair_id, min(y1, y2), max(y1, y2), ra, rb))
 
     merged = []
-
-    # Merge horizontal segments
-    for (y, rooms_key), segs in h_groups.items():
-        # Sort by X start
-        intervals = sorted([(min(e[0][0], e[1][0]), max(e[0][0], e[1][0]), ra, rb)
-                             for e, ra, rb in segs])
-        # Merge contiguous
-        cur_start, cur_end, ra, rb = intervals[0]
-        for i in range(1, len(intervals)):
-            s, e, ra2, rb2 = intervals[i]
-            if s <= cur_end:  # contiguous or overlapping
-                cur_end = max(cur_end, e)
-            else:
-                merged.append((((cur_start, y), (cur_end, y)), ra, rb))
-                cur_start, cur_end, ra, rb = s, e, ra2, rb2
-        merged.append((((cur_start, y), (cur_end, y)), ra, rb))
-
-    # Merge vertical segments
-    for (x, rooms_key), segs in v_groups.items():
-        intervals = sorted([(min(e[0][1], e[1][1]), max(e[0][1], e[1][1]), ra, rb)
-                             for e, ra, rb in segs])
-        cur_start, cur_end, ra, rb = intervals[0]
-        for i in range(1, len(intervals)):
-            s, e, ra2, rb2 = intervals[i]
-            if s <= cur_end:
-                cur_end = max(cur_end, e)
-            else:
-                merged.append((((x, cur_start), (x, cur_end)), ra, rb))
-                cur_start, cur_end, ra, rb = s, e, ra2, rb2
-        merged.append((((x, cur_start), (x, cur_end)), ra, rb))
-
-    return merged
-
-
-def _find_shared_wall(
-    walls: list[tuple], room_a: str, room_b: str | None
-) -> list[int]:
-    """Find indices of wall segments between room_a and room_b.
-
-    room_b=None means exterior wall of room_a.
-    """
-    indices = []
-    for i, (edge, ra, rb) in enumerate(walls):
-        pair = {ra, rb}
-        if room_b is None:
-            # Exterior wall: one side is room_a, other side is None
-            if room_a in pair and None in pair:
-                indices.append(i)
-        else:
-            if room_a in pair and room_b in pair:
-                indices.append(i)
-    return indices
+    if h_runs:
+        merged.extend(_sweep_runs(h_runs, horizontal=True))
+    if v_runs:
+        merged.extend(_sweep_runs(v_runs, horizontal=False))
+    return dict(enumerate(merged))
 
 
 def _segment_length(edge: tuple) -> float:
@@ -211,41 +171,61 @@ def _segment_length(edge: tuple) -> float:
     return (dx * dx + dy * dy) ** 0.5
 
 
+def _index_walls(walls: dict[int, tuple]) -> dict[frozenset, list[tuple]]:
+    """Map each room pair to a max-heap of its wall segments.
+
+    Heap entries are ``(-length, seg_id)`` so the longest segment between
+    two rooms is always at the top.  Exterior walls are keyed by
+    ``frozenset({room, None})``.
+    """
+    index: dict[frozenset, list[tuple]] = defaultdict(list)
+    for seg_id, (edge, ra, rb) in walls.items():
+        index[frozenset((ra, rb))].append((-_segment_length(edge), seg_id))
+    for heap in index.values():
+        heapq.heapify(heap)
+    return index
+
+
 def _cut_door(
-    walls: list[tuple],
+    walls: dict[int, tuple],
+    index: dict[frozenset, list[tuple]],
+    name2id: dict[str, int],
     door: dict,
     cell_size: float,
-) -> list[tuple]:
-    """Cut a door opening in the wall list, returning updated wall list.
+    seg_ids: Iterator[int],
+) -> dict[int, tuple]:
+    """Cut a door opening in the wall map, returning the updated wall map.
 
     Door spec: {between: [roomA, roomB|null], position: 0-1, width: cm}
+    Room names are resolved through *name2id*; *index* is patched in place
+    so later doors see the split segments; *seg_ids* supplies fresh ids for
+    the sub-segments.
     """
     between = door.get("between", [])
     if len(between) < 2:
         return walls
 
-    room_a = between[0]
-    room_b = between[1]  # may be None for exterior
+    room_a = name2id.get(between[0])
+    room_b = None if between[1] is None else name2id.get(between[1])  # None = exterior
+    if room_a is None or (room_b is None and between[1] is not None):
+        return walls
     position = door.get("position", 0.5)
     door_width = door.get("width", DOOR_OPENING_WIDTH)
 
     # Convert door width from cm to grid units
     door_grid_width = door_width / cell_size
 
-    # Find shared wall segments
-    shared_indices = _find_shared_wall(walls, room_a, room_b)
-    if not shared_indices:
-        return walls
-
     # Pick the longest shared wall segment for the door
-    best_idx = max(shared_indices, key=lambda i: _segment_length(walls[i][0]))
-    edge, ra, rb = walls[best_idx]
+    shared = index.get(frozenset((room_a, room_b)))
+    if not shared:
+        return walls
+    neg_len, best_id = heapq.heappop(shared)
+    edge, ra, rb = walls.pop(best_id)
 
     # Compute door gap position along the segment
-    seg_len = _segment_length(edge)
+    seg_len = -neg_len
     if door_grid_width >= seg_len:
         # Door wider than wall — remove entire segment
-        walls.pop(best_idx)
         return walls
 
     # Direction vector
@@ -258,21 +238,17 @@ def _cut_door(
     t_start = max(0.0, t_center - half_door)
     t_end = min(1.0, t_center + half_door)
 
-    # Create sub-segments (before gap and after gap)
-    new_segments = []
+    # Replace original segment with sub-segments (before gap and after gap)
     if t_start > 0.001:
-        p1 = edge[0]
         p2 = (edge[0][0] + dx * t_start, edge[0][1] + dy * t_start)
-        new_segments.append(((p1, p2), ra, rb))
+        seg_id = next(seg_ids)
+        walls[seg_id] = ((edge[0], p2), ra, rb)
+        heapq.heappush(shared, (-seg_len * t_start, seg_id))
     if t_end < 0.999:
         p1 = (edge[0][0] + dx * t_end, edge[0][1] + dy * t_end)
-        p2 = edge[1]
-        new_segments.append(((p1, p2), ra, rb))
-
-    # Replace original segment with sub-segments
-    walls.pop(best_idx)
-    for seg in reversed(new_segments):
-        walls.insert(best_idx, seg)
+        seg_id = next(seg_ids)
+        walls[seg_id] = ((p1, edge[1]), ra, rb)
+        heapq.heappush(shared, (-seg_len * (1.0 - t_end), seg_id))
 
     return walls
 
@@ -281,9 +257,12 @@ def _room_centroid(cells: list[list[int]]) -> tuple[float, float]:
     """Centroid of a room's cells in grid coordinates."""
     if not cells:
         return (0.0, 0.0)
-    cx = sum(c[0] + 0.5 for c in cells) / len(cells)
-    cy = sum(c[1] + 0.5 for c in cells) / len(cells)
-    return (cx, cy)
+    sx = sy = 0
+    for c in cells:
+        sx += c[0]
+        sy += c[1]
+    n = len(cells)
+    return (sx / n + 0.5, sy / n + 0.5)
 
 
 def _grid_to_world(
@@ -293,6 +272,37 @@ def _grid_to_world(
     return (origin[0] + gx * cell_size, origin[1] + gy * cell_size)
 
 
+# ---------------------------------------------------------------------------
+# MAXScript templates (filled with str.format_map per wall / label)
+# ---------------------------------------------------------------------------
+
+_WALL_SPLINE_TEMPLATE = (
+    "si = addNewSpline ss\n"
+    "addKnot ss si #corner #line [{x1},{y1},0]\n"
+    "addKnot ss si #corner #line [{x2},{y2},0]"
+)
+
+# One entry of the labelSpecs array: #(nodeName, labelText, position)
+_LABEL_SPEC_TEMPLATE = '#("{name}", "{text}", [{x},{y},{z}])'
+
+_LABEL_LOOP_TEMPLATE = """for spec in labelSpecs do (
+    local txt = Text name:spec[1] text:spec[2] size:{size} pos:spec[3] alignment:2
+    txt.wirecolor = color {r} {g} {b}
+    append created txt
+)"""
+
+# Tail of the bulk-create script: report every created node as JSON.
+_BUILD_RESULT_SCRIPT = r"""local esc = MCP_Server.escapeJsonString
+local out = stringStream ""
+format "{\"organiser\":\"%\",\"walls\":\"%\",\"labels\":[" (esc d.name) (esc ss.name) to:out
+for i = 2 to created.count do (
+    if i > 2 do format "," to:out
+    format "\"%\"" (esc created[i].name) to:out
+)
+format "]}" to:out
+out as string"""
+
+
 # ---------------------------------------------------------------------------
 # MCP Tool
 # ---------------------------------------------------------------------------
@@ -306,6 +316,7 @@ def build_floor_plan(
     options: dict[str, Any] | None = None,
 ) -> str:
     """Build a 2D floor plan from grid-based room definitions."""
+    invalidate_inspect_cache()
     opts = options or {}
     prefix = opts.get("name_prefix", "FP")
     show_labels = opts.get("show_labels", True)
@@ -318,61 +329,58 @@ def build_floor_plan(
     ox, oy, oz = location
 
     # 1. Build occupancy grid
-    grid = _build_occupancy(rooms)
+    grid, id2name = _build_occupancy(rooms)
     if not grid:
-        return json.dumps({"error": "No rooms/cells defined."})
+        return _dumps({"error": "No rooms/cells defined."})
 
     # 2. Extract wall edges
     raw_walls = _extract_wall_edges(grid)
 
-    # 3. Merge collinear segments
+    # 3. Merge collinear segments (keyed by a stable segment id)
     walls = _merge_collinear(raw_walls)
+    seg_ids = count(len(walls))
 
     # 4. Cut door openings
+    index = _index_walls(walls)
+    name2id = {name: i for i, name in enumerate(id2name)}
     for door in doors:
-        walls = _cut_door(walls, door, cell_size)
+        walls = _cut_door(walls, index, name2id, door, cell_size, seg_ids)
 
-    # 5. Convert to world coords and build MAXScript
-    created = []
+    # 5. Convert to world coords and build one MAXScript that creates the
+    #    walls, labels and organiser Dummy and parents them in a single
+    #    round-trip.
+    lines = []
 
     # --- Wall spline ---
-    spline_idx = 1
-    spline_lines = []
-    spline_lines.append(f'ss = SplineShape name:"{safe_string(prefix)}_Walls" pos:[{ox},{oy},{oz}]')
-
-    for edge, ra, rb in walls:
-        (gx1, gy1), (gx2, gy2) = edge
-        wx1, wy1 = _grid_to_world(gx1, gy1, cell_size, location)
-        wx2, wy2 = _grid_to_world(gx2, gy2, cell_size, location)
-        # Positions relative to the SplineShape's pos (which is at origin)
-        rx1, ry1 = wx1 - ox, wy1 - oy
-        rx2, ry2 = wx2 - ox, wy2 - oy
-        spline_lines.append(f"addNewSpline ss")
-        spline_lines.append(f"addKnot ss {spline_idx} #corner #line [{rx1},{ry1},{0}]")
-        spline_lines.append(f"addKnot ss {spline_idx} #corner #line [{rx2},{ry2},{0}]")
-        spline_idx += 1
-
-    spline_lines.append("updateShape ss")
+    lines.append(f'ss = SplineShape name:"{safe_string(prefix)}_Walls" pos:[{ox},{oy},{oz}]')
+
+    # Knots are relative to the SplineShape's pos (which is at origin), so
+    # grid -> local is a plain scale; the origin offset cancels out.
+    for (gx1, gy1), (gx2, gy2) in (edge for edge, _ra, _rb in walls.values()):
+        rx1, ry1 = gx1 * cell_size, gy1 * cell_size
+        rx2, ry2 = gx2 * cell_size, gy2 * cell_size
+        lines.append(_WALL_SPLINE_TEMPLATE.format_map(
+            {"x1": rx1, "y1": ry1, "x2": rx2, "y2": ry2}
+        ))
+
+    lines.append("updateShape ss")
     wr, wg, wb = wall_color
-    spline_lines.append(f"ss.wirecolor = color {wr} {wg} {wb}")
+    lines.append(f"ss.wirecolor = color {wr} {wg} {wb}")
 
     # Optional extrude
     if extrude_height is not None:
-        spline_lines.append(f"addModifier ss (Extrude amount:{extrude_height})")
+        lines.append(f"addModifier ss (Extrude amount:{extrude_height})")
 
     # Optional shell (only if extruded)
     if wall_thickness is not None and extrude_height is not None:
-        spline_lines.append(f"addModifier ss (Shell innerAmount:0 outerAmount:{wall_thickness})")
-
-    spline_lines.append("ss.name")
+        lines.append(f"addModifier ss (Shell innerAmount:0 outerAmount:{wall_thickness})")
 
-    cmd = "(\n" + "\n".join(spline_lines) + "\n)"
-    resp = client.send_command(cmd)
-    wall_name = resp.get("result", f"{prefix}_Walls")
-    created.append(wall_name)
+    lines.append("local created = #(ss)")
 
     # --- Room labels ---
     if show_labels:
+        label_specs = []
+        label_params = {"z": oz}
         for room in rooms:
             rname = room.get("name", "Room")
             cells = room.get("cells", [])
@@ -380,46 +388,46 @@ def build_floor_plan(
                 continue
             gcx, gcy = _room_centroid(cells)
             wx, wy = _grid_to_world(gcx, gcy, cell_size, location)
-            safe = safe_string(f"{prefix}_{rname}")
+            label_params.update(
+                name=safe_string(f"{prefix}_{rname}"), text=safe_string(rname), x=wx, y=wy,
+            )
+            label_specs.append(_LABEL_SPEC_TEMPLATE.format_map(label_params))
+        if label_specs:
             lr, lg, lb = label_color
-            label_cmd = f"""(
-                txt = Text name:"{safe}" text:"{safe_string(rname)}" size:{label_size} pos:[{wx},{wy},{oz}] alignment:2
-                txt.wirecolor = color {lr} {lg} {lb}
-                txt.name
-            )"""
-            resp = client.send_command(label_cmd)
-            label_name = resp.get("result", f"{prefix}_{rname}")
-            created.append(label_name)
+            lines.append("local labelSpecs = #(" + ", ".join(label_specs) + ")")
+            lines.append(_LABEL_LOOP_TEMPLATE.format_map(
+                {"size": label_size, "r": lr, "g": lg, "b": lb}
+            ))
 
     # --- Organiser Dummy ---
-    # Compute bounding box of all grid cells
-    all_cols = [c[0] for c in grid.keys()]
-    all_rows = [c[1] for c in grid.keys()]
+    # Compute bounding box of all grid cells (one unzip, C-level min/max)
+    all_cols, all_rows = zip(*map(_unpack_cell, grid))
     min_col, max_col = min(all_cols), max(all_cols) + 1
     min_row, max_row = min(all_rows), max(all_rows) + 1
 
-    world_min_x = ox + min_col * cell_size
-    world_max_x = ox + max_col * cell_size
-    world_min_y = oy + min_row * cell_size
-    world_max_y = oy + max_row * cell_size
-
-    bbox_cx = (world_min_x + world_max_x) / 2.0
-    bbox_cy = (world_min_y + world_max_y) / 2.0
-    bbox_w = world_max_x - world_min_x
-    bbox_d = world_max_y - world_min_y
+    bbox_cx = ox + (min_col + max_col) * cell_size / 2.0
+    bbox_cy = oy + (min_row + max_row) * cell_size / 2.0
+    bbox_w = (max_col - min_col) * cell_size
+    bbox_d = (max_row - min_row) * cell_size
     bbox_h = extrude_height if extrude_height else 1.0
+    bbox_z = oz + bbox_h / 2.0
 
-    dummy_name = _create_dummy(
-        f"{prefix}_FloorPlan",
-        [bbox_cx, bbox_cy, oz + bbox_h / 2.0],
-        [bbox_w, bbox_d, bbox_h],
+    lines.append(
+        f'local d = Dummy name:"{safe_string(prefix)}_FloorPlan" '
+        f"pos:[{bbox_cx},{bbox_cy},{bbox_z}] boxsize:[{bbox_w},{bbox_d},{bbox_h}]"
     )
-    _parent_objects(created, dummy_name)
+    lines.append(f"d.pivot = [{bbox_cx},{bbox_cy},{bbox_z - bbox_h / 2.0}]")
+    lines.append("for c in created do c.parent = d")
+    lines.append(_BUILD_RESULT_SCRIPT)
+
+    cmd = "(\n" + "\n".join(lines) + "\n)"
+    resp = client.send_command(cmd)
+    created = json.loads(resp.get("result", "{}"))
 
-    return json.dumps({
-        "organiser": dummy_name,
-        "walls": wall_name,
-        "labels": [n for n in created if n != wall_name],
+    return _dumps({
+        "organiser": created.get("organiser", f"{prefix}_FloorPlan"),
+        "walls": created.get("walls", f"{prefix}_Walls"),
+        "labels": created.get("labels", []),
         "wall_segments": len(walls),
         "rooms": len(rooms),
         "doors": len(doors),
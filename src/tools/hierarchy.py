@@ -2,18 +2,43 @@ import json as _json
 
 from ..server import mcp, client
 from ..coerce import StrList
-from src.helpers.maxscript import safe_string
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import safe_string, string_array
+
+
+def _tree_from_rows(rows: str) -> dict | None:
+    """Rebuild the nested hierarchy dict from flat index/parent rows.
+
+    Names arrive JSON-escaped, so a tab or newline inside one cannot split
+    its row.
+    """
+    nodes: dict[str, dict] = {}
+    root = None
+    for line in rows.splitlines():
+        if not line:
+            continue
+        idx, parent, cls, obj_name = line.split("\t", 3)
+        if "\\" in obj_name:
+            obj_name = _json.loads(f'"{obj_name}"')
+        node = {"name": obj_name, "class": cls, "children": []}
+        nodes[idx] = node
+        if parent == "0":
+            root = node
+        else:
+            nodes[parent]["children"].append(node)
+    return root
 
 
 @mcp.tool()
 def set_parent(children: StrList, parent: str = "") -> str:
     """Parent or unparent objects in the 3ds Max scene."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = _json.dumps({"children": children, "parent": parent})
         response = client.send_command(payload, cmd_type="native:set_parent")
         return response.get("result", "")
 
-    child_names = "#(" + ", ".join(f'"{safe_string(n)}"' for n in children) + ")"
+    child_names = string_array(children)
 
     if parent:
         safe_parent = safe_string(parent)
@@ -73,31 +98,36 @@ def get_hierarchy(name: str) -> str:
             pass
 
     # ── MAXScript fallback (TCP) ──────────────────────────────────
+    # MAXScript walks the tree breadth-first and emits one flat
+    # "index<TAB>parent<TAB>class<TAB>name" row per node, with the name
+    # JSON-escaped; the nested JSON is assembled here instead of by string
+    # concatenation inside Max.
     safe = safe_string(name)
     maxscript = f"""(
-        fn buildTree obj = (
-            local childArr = #()
-            for c in obj.children do (
-                append childArr (buildTree c)
-            )
-            local childStr = "["
-            for i = 1 to childArr.count do (
-                if i > 1 do childStr += ","
-                childStr += childArr[i]
-            )
-            childStr += "]"
-            "{{" + \
-                "\\\"name\\\":\\\"" + obj.name + "\\\"," + \
-                "\\\"class\\\":\\\"" + ((classOf obj) as string) + "\\\"," + \
-                "\\\"children\\\":" + childStr + \
-            "}}"
-        )
         local rootObj = getNodeByName "{safe}"
         if rootObj != undefined then (
-            buildTree rootObj
+            local esc = MCP_Server.escapeJsonString
+            local ss = stringStream ""
+            local nodes = #(rootObj)
+            local parents = #(0)
+            local i = 1
+            while i <= nodes.count do (
+                local obj = nodes[i]
+                format "%\\t%\\t%\\t%\\n" i parents[i] ((classOf obj) as string) (esc obj.name) to:ss
+                for c in obj.children do (
+                    append nodes c
+                    append parents i
+                )
+                i += 1
+            )
+            ss as string
         ) else (
             "Object not found: {safe}"
         )
     )"""
     response = client.send_command(maxscript)
-    return response.get("result", "")
+    result = response.get("result", "")
+    if result.startswith("Object not found"):
+        return result
+    tree = _tree_from_rows(result)
+    return _json.dumps(tree) if tree is not None else result
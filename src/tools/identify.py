@@ -4,127 +4,230 @@ import re
 import tempfile
 
 from ..server import mcp, client
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import safe_string
 
 
 COMMS_DIR = os.path.join(tempfile.gettempdir(), "3dsmax-mcp")
 
+# Identification shots are saved as JPEG: far smaller than PNG and cheaper
+# to encode, which matters once per instance group.
+CAPTURE_JPEG_QUALITY = 85
+# Thumbnails only need to be recognisable; 0 keeps full viewport resolution.
+DEFAULT_CAPTURE_WIDTH = 512
+# Characters Windows rejects in file names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
 
 def _sanitize_filename(name: str) -> str:
     """Sanitize an object name for use as a filename."""
-    return re.sub(r'[<>:"/\\|?*]', "_", name)
-
-
-@mcp.tool()
-def isolate_and_capture_selected() -> str:
-    """Capture isolated viewport screenshots of each selected object (resolves to top-level parents)."""
-    capture_dir = os.path.join(COMMS_DIR, "identify").replace("\\", "/")
-
-    maxscript = f"""(
-        makeDir "{capture_dir}" all:true
-
-        selObjs = getCurrentSelection()
-        if selObjs.count == 0 then (
-            "[]"
-        ) else (
-            fn getRootParent obj = (
-                p = obj
-                while p.parent != undefined do p = p.parent
-                p
-            )
+    return _UNSAFE_FILENAME_CHARS.sub("_", name)
+
+
+# isolate_and_capture_selected script; placeholders: capture_dir, max_width,
+# inline_flag, jpeg_quality
+_CAPTURE_TEMPLATE = """(
+    makeDir "{capture_dir}" all:true
+
+    selObjs = getCurrentSelection()
+    if selObjs.count == 0 then (
+        "[]"
+    ) else (
+        fn getRootParent obj = (
+            p = obj
+            while p.parent != undefined do p = p.parent
+            p
+        )
 
-            roots = #()
-            for obj in selObjs do (
-                r = getRootParent obj
-                idx = findItem roots r
-                if idx == 0 do append roots r
-            )
+        roots = #()
+        for obj in selObjs do (
+            r = getRootParent obj
+            idx = findItem roots r
+            if idx == 0 do append roots r
+        )
 
-            fn getDescendants obj = (
-                res = #(obj)
-                for c in obj.children do join res (getDescendants c)
-                res
-            )
+        fn getDescendants obj = (
+            res = #(obj)
+            for c in obj.children do join res (getDescendants c)
+            res
+        )
 
-            -- Group roots by baseObject identity (instances share the same baseObject)
-            instanceGroups = #()   -- array of arrays of root nodes
-            groupBaseObjs = #()    -- parallel array of baseObjects for matching
-            for r in roots do (
-                found = false
-                for g = 1 to groupBaseObjs.count while not found do (
-                    if r.baseObject == groupBaseObjs[g] then (
-                        append instanceGroups[g] r
-                        found = true
-                    )
-                )
-                if not found do (
-                    append groupBaseObjs r.baseObject
-                    append instanceGroups #(r)
+        -- Group roots into instance sets with one native InstanceMgr query
+        -- per ungrouped root; membership is tracked by node handle
+        instanceGroups = #()   -- array of arrays of root nodes
+        rootBits = #{{}}
+        for r in roots do rootBits[r.inode.handle] = true
+        grouped = #{{}}
+        for r in roots where not grouped[r.inode.handle] do (
+            grp = #(r)
+            grouped[r.inode.handle] = true
+            instArr = #()
+            InstanceMgr.GetInstances r &instArr
+            for inst in instArr do (
+                h = inst.inode.handle
+                if rootBits[h] and not grouped[h] do (
+                    append grp inst
+                    grouped[h] = true
                 )
             )
+            append instanceGroups grp
+        )
 
-            -- Remember which objects were already hidden
-            hiddenBefore = for obj in objects where obj.isHidden collect obj
-
-            -- Capture one representative per instance group
-            resultParts = #()
-            for grp in instanceGroups do (
-                rep = grp[1]
-                descendants = getDescendants rep
-
-                -- Hide everything except this object's hierarchy
-                for obj in objects do obj.isHidden = true
+        -- Snapshot visibility once and hide everything once; each group
+        -- then only re-hides the previous hierarchy and shows its own
+        allObjs = objects as array
+        origHidden = for obj in allObjs collect obj.isHidden
+        with redraw off (for obj in allObjs do obj.isHidden = true)
+        prevDescendants = #()
+
+        -- JPEG quality is a global BitmapIO setting; restore it afterwards
+        oldJpegQuality = try (jpeg.getQuality()) catch undefined
+        try (jpeg.setQuality {jpeg_quality}) catch ()
+
+        -- The viewport size is fixed for the whole loop, so one thumbnail
+        -- bitmap is allocated up front and every capture is copied into it
+        viewSize = getViewSize()
+        thumb = undefined
+        if {max_width} > 0 and viewSize.x > {max_width} do
+            thumb = bitmap {max_width} (amax 1 (viewSize.y * {max_width} / viewSize.x))
+
+        -- Capture one representative per instance group, streaming the
+        -- JSON entries straight into a single buffer
+        out = stringStream ""
+        format "[" to:out
+        for gIdx = 1 to instanceGroups.count do (
+            grp = instanceGroups[gIdx]
+            rep = grp[1]
+            descendants = getDescendants rep
+
+            -- Hide everything except this object's hierarchy
+            -- Batch the visibility flips so they cost no repaints of their
+            -- own; redrawViews below is the only refresh per group
+            with redraw off (
+                for d in prevDescendants do d.isHidden = true
                 for d in descendants do d.isHidden = false
-
+                prevDescendants = descendants
                 select descendants
-                max zoomext sel
-                completeredraw()
-
-                safeName = rep.name
-                for badChar in #("<", ">", ":", "/", "\\\\", "|", "?", "*") do (
-                    safeName = substituteString safeName badChar "_"
-                )
-                capturePath = "{capture_dir}/" + safeName + ".png"
-
-                vp = gw.getViewportDib()
+            )
+            max zoomext sel
+            -- Only repaint what was invalidated; a full completeRedraw per
+            -- group also repaints every inactive panel
+            redrawViews()
+
+            safeName = rep.name
+            for badChar in #("<", ">", ":", "/", "\\\\", "|", "?", "*") do (
+                safeName = substituteString safeName badChar "_"
+            )
+            capturePath = "{capture_dir}/" + safeName + ".jpg"
+
+            -- Saves stay synchronous: BitmapIO encodes on the main thread and
+            -- image_b64 reads the finished file straight back
+            vp = gw.getViewportDib()
+            if thumb != undefined then (
+                copy vp thumb
+                thumb.filename = capturePath
+                save thumb
+            ) else (
                 vp.filename = capturePath
                 save vp
-
-                -- Build instances array: ["Name1","Name2",...]
-                instStr = "["
-                for i = 1 to grp.count do (
-                    if i > 1 do instStr += ","
-                    instStr += "\\\"" + (substituteString grp[i].name "\\\\" "\\\\\\\\") + "\\\""
-                )
-                instStr += "]"
-
-                entry = "{{\\\"name\\\":\\\"" + (substituteString rep.name "\\\\" "\\\\\\\\") + "\\\",\\\"image_path\\\":\\\"" + (substituteString capturePath "\\\\" "/") + "\\\",\\\"instances\\\":" + instStr + "}}"
-                append resultParts entry
             )
-
-            -- Restore visibility
-            for obj in objects do obj.isHidden = false
-            for obj in hiddenBefore do (
-                if isValidNode obj do obj.isHidden = true
+            free vp
+
+            if gIdx > 1 do format "," to:out
+            format "%" ("{{\\\"name\\\":\\\"" + (substituteString rep.name "\\\\" "\\\\\\\\") + "\\\",\\\"image_path\\\":\\\"" + (substituteString capturePath "\\\\" "/") + "\\\"") to:out
+            -- Opt-in: inline the encoded file for callers that cannot read capture_dir
+            if {inline_flag} do try (
+                imgBytes = (dotNetClass "System.IO.File").ReadAllBytes capturePath
+                format ",\\\"image_b64\\\":\\\"%\\\"" ((dotNetClass "System.Convert").ToBase64String imgBytes) to:out
+            ) catch ()
+            format ",\\\"instances\\\":[" to:out
+            for i = 1 to grp.count do (
+                if i > 1 do format "," to:out
+                format "%" ("\\\"" + (substituteString grp[i].name "\\\\" "\\\\\\\\") + "\\\"") to:out
             )
+            format "]}}" to:out
+        )
+        format "]" to:out
 
-            select selObjs
+        if thumb != undefined do free thumb
+        if oldJpegQuality != undefined do try (jpeg.setQuality oldJpegQuality) catch ()
 
-            outStr = "["
-            for i = 1 to resultParts.count do (
-                if i > 1 do outStr += ","
-                outStr += resultParts[i]
+        -- Restore visibility from the snapshot
+        with redraw off (
+            for i = 1 to allObjs.count do (
+                if isValidNode allObjs[i] do allObjs[i].isHidden = origHidden[i]
             )
-            outStr += "]"
-            outStr
+            select selObjs
         )
-    )"""
+        completeRedraw()
+        out as string
+    )
+)"""
+
+
+@mcp.tool()
+def isolate_and_capture_selected(
+    max_width: int = DEFAULT_CAPTURE_WIDTH,
+    inline_images: bool = False,
+) -> str:
+    """Capture isolated viewport screenshots of each selected object (resolves to top-level parents).
+
+    Each group reports its image_path. inline_images=True also embeds the
+    JPEG as base64 (image_b64), for callers that cannot read the capture
+    folder; it adds tens of KB of text per group.
+    """
+    capture_dir = os.path.join(COMMS_DIR, "identify").replace("\\", "/")
+    max_width = max(0, int(max_width))
+    inline_flag = "true" if inline_images else "false"
+
+    maxscript = _CAPTURE_TEMPLATE.format(
+        capture_dir=capture_dir,
+        max_width=max_width,
+        inline_flag=inline_flag,
+        jpeg_quality=CAPTURE_JPEG_QUALITY,
+    )
     response = client.send_command(maxscript)
     return response.get("result", "[]")
 
 
+# batch_rename_objects fallback; placeholders: old_names, new_names
+_BATCH_RENAME_TEMPLATE = """(
+    -- One scene pass: lower-cased name -> handle of the first node with
+    -- that name, matching getNodeByName's case-insensitive lookup
+    nodeIdx = dotNetObject "System.Collections.Hashtable"
+    for o in objects do (
+        k = toLower o.name
+        if nodeIdx.Item[k] == undefined do nodeIdx.Item[k] = o.inode.handle
+    )
+
+    oldNames = #({old_names})
+    newNames = #({new_names})
+    targets = for n in oldNames collect (
+        h = nodeIdx.Item[toLower n]
+        if h == undefined then undefined else maxOps.getNodeByHandle h
+    )
+
+    renamed = #()
+    notFound = #()
+    for i = 1 to oldNames.count do (
+        obj = targets[i]
+        if obj != undefined then (
+            obj.name = newNames[i]
+            append renamed (oldNames[i] + " -> " + newNames[i])
+        ) else (
+            append notFound oldNames[i]
+        )
+    )
+    msg = "Renamed: " + (renamed.count as string)
+    if notFound.count > 0 do msg += " | Not found: " + (notFound as string)
+    msg
+)"""
+
+
 @mcp.tool()
 def batch_rename_objects(renames_json: str) -> str:
     """Rename multiple objects in a single batch operation."""
+    invalidate_inspect_cache()
     renames = json.loads(renames_json)
 
     if client.native_available:
@@ -132,29 +235,15 @@ def batch_rename_objects(renames_json: str) -> str:
         response = client.send_command(payload, cmd_type="native:batch_rename_objects")
         return response.get("result", "")
 
-    parts = []
-    for r in renames:
-        old = r["old_name"].replace("\\", "\\\\").replace('"', '\\"')
-        new = r["new_name"].replace("\\", "\\\\").replace('"', '\\"')
-        parts.append(
-            f'obj = getNodeByName "{old}"\n'
-            f'if obj != undefined then (\n'
-            f'    obj.name = "{new}"\n'
-            f'    append renamed "{old} -> {new}"\n'
-            f') else (\n'
-            f'    append notFound "{old}"\n'
-            f')'
-        )
+    old_names = [f'"{safe_string(r["old_name"])}"' for r in renames]
+    new_names = [f'"{safe_string(r["new_name"])}"' for r in renames]
 
-    rename_block = "\n".join(parts)
-    maxscript = f"""(
-        renamed = #()
-        notFound = #()
-        {rename_block}
-        msg = "Renamed: " + (renamed.count as string)
-        if notFound.count > 0 do msg += " | Not found: " + (notFound as string)
-        msg
-    )"""
+    # Every old name is resolved against the scene as it was before the batch,
+    # so chains such as A -> B, B -> C rename both original nodes instead of
+    # B -> C catching the node that was just renamed to B.
+    maxscript = _BATCH_RENAME_TEMPLATE.format(
+        old_names=", ".join(old_names), new_names=", ".join(new_names),
+    )
 
     response = client.send_command(maxscript)
     return response.get("result", "")
@@ -6,13 +6,147 @@ InstanceMgr for instance awareness.
 """
 
 import json as _json
+import re
 from ..server import mcp, client
-from src.helpers.maxscript import safe_string
+from ..coerce import StrList
+from src.helpers.inspect_cache import cached_inspect, invalidate_inspect_cache, peek_inspect, store_inspect
+from src.helpers.maxscript import safe_string, string_array
+
+# ``  .name (UI Name) : type`` lines from showProperties
+_SHOW_PROPERTY_RE = re.compile(r"^[ \t]*\.(\w+)[^:\n]*:[ \t]*(.*?)[ \t]*\r?$", re.M)
+
+
+# Per-node JSON writer shared by inspect_object and inspect_objects; expects
+# ``obj`` (a valid node), ``out`` (a stringStream) and ``esc`` (the JSON string
+# escaper) in scope
+_INSPECT_NODE_SCRIPT = """(
+    format "{\\n" to:out
+
+    -- Basic info
+    format "%" ("  \\\"name\\\": \\\"" + (esc obj.name) + "\\\",\\n") to:out
+    format "%" ("  \\\"class\\\": \\\"" + ((classOf obj) as string) + "\\\",\\n") to:out
+    format "%" ("  \\\"superclass\\\": \\\"" + ((superClassOf obj) as string) + "\\\",\\n") to:out
+    format "%" ("  \\\"baseObject\\\": \\\"" + ((classOf obj.baseobject) as string) + "\\\",\\n") to:out
+
+    -- Transform
+    format "%" ("  \\\"position\\\": [" + (obj.pos.x as string) + "," + (obj.pos.y as string) + "," + (obj.pos.z as string) + "],\\n") to:out
+    format "%" ("  \\\"rotation\\\": [" + (obj.rotation.x as string) + "," + (obj.rotation.y as string) + "," + (obj.rotation.z as string) + "],\\n") to:out
+    format "%" ("  \\\"scale\\\": [" + (obj.scale.x as string) + "," + (obj.scale.y as string) + "," + (obj.scale.z as string) + "],\\n") to:out
+
+    -- Hierarchy
+    local parentName = if obj.parent != undefined then (esc obj.parent.name) else "null"
+    format "%" ("  \\\"parent\\\": \\\"" + parentName + "\\\",\\n") to:out
+    local childNames = for c in obj.children collect (esc c.name)
+    format "  \\\"children\\\": [" to:out
+    for i = 1 to childNames.count do (
+        if i > 1 do format "," to:out
+        format "%" ("\\\"" + childNames[i] + "\\\"") to:out
+    )
+    format "],\\n" to:out
+
+    -- Visibility & render flags
+    format "%" ("  \\\"isHidden\\\": " + (if obj.isHidden then "true" else "false") + ",\\n") to:out
+    format "%" ("  \\\"isFrozen\\\": " + (if obj.isFrozen then "true" else "false") + ",\\n") to:out
+    format "%" ("  \\\"renderable\\\": " + (if obj.renderable then "true" else "false") + ",\\n") to:out
+    try (format "%" ("  \\\"primaryVisibility\\\": " + (if obj.primaryVisibility then "true" else "false") + ",\\n") to:out) catch ()
+    try (format "%" ("  \\\"secondaryVisibility\\\": " + (if obj.secondaryVisibility then "true" else "false") + ",\\n") to:out) catch ()
+    try (format "%" ("  \\\"receiveShadows\\\": " + (if obj.receiveshadows then "true" else "false") + ",\\n") to:out) catch ()
+    try (format "%" ("  \\\"castShadows\\\": " + (if obj.castshadows then "true" else "false") + ",\\n") to:out) catch ()
+
+    -- Layer
+    format "%" ("  \\\"layer\\\": \\\"" + (esc obj.layer.name) + "\\\",\\n") to:out
+
+    -- Wire color
+    format "%" ("  \\\"wirecolor\\\": [" + (obj.wirecolor.r as string) + "," + (obj.wirecolor.g as string) + "," + (obj.wirecolor.b as string) + "],\\n") to:out
+
+    -- Instance detection
+    local isInst = InstanceMgr.CanMakeObjectsUnique obj
+    local instCount = 0
+    if isInst do (
+        local instArr = #()
+        InstanceMgr.GetInstances obj &instArr
+        instCount = instArr.count
+    )
+    format "%" ("  \\\"isInstanced\\\": " + (if isInst then "true" else "false") + ",\\n") to:out
+    format "%" ("  \\\"instanceCount\\\": " + (instCount as string) + ",\\n") to:out
+
+    -- Mesh info (if applicable). Read counts straight off editable meshes and
+    -- the node's evaluated TriMesh; only snapshot when neither applies
+    local meshCounts = undefined
+    try (
+        if obj.modifiers.count == 0 and classOf obj == Editable_mesh then
+            meshCounts = #(obj.numfaces, obj.numverts)
+        else if superClassOf obj == GeometryClass do
+            meshCounts = getTriMeshFaceCount obj
+    ) catch ()
+    if meshCounts == undefined do try (
+        local m = snapshotAsMesh obj
+        meshCounts = #(m.numFaces, m.numVerts)
+        delete m
+    ) catch ()
+    if meshCounts != undefined then (
+        format "%" ("  \\\"numVerts\\\": " + (meshCounts[2] as string) + ",\\n") to:out
+        format "%" ("  \\\"numFaces\\\": " + (meshCounts[1] as string) + ",\\n") to:out
+    ) else (
+        format "  \\\"numVerts\\\": null,\\n" to:out
+        format "  \\\"numFaces\\\": null,\\n" to:out
+    )
+
+    -- Bounding box
+    local bbMin = obj.min
+    local bbMax = obj.max
+    local dims = bbMax - bbMin
+    format "%" ("  \\\"boundingBox\\\": {\\\"min\\\": [" + (bbMin.x as string) + "," + (bbMin.y as string) + "," + (bbMin.z as string) + "], \\\"max\\\": [" + (bbMax.x as string) + "," + (bbMax.y as string) + "," + (bbMax.z as string) + "], \\\"dimensions\\\": [" + (dims.x as string) + "," + (dims.y as string) + "," + (dims.z as string) + "]},\\n") to:out
+
+    -- Modifiers with enable state
+    format "  \\\"modifiers\\\": [" to:out
+    for i = 1 to obj.modifiers.count do (
+        if i > 1 do format "," to:out
+        local mod = obj.modifiers[i]
+        format "%" ("{\\\"name\\\": \\\"" + (esc mod.name) + "\\\", \\\"class\\\": \\\"" + ((classOf mod) as string) + "\\\"") to:out
+        format "%" (", \\\"enabled\\\": " + (if mod.enabled then "true" else "false")) to:out
+        format "%" (", \\\"enabledInViews\\\": " + (if mod.enabledInViews then "true" else "false")) to:out
+        format "%" (", \\\"enabledInRenders\\\": " + (if mod.enabledInRenders then "true" else "false")) to:out
+        format "}" to:out
+    )
+    format "],\\n" to:out
+
+    -- Material
+    if obj.material != undefined then (
+        format "%" ("  \\\"material\\\": {\\\"name\\\": \\\"" + (esc obj.material.name) + "\\\", \\\"class\\\": \\\"" + ((classOf obj.material) as string) + "\\\"}\\n") to:out
+    ) else (
+        format "  \\\"material\\\": null\\n" to:out
+    )
+
+    format "}" to:out
+)"""
+
+
+# inspect_object fallback; placeholders: safe, node_script
+_INSPECT_OBJECT_TEMPLATE = """(
+    local obj = getNodeByName "{safe}"
+    if obj == undefined then (
+        "Object not found: {safe}"
+    ) else (
+        local esc = MCP_Server.escapeJsonString
+        local out = stringStream ""
+        {node_script}
+        out as string
+    )
+)"""
+
+
+def _inspect_object_key(name: str) -> tuple:
+    return ("inspect_object", name, None, None)
 
 
 @mcp.tool()
 def inspect_object(name: str) -> str:
     """Get comprehensive properties of an object for exploration."""
+    return cached_inspect(_inspect_object_key(name), lambda: _inspect_object(name))
+
+
+def _inspect_object(name: str) -> str:
     if client.native_available:
         try:
             payload = _json.dumps({"name": name})
@@ -22,104 +156,186 @@ def inspect_object(name: str) -> str:
             pass
 
     safe = safe_string(name)
-    maxscript = f"""(
-        local obj = getNodeByName "{safe}"
+    maxscript = _INSPECT_OBJECT_TEMPLATE.format(safe=safe, node_script=_INSPECT_NODE_SCRIPT)
+    response = client.send_command(maxscript)
+    return response.get("result", "")
+
+
+# inspect_objects batch; placeholders: name_array, node_script
+_INSPECT_OBJECTS_TEMPLATE = """(
+    local esc = MCP_Server.escapeJsonString
+    local nameList = {name_array}
+    local out = stringStream ""
+    format "[" to:out
+    for i = 1 to nameList.count do (
+        if i > 1 do format "," to:out
+        local obj = getNodeByName nameList[i]
         if obj == undefined then (
-            "Object not found: {safe}"
-        ) else (
-            local result = "{{\\n"
-
-            -- Basic info
-            result += "  \\\"name\\\": \\\"" + obj.name + "\\\",\\n"
-            result += "  \\\"class\\\": \\\"" + ((classOf obj) as string) + "\\\",\\n"
-            result += "  \\\"superclass\\\": \\\"" + ((superClassOf obj) as string) + "\\\",\\n"
-            result += "  \\\"baseObject\\\": \\\"" + ((classOf obj.baseobject) as string) + "\\\",\\n"
-
-            -- Transform
-            result += "  \\\"position\\\": [" + (obj.pos.x as string) + "," + (obj.pos.y as string) + "," + (obj.pos.z as string) + "],\\n"
-            result += "  \\\"rotation\\\": [" + (obj.rotation.x as string) + "," + (obj.rotation.y as string) + "," + (obj.rotation.z as string) + "],\\n"
-            result += "  \\\"scale\\\": [" + (obj.scale.x as string) + "," + (obj.scale.y as string) + "," + (obj.scale.z as string) + "],\\n"
-
-            -- Hierarchy
-            local parentName = if obj.parent != undefined then obj.parent.name else "null"
-            result += "  \\\"parent\\\": \\\"" + parentName + "\\\",\\n"
-            local childNames = for c in obj.children collect c.name
-            result += "  \\\"children\\\": ["
-            for i = 1 to childNames.count do (
-                if i > 1 do result += ","
-                result += "\\\"" + childNames[i] + "\\\""
-            )
-            result += "],\\n"
-
-            -- Visibility & render flags
-            result += "  \\\"isHidden\\\": " + (if obj.isHidden then "true" else "false") + ",\\n"
-            result += "  \\\"isFrozen\\\": " + (if obj.isFrozen then "true" else "false") + ",\\n"
-            result += "  \\\"renderable\\\": " + (if obj.renderable then "true" else "false") + ",\\n"
-            try (result += "  \\\"primaryVisibility\\\": " + (if obj.primaryVisibility then "true" else "false") + ",\\n") catch ()
-            try (result += "  \\\"secondaryVisibility\\\": " + (if obj.secondaryVisibility then "true" else "false") + ",\\n") catch ()
-            try (result += "  \\\"receiveShadows\\\": " + (if obj.receiveshadows then "true" else "false") + ",\\n") catch ()
-            try (result += "  \\\"castShadows\\\": " + (if obj.castshadows then "true" else "false") + ",\\n") catch ()
-
-            -- Layer
-            result += "  \\\"layer\\\": \\\"" + obj.layer.name + "\\\",\\n"
-
-            -- Wire color
-            result += "  \\\"wirecolor\\\": [" + (obj.wirecolor.r as string) + "," + (obj.wirecolor.g as string) + "," + (obj.wirecolor.b as string) + "],\\n"
-
-            -- Instance detection
-            local isInst = InstanceMgr.CanMakeObjectsUnique obj
-            local instCount = 0
-            if isInst do (
-                local instArr = #()
-                InstanceMgr.GetInstances obj &instArr
-                instCount = instArr.count
-            )
-            result += "  \\\"isInstanced\\\": " + (if isInst then "true" else "false") + ",\\n"
-            result += "  \\\"instanceCount\\\": " + (instCount as string) + ",\\n"
+            format "{{\\\"name\\\": \\\"%\\\", \\\"error\\\": \\\"Object not found\\\"}}" (esc nameList[i]) to:out
+        ) else {node_script}
+    )
+    format "]" to:out
+    out as string
+)"""
 
-            -- Mesh info (if applicable)
-            try (
-                local m = snapshotAsMesh obj
-                result += "  \\\"numVerts\\\": " + (m.numVerts as string) + ",\\n"
-                result += "  \\\"numFaces\\\": " + (m.numFaces as string) + ",\\n"
-                delete m
-            ) catch (
-                result += "  \\\"numVerts\\\": null,\\n"
-                result += "  \\\"numFaces\\\": null,\\n"
-            )
 
-            -- Bounding box
-            local bbMin = obj.min
-            local bbMax = obj.max
-            local dims = bbMax - bbMin
-            result += "  \\\"boundingBox\\\": {{\\\"min\\\": [" + (bbMin.x as string) + "," + (bbMin.y as string) + "," + (bbMin.z as string) + "], \\\"max\\\": [" + (bbMax.x as string) + "," + (bbMax.y as string) + "," + (bbMax.z as string) + "], \\\"dimensions\\\": [" + (dims.x as string) + "," + (dims.y as string) + "," + (dims.z as string) + "]}},\\n"
-
-            -- Modifiers with enable state
-            result += "  \\\"modifiers\\\": ["
-            for i = 1 to obj.modifiers.count do (
-                if i > 1 do result += ","
-                local mod = obj.modifiers[i]
-                result += "{{\\\"name\\\": \\\"" + mod.name + "\\\", \\\"class\\\": \\\"" + ((classOf mod) as string) + "\\\""
-                result += ", \\\"enabled\\\": " + (if mod.enabled then "true" else "false")
-                result += ", \\\"enabledInViews\\\": " + (if mod.enabledInViews then "true" else "false")
-                result += ", \\\"enabledInRenders\\\": " + (if mod.enabledInRenders then "true" else "false")
-                result += "}}"
-            )
-            result += "],\\n"
+def _array_entry(name: str, result: str) -> str:
+    """An inspect_object result as an inspect_objects array element."""
+    if result.startswith("{"):
+        return result
+    error = "Object not found" if result.startswith("Object not found") else result
+    return _json.dumps({"name": name, "error": error})
 
-            -- Material
-            if obj.material != undefined then (
-                result += "  \\\"material\\\": {{\\\"name\\\": \\\"" + obj.material.name + "\\\", \\\"class\\\": \\\"" + ((classOf obj.material) as string) + "\\\"}}\\n"
-            ) else (
-                result += "  \\\"material\\\": null\\n"
+
+@mcp.tool()
+def inspect_objects(names: StrList) -> str:
+    """Inspect several objects; returns a JSON array of inspect_object results.
+
+    Shares inspect_object's cache. With the native bridge each uncached name
+    goes through inspect_object; otherwise they are fetched in one round trip.
+    """
+    if not names:
+        return "[]"
+
+    results = {}
+    for name in names:
+        hit = peek_inspect(_inspect_object_key(name))
+        if hit is not None:
+            results[name] = hit
+    missing = [name for name in dict.fromkeys(names) if name not in results]
+
+    if client.native_available:
+        for name in missing:
+            results[name] = inspect_object(name)
+    elif missing:
+        name_array = string_array(missing)
+        maxscript = _INSPECT_OBJECTS_TEMPLATE.format(name_array=name_array, node_script=_INSPECT_NODE_SCRIPT)
+        response = client.send_command(maxscript, timeout=30.0)
+        raw = response.get("result", "")
+        try:
+            entries = _json.loads(raw)
+        except ValueError:
+            entries = None
+        if isinstance(entries, list) and len(entries) == len(missing):
+            for name, entry in zip(missing, entries):
+                result = _json.dumps(entry)
+                results[name] = result
+                store_inspect(_inspect_object_key(name), result)
+        else:
+            # A script error or a short array: report it per name, cache nothing
+            error = raw if not isinstance(entries, list) else (
+                f"Expected {len(missing)} results, got {len(entries)}"
             )
+            for name in missing:
+                results[name] = _json.dumps({"name": name, "error": error})
+
+    return "[" + ",".join(_array_entry(name, results[name]) for name in names) + "]"
+
+
+def _declared_types(dump: str) -> dict[str, str]:
+    """Map lower-cased property names to declared types from a showProperties dump.
+
+    Lines look like ``  .radius (Radius) : worldUnits``; the first entry for a
+    name wins.
+    """
+    types: dict[str, str] = {}
+    for prop_name, declared in _SHOW_PROPERTY_RE.findall(dump):
+        types.setdefault(prop_name.lower(), declared)
+    return types
+
+
+def _properties_json(target: str, raw: str) -> str:
+    """Shape the fallback's compact ``[class, count, rows, typeDump]`` result into the tool's JSON.
+
+    Error objects and anything else that is not a row array pass through.
+    """
+    if not raw.startswith("["):
+        return raw
+    cls, prop_count, rows, type_dump = _json.loads(raw)
+    declared_types = _declared_types(type_dump)
+    properties = []
+    for prop_name, value, runtime_type in rows:
+        entry = {"name": prop_name, "value": value, "runtimeType": runtime_type}
+        declared_type = declared_types.get(prop_name.lower())
+        if declared_type:
+            entry["declaredType"] = declared_type
+        properties.append(entry)
+    return _json.dumps({
+        "target": target,
+        "class": cls,
+        "propertyCount": prop_count,
+        "properties": properties,
+    })
+
+
+# inspect_properties fallback; placeholders: safe, target, target_expr. The
+# property blacklist holds known crashers from extensive testing.
+_INSPECT_PROPERTIES_TEMPLATE = """(
+    local obj = getNodeByName "{safe}"
+    if obj == undefined then (
+        "{{\\\"error\\\": \\\"Object not found: {safe}\\\"}}"
+    ) else (
+        local tgt = {target_expr}
+        if tgt == undefined then (
+            "{{\\\"error\\\": \\\"Target '{target}' is undefined on {safe}\\\"}}"
+        ) else (
+            -- Hashtable set keeps the per-property blacklist check O(1)
+            local blSet = dotNetObject "System.Collections.Hashtable"
+            for n in #(#adTextureLock, #notused, #thelist, #geometryOrientationLookAtNode, #target_distance) do blSet.Item[toLower (n as string)] = true
+            -- getpropnames can repeat names on some plugin classes; keep the
+            -- first of each in one hashed pass
+            local propNames = #()
+            local seen = dotNetObject "System.Collections.Hashtable"
+            try (
+                for p in (getpropnames tgt) do (
+                    local k = toLower (p as string)
+                    if seen.Item[k] == undefined do (
+                        seen.Item[k] = true
+                        append propNames p
+                    )
+                )
+            ) catch ()
 
-            result += "}}"
-            result
+            -- Raw showProperties dump; declared types are parsed in Python
+            local typeDump = ""
+            try (
+                local ss = stringstream ""
+                showproperties tgt to:ss
+                typeDump = ss as string
+            ) catch ()
+
+            -- Emit [class, count, [[name, value, runtimeType], ...], typeDump];
+            -- the JSON object itself is assembled on the Python side
+            local esc = MCP_Server.escapeJsonString
+            local out = stringStream ""
+            format "[\\\"%\\\",%,[" (esc ((classof tgt) as string)) propNames.count to:out
+            local first = true
+            for pIdx = 1 to propNames.count do (
+                local p = propNames[pIdx]
+                local pKey = toLower (p as string)
+                if blSet.Item[pKey] != undefined do continue
+                local val = undefined
+                local valStr = "null"
+                local rtType = "undefined"
+                local skip = false
+                try (
+                    val = getproperty tgt p
+                    valStr = val as string
+                    rtType = (classof val) as string
+                    -- Truncate long value strings
+                    if valStr.count > 200 do valStr = (substring valStr 1 200) + "..."
+                ) catch (skip = true)
+                if not skip do (
+                    if not first do format "," to:out
+                    first = false
+                    format "[\\\"%\\\",\\\"%\\\",\\\"%\\\"]" (esc (p as string)) (esc valStr) (esc rtType) to:out
+                )
+            )
+            format "],\\\"%\\\"]" (esc typeDump) to:out
+            out as string
         )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+    )
+)"""
 
 
 @mcp.tool()
@@ -129,6 +345,13 @@ def inspect_properties(
     modifier_index: int = 0,
 ) -> str:
     """Deep-inspect all properties of an object, modifier, base object, or material."""
+    return cached_inspect(
+        ("inspect_properties", name, target, modifier_index),
+        lambda: _inspect_properties(name, target, modifier_index),
+    )
+
+
+def _inspect_properties(name: str, target: str, modifier_index: int) -> str:
     if client.native_available:
         try:
             payload = {"name": name, "target": target, "modifier_index": modifier_index}
@@ -149,88 +372,9 @@ def inspect_properties(
     else:
         target_expr = "obj"
 
-    # Property blacklist — known crashers from extensive testing
-    blacklist = "#(#adTextureLock, #notused, #thelist, #geometryOrientationLookAtNode, #target_distance)"
-
-    maxscript = f"""(
-        local obj = getNodeByName "{safe}"
-        if obj == undefined then (
-            "{{\\\"error\\\": \\\"Object not found: {safe}\\\"}}"
-        ) else (
-            local tgt = {target_expr}
-            if tgt == undefined then (
-                "{{\\\"error\\\": \\\"Target '{target}' is undefined on {safe}\\\"}}"
-            ) else (
-                local blacklist = {blacklist}
-                local propNames = #()
-                try (propNames = makeuniquearray (getpropnames tgt)) catch ()
-
-                -- Build declared-type lookup from showProperties
-                local typeMap = #()
-                local typeNames = #()
-                try (
-                    local ss = stringstream ""
-                    showproperties tgt to:ss
-                    seek ss 0
-                    while not (eof ss) do (
-                        local myline = readline ss
-                        -- Remove parenthesized annotations
-                        local pstart = findstring myline "("
-                        local pend = findstring myline ")"
-                        if pstart != undefined and pend != undefined do
-                            myline = replace myline pstart (pend - pstart + 1) ""
-                        local parts = filterstring myline ".: "
-                        if parts.count >= 2 do (
-                            append typeNames (toLower parts[1])
-                            append typeMap (trimleft (filterstring myline ":")[2])
-                        )
-                    )
-                ) catch ()
-
-                local result = "{{\\\"target\\\": \\\"" + ("{target}") + "\\\", \\\"class\\\": \\\"" + ((classof tgt) as string) + "\\\", \\\"propertyCount\\\": " + (propNames.count as string) + ", \\\"properties\\\": ["
-                local first = true
-                for pIdx = 1 to propNames.count do (
-                    local p = propNames[pIdx]
-                    if (finditem blacklist p) != 0 do continue
-                    local val = undefined
-                    local valStr = "null"
-                    local rtType = "undefined"
-                    local skip = false
-                    try (
-                        val = getproperty tgt p
-                        valStr = val as string
-                        rtType = (classof val) as string
-                        -- Truncate long value strings
-                        if valStr.count > 200 do valStr = (substring valStr 1 200) + "..."
-                        -- Escape quotes in value
-                        valStr = substituteString valStr "\\"" "'"
-                        valStr = substituteString valStr "\\n" " "
-                        valStr = substituteString valStr "\\r" ""
-                    ) catch (skip = true)
-                    if not skip do (
-                        if not first do result += ","
-                        first = false
-                        -- Look up declared type
-                        local declType = ""
-                        local lookupKey = toLower (p as string)
-                        local tIdx = finditem typeNames lookupKey
-                        if tIdx != 0 do declType = typeMap[tIdx]
-
-                        result += "{{\\\"name\\\": \\\"" + (p as string) + "\\\""
-                        result += ", \\\"value\\\": \\\"" + valStr + "\\\""
-                        result += ", \\\"runtimeType\\\": \\\"" + rtType + "\\\""
-                        if declType != "" do
-                            result += ", \\\"declaredType\\\": \\\"" + declType + "\\\""
-                        result += "}}"
-                    )
-                )
-                result += "]}}"
-                result
-            )
-        )
-    )"""
+    maxscript = _INSPECT_PROPERTIES_TEMPLATE.format(safe=safe, target=target, target_expr=target_expr)
     response = client.send_command(maxscript, timeout=30.0)
-    return response.get("result", "")
+    return _properties_json(target, response.get("result", ""))
 
 
 @mcp.tool()
@@ -239,6 +383,13 @@ def inspect_modifier_properties(name: str, modifier_index: int) -> str:
     return inspect_properties(name, target="modifier", modifier_index=modifier_index)
 
 
+@mcp.tool()
+def flush_inspect_cache() -> str:
+    """Discard cached inspect_object/inspect_properties/get_materials results."""
+    count = invalidate_inspect_cache()
+    return f"Flushed {count} cached inspection result(s)"
+
+
 @mcp.tool()
 def introspect_osl(
     class_name: str = "",
@@ -9,12 +9,23 @@ and any MAXScript-creatable class.
 """
 
 import json
+import os
 import re
+import tempfile
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 from ..server import mcp, client
-from ..coerce import StrList
-from src.helpers.maxscript import safe_string, safe_value
+from ..coerce import DictList, StrList
+from .identify import _sanitize_filename
+from .modifiers import _add_modifier_maxscript, _send_or_queue
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import (
+    builder_block, minify_maxscript, results_array_script, safe_name, safe_string, safe_value, string_array,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -26,62 +37,64 @@ _IMAGE_EXTENSIONS = {
     ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr",
     ".tga", ".hdr", ".bmp", ".dds", ".tx",
 }
+_IMAGE_SUFFIXES = tuple(sorted(_IMAGE_EXTENSIONS))
 
 # Channel patterns are priority-ordered. They intentionally cover verbose,
 # short-form, and single-letter token styles used by common texture libraries.
-_DEFAULT_CHANNEL_PATTERNS: dict[str, list[str]] = {
-    "diffuse":       [
+# Frozen: every call shares them, and they key the match caches.
+_DEFAULT_CHANNEL_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "diffuse":       (
         "_basecolor", "_base_color", "basecolor", "base color", "_albedo", "albedo",
         "_diffuse", "diffuse", "_diff", "diff", "_color", "color", "_col", "col",
         "_rgb", "rgb", "_clr", "clr", "_alb", "alb", "_dif", "dif", "_d",
-    ],
-    "orm":           [
+    ),
+    "orm":           (
         "_occlusionroughnessmetallic", "occlusion roughness metallic",
         "_ambientocclusionroughnessmetallic", "ambient occlusion roughness metallic",
         "_orm", "orm", "_arm", "arm",
-    ],
-    "ao":            [
+    ),
+    "ao":            (
         "_ambientocclusion", "ambient occlusion", "_ambient_occlusion",
         "_occlusion", "occlusion", "_amb_occ", "amb occ", "_ao", "ao",
-    ],
-    "roughness":     ["_roughness", "roughness", "_rough", "rough", "_rgh", "rgh", "_r"],
-    "glossiness":    [
+    ),
+    "roughness":     ("_roughness", "roughness", "_rough", "rough", "_rgh", "rgh", "_r"),
+    "glossiness":    (
         "_glossiness", "glossiness", "_smoothness", "smoothness", "_gloss", "gloss",
         "_smooth", "smooth", "_gls", "gls", "_g",
-    ],
-    "metallic":      [
+    ),
+    "metallic":      (
         "_metallic", "metallic", "_metalness", "metalness", "_metal", "metal",
         "_met", "met", "_mtl", "mtl", "_m",
-    ],
-    "normal":        [
+    ),
+    "normal":        (
         "_normalgl", "normalgl", "normal gl", "_normaldx", "normaldx", "normal dx",
         "_normal", "normal", "_norm", "norm", "_nrm", "nrm", "_nor", "nor", "_n",
-    ],
-    "displacement":  [
+    ),
+    "displacement":  (
         "_displacement", "displacement", "_displace", "displace", "_height", "height",
         "_depth", "depth", "_hght", "hght", "_hgt", "hgt", "_disp", "disp", "_dis", "dis", "_h",
-    ],
-    "bump":          ["_bump", "bump", "_bmp", "bmp", "_b"],
-    "opacity":       [
+    ),
+    "bump":          ("_bump", "bump", "_bmp", "bmp", "_b"),
+    "opacity":       (
         "_opacity", "opacity", "_alpha", "alpha", "_alphamasked", "alphamasked",
         "_opa", "opa", "_alph", "alph", "_o",
-    ],
-    "emission":      [
+    ),
+    "emission":      (
         "_emissive", "emissive", "_emission", "emission", "_emisive", "emisive",
         "_illumination", "illumination", "_illum", "illum", "_emit", "emit",
         "_light", "light", "_emi", "emi", "_ill", "ill", "_lght", "lght", "_e",
-    ],
-    "translucency":  [
+    ),
+    "translucency":  (
         "_translucency", "translucency", "_translucent", "translucent",
         "_transmission", "transmission", "_transparency", "transparency",
         "_transparancy", "transparancy", "_trans", "trans", "_trns", "trns", "_t",
-    ],
-    "ior":           ["_ior", "ior", "_i"],
-    "specular":      [
+    ),
+    "ior":           ("_ior", "ior", "_i"),
+    "specular":      (
         "_specular", "specular", "_spec", "spec", "_spc", "spc",
         "_reflection", "reflection", "_reflect", "reflect", "_refl", "refl", "_ref", "ref", "_s",
-    ],
-}
+    ),
+})
 
 _TEXTURE_TOKEN_RE = re.compile(r"[a-z0-9]+")
 _COMMON_VARIANT_TOKENS = {
@@ -95,7 +108,7 @@ _NORMAL_VARIANT_TOKENS = {
 }
 
 # Color-data maps (sRGB vs Raw / linear)
-_COLOR_CHANNELS = {"diffuse", "specular", "emission"}
+_COLOR_CHANNELS = frozenset({"diffuse", "specular", "emission"})
 
 # Renderer wiring configs and slot mappings
 _RENDERER_CONFIGS: dict[str, dict] = {
@@ -129,29 +142,29 @@ _RENDERER_CONFIGS: dict[str, dict] = {
     "openpbr": {
         "material_class": "OpenPBRMaterial",
         "slots": {
-            "diffuse":      ["base_color_map", "baseColor_map", "basecolor_map", "base_map", "diffuse_map"],
-            "roughness":    ["roughness_map", "specular_roughness_map", "base_roughness_map"],
-            "glossiness":   ["roughness_map", "specular_roughness_map", "base_roughness_map"],
-            "metallic":     ["metalness_map", "metallic_map", "base_metalness_map"],
-            "opacity":      ["opacity_map", "cutout_map", "transparency_map"],
-            "emission":     ["emission_color_map", "emit_color_map", "emission_map"],
-            "translucency": ["transmission_color_map", "trans_color_map", "transmission_map"],
-            "specular":     ["specular_color_map", "refl_color_map"],
-            "displacement": ["displacement_map"],
+            "diffuse":      ("base_color_map", "baseColor_map", "basecolor_map", "base_map", "diffuse_map"),
+            "roughness":    ("roughness_map", "specular_roughness_map", "base_roughness_map"),
+            "glossiness":   ("roughness_map", "specular_roughness_map", "base_roughness_map"),
+            "metallic":     ("metalness_map", "metallic_map", "base_metalness_map"),
+            "opacity":      ("opacity_map", "cutout_map", "transparency_map"),
+            "emission":     ("emission_color_map", "emit_color_map", "emission_map"),
+            "translucency": ("transmission_color_map", "trans_color_map", "transmission_map"),
+            "specular":     ("specular_color_map", "refl_color_map"),
+            "displacement": ("displacement_map",),
         },
     },
     "materialx": {
         "material_class": "OpenPBRMaterial",
         "slots": {
-            "diffuse":      ["base_color_map", "baseColor_map", "basecolor_map", "base_map", "diffuse_map"],
-            "roughness":    ["roughness_map", "specular_roughness_map", "base_roughness_map"],
-            "glossiness":   ["roughness_map", "specular_roughness_map", "base_roughness_map"],
-            "metallic":     ["metalness_map", "metallic_map", "base_metalness_map"],
-            "opacity":      ["opacity_map", "cutout_map", "transparency_map"],
-            "emission":     ["emission_color_map", "emit_color_map", "emission_map"],
-            "translucency": ["transmission_color_map", "trans_color_map", "transmission_map"],
-            "specular":     ["specular_color_map", "refl_color_map"],
-            "displacement": ["displacement_map"],
+            "diffuse":      ("base_color_map", "baseColor_map", "basecolor_map", "base_map", "diffuse_map"),
+            "roughness":    ("roughness_map", "specular_roughness_map", "base_roughness_map"),
+            "glossiness":   ("roughness_map", "specular_roughness_map", "base_roughness_map"),
+            "metallic":     ("metalness_map", "metallic_map", "base_metalness_map"),
+            "opacity":      ("opacity_map", "cutout_map", "transparency_map"),
+            "emission":     ("emission_color_map", "emit_color_map", "emission_map"),
+            "translucency": ("transmission_color_map", "trans_color_map", "transmission_map"),
+            "specular":     ("specular_color_map", "refl_color_map"),
+            "displacement": ("displacement_map",),
         },
     },
     "redshift": {
@@ -182,6 +195,12 @@ _RENDERER_CONFIGS: dict[str, dict] = {
     },
 }
 
+# Per-renderer slot tables bound once for the texture-folder builders
+_ARNOLD_SLOTS = _RENDERER_CONFIGS["arnold"]["slots"]
+_PHYSICAL_SLOTS = _RENDERER_CONFIGS["physical"]["slots"]
+_OPENPBR_SLOTS = _RENDERER_CONFIGS["openpbr"]["slots"]
+_REDSHIFT_SLOTS = _RENDERER_CONFIGS["redshift"]["slots"]
+
 _PBR_SLOT_CANDIDATES: dict[str, dict[str, list[str]]] = {
     "openpbr": {
         "diffuse":      ["base_color_map", "baseColor_map", "basecolor_map", "base_map", "diffuse_map"],
@@ -269,12 +288,30 @@ _PBR_SLOT_CANDIDATES: dict[str, dict[str, list[str]]] = {
 }
 
 
-def _scan_texture_folder(folder: str) -> list[Path]:
-    """Return all image files in *folder* (non-recursive)."""
-    p = Path(folder)
-    if not p.is_dir():
-        return []
-    return [f for f in p.iterdir() if f.is_file() and f.suffix.lower() in _IMAGE_EXTENSIONS]
+@lru_cache(maxsize=64)
+def _scan_texture_folder_cached(folder: str, mtime_ns: int) -> tuple[Path, ...]:
+    """Scan *folder* once per directory mtime; *mtime_ns* is only the cache key."""
+    found = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # The extension test is one C-level endswith; is_file() is
+            # answered from the directory listing itself and only stats symlinks.
+            if entry.name.lower().endswith(_IMAGE_SUFFIXES) and entry.is_file():
+                found.append(Path(entry.path))
+    return tuple(found)
+
+
+def _scan_texture_folder(folder: str) -> tuple[Path, ...]:
+    """Return all image files in *folder* (non-recursive).
+
+    The cached tuple is returned as-is so it can key the match cache
+    without another copy.
+    """
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+        return _scan_texture_folder_cached(folder, mtime_ns)
+    except OSError:
+        return ()
 
 
 def _texture_tokens(value: str) -> list[str]:
@@ -282,59 +319,114 @@ def _texture_tokens(value: str) -> list[str]:
     return _TEXTURE_TOKEN_RE.findall(value.lower())
 
 
-def _pattern_match_score(
-    stem: str,
-    pattern: str,
-) -> tuple[int, tuple[int, int] | None] | None:
-    """Return a match score and token span for a channel pattern.
+# (by_first_token, by_compact, compact_lengths, compact_suffixes); see
+# _index_channel_patterns
+_ChannelIndex = tuple[dict[str, list[tuple]], dict[str, list[tuple]], tuple[int, ...], tuple[str, ...]]
 
-    Exact token-sequence matches are preferred. Compact suffix matching exists
-    for filenames like ``woodBaseColor`` but gets a lower score and no span.
+
+def _index_channel_patterns(patterns: Mapping[str, Sequence[str]]) -> _ChannelIndex:
+    """Tokenize every channel alias once for :func:`_detect_texture_channel`.
+
+    Returns ``(by_first_token, by_compact, compact_lengths, compact_suffixes)``:
+    ``by_first_token`` maps an alias's first token to
+    ``(alias_tokens, priority, channel, alias)`` entries for token-sequence
+    matching; ``by_compact`` maps the joined alias (4+ chars) to
+    ``(priority, channel, alias)`` entries for the compact suffix fallback,
+    ``compact_lengths`` lists the distinct lengths of those keys and
+    ``compact_suffixes`` holds the keys themselves for a str.endswith check.
     """
-    tokens = _texture_tokens(stem)
-    pattern_tokens = _texture_tokens(pattern)
-    if not tokens or not pattern_tokens:
-        return None
+    by_first_token: dict[str, list[tuple]] = {}
+    by_compact: dict[str, list[tuple]] = {}
+    for priority, (channel, aliases) in enumerate(patterns.items()):
+        for alias in aliases:
+            alias_tokens = _texture_tokens(alias)
+            if not alias_tokens:
+                continue
+            by_first_token.setdefault(alias_tokens[0], []).append(
+                (alias_tokens, priority, channel, alias)
+            )
+            compact = "".join(alias_tokens)
+            if len(compact) >= 4:
+                by_compact.setdefault(compact, []).append((priority, channel, alias))
+    compact_lengths = tuple(sorted({len(compact) for compact in by_compact}))
+    return by_first_token, by_compact, compact_lengths, tuple(by_compact)
 
-    pattern_compact = "".join(pattern_tokens)
-    token_count = len(pattern_tokens)
 
-    for start in range(0, len(tokens) - token_count + 1):
-        if tokens[start:start + token_count] != pattern_tokens:
-            continue
-        at_end = start + token_count == len(tokens)
-        # Single-letter aliases are useful, but they should not outrank normal
-        # production naming like basecolor/roughness/metalness.
-        single_letter_penalty = 80 if len(pattern_compact) == 1 else 0
-        score = (token_count * 100) + len(pattern_compact) + (25 if at_end else 0) - single_letter_penalty
-        return score, (start, start + token_count)
+_DEFAULT_CHANNEL_INDEX = _index_channel_patterns(_DEFAULT_CHANNEL_PATTERNS)
 
-    stem_compact = "".join(tokens)
-    if len(pattern_compact) >= 4 and stem_compact.endswith(pattern_compact):
-        return len(pattern_compact), None
 
-    return None
+def _channel_index(patterns: Mapping[str, Sequence[str]]) -> _ChannelIndex:
+    """Return the alias index for *patterns*, prebuilt for the frozen defaults."""
+    if patterns is _DEFAULT_CHANNEL_PATTERNS:
+        return _DEFAULT_CHANNEL_INDEX
+    return _index_channel_patterns(patterns)
 
 
-def _detect_texture_channel(
-    path: Path,
-    patterns: dict[str, list[str]],
-) -> tuple[str, str, str] | None:
-    """Return ``(channel, material_key, alias)`` for a texture filename."""
-    stem = path.stem
-    tokens = _texture_tokens(stem)
+def _best_channel_match(
+    tokens: list[str],
+    index: _ChannelIndex,
+) -> tuple[int, int, str, tuple[int, int] | None, str] | None:
+    """Score *tokens* against the alias index; return the best candidate.
+
+    Candidates are ``(score, -priority, channel, span, alias)``. Exact
+    token-sequence matches are preferred, scored at the first place each
+    alias occurs. Compact suffix matching exists for filenames like
+    ``woodBaseColor`` but gets a lower score and no span.
+    """
+    if not tokens:
+        return None
+    by_first_token, by_compact, compact_lengths, compact_suffixes = index
+    token_total = len(tokens)
     best: tuple[int, int, str, tuple[int, int] | None, str] | None = None
+    token_matched: set[tuple[int, str]] = set()
 
-    for priority, (channel, aliases) in enumerate(patterns.items()):
-        for alias in aliases:
-            scored = _pattern_match_score(stem, alias)
-            if scored is None:
+    for start, token in enumerate(tokens):
+        for alias_tokens, priority, channel, alias in by_first_token.get(token, ()):
+            key = (priority, alias)
+            if key in token_matched:
+                continue
+            end = start + len(alias_tokens)
+            if tokens[start:end] != alias_tokens:
+                continue
+            token_matched.add(key)
+            compact_len = sum(len(t) for t in alias_tokens)
+            # Single-letter aliases are useful, but they should not outrank normal
+            # production naming like basecolor/roughness/metalness.
+            single_letter_penalty = 80 if compact_len == 1 else 0
+            score = (len(alias_tokens) * 100) + compact_len + (25 if end == token_total else 0) - single_letter_penalty
+            candidate = (score, -priority, channel, (start, end), alias)
+            if best is None or candidate > best:
+                best = candidate
+
+    stem_compact = "".join(tokens)
+    # One C-level endswith over every compact alias rules out most stems
+    # before the per-length slicing below.
+    if not stem_compact.endswith(compact_suffixes):
+        return best
+    for length in compact_lengths:
+        if length > len(stem_compact):
+            break
+        for priority, channel, alias in by_compact.get(stem_compact[-length:], ()):
+            if (priority, alias) in token_matched:
                 continue
-            score, span = scored
-            candidate = (score, -priority, channel, span, alias)
+            candidate = (length, -priority, channel, None, alias)
             if best is None or candidate > best:
                 best = candidate
 
+    return best
+
+
+def _detect_texture_channel(
+    path: Path,
+    index: _ChannelIndex,
+) -> tuple[str, str, str] | None:
+    """Return ``(channel, material_key, alias)`` for a texture filename.
+
+    *index* comes from :func:`_index_channel_patterns`; see
+    :func:`_best_channel_match` for the scoring.
+    """
+    tokens = _texture_tokens(path.stem)
+    best = _best_channel_match(tokens, index)
     if best is None:
         return None
 
@@ -360,28 +452,60 @@ def _detect_texture_channel(
 
 def _match_textures_to_channels(
     files: list[Path],
-    patterns: dict[str, list[str]],
+    patterns: Mapping[str, Sequence[str]],
 ) -> dict[str, Path]:
     """Match texture files to PBR channels using suffix patterns.
 
     Longest match wins.  Each file is claimed by at most one channel.
     Roughness takes priority over glossiness (dict ordering).
     """
-    matched: dict[str, Path] = {}
-    for f in files:
-        detected = _detect_texture_channel(f, patterns)
-        if detected is None:
-            continue
-        channel, _, _ = detected
-        if channel not in matched:
-            matched[channel] = f
+    index = _channel_index(patterns)
+    # Only the channel is needed here, so stems are tokenized up front and
+    # the material-key derivation of _detect_texture_channel is skipped.
+    stem_tokens = [_texture_tokens(f.stem) for f in files]
+    matched_idx: dict[str, int] = {}
+    for i, tokens in enumerate(stem_tokens):
+        best = _best_channel_match(tokens, index)
+        if best is not None and best[2] not in matched_idx:
+            matched_idx[best[2]] = i
+
+    return {channel: files[i] for channel, i in matched_idx.items()}
+
+
+@lru_cache(maxsize=128)
+def _match_texture_folder_cached(
+    folder: str,
+    mtime_ns: int,
+    custom_key: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[tuple[Path, ...], dict[str, Path]]:
+    """Scan and match *folder* once per directory mtime and pattern set.
+
+    The key is three small values, so a repeat call hashes nothing per file.
+    *custom_key* holds the caller's extra patterns as ``(channel, aliases)``
+    pairs in their original order, since pattern order sets priority.
+    Callers must copy the returned dict before changing it.
+    """
+    files = _scan_texture_folder_cached(folder, mtime_ns)
+    patterns = dict(_DEFAULT_CHANNEL_PATTERNS)
+    patterns.update((channel, list(aliases)) for channel, aliases in custom_key)
+    return files, _match_textures_to_channels(list(files), patterns)
+
 
-    return matched
+def _match_texture_folder(
+    folder: str,
+    custom_key: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[tuple[Path, ...], dict[str, Path]]:
+    """Return *folder*'s image files and channel matches (empty if unreadable)."""
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+        return _match_texture_folder_cached(folder, mtime_ns, custom_key)
+    except OSError:
+        return (), {}
 
 
 def _group_texture_files_for_pbr(
     files: list[Path],
-    patterns: dict[str, list[str]],
+    patterns: Mapping[str, Sequence[str]],
 ) -> tuple[list[dict], list[Path], list[str]]:
     """Group texture files into material sets using channel name detection."""
     grouped: dict[str, dict[str, Path]] = {}
@@ -389,8 +513,9 @@ def _group_texture_files_for_pbr(
     unmatched: list[Path] = []
     duplicate_notes: list[str] = []
 
+    index = _channel_index(patterns)
     for path in files:
-        detected = _detect_texture_channel(path, patterns)
+        detected = _detect_texture_channel(path, index)
         if detected is None:
             unmatched.append(path)
             continue
@@ -432,14 +557,147 @@ def _renderer_from_material_class(material_class: str) -> str | None:
     return None
 
 
+# Fixed prologue of each texture-folder material script; placeholder: safe_mat.
+# Builders emit their lines joined by "\n    ", so multi-line templates keep
+# that indentation.
+_ARNOLD_SCRIPT_HEAD = """mat = ai_standard_surface name:"{safe_mat}"
+    summary = "Arnold ai_standard_surface\""""
+
+_PHYSICAL_SCRIPT_HEAD = """mat = PhysicalMaterial name:"{safe_mat}"
+    summary = "PhysicalMaterial\""""
+
+_REDSHIFT_SCRIPT_HEAD = """mat = RS_Standard_Material name:"{safe_mat}"
+    summary = "Redshift RS_Standard_Material\""""
+
+# OpenPBR tries each known class name, then falls back to PhysicalMaterial.
+# The class that worked is kept in a MAXScript global, so later scripts in
+# the same 3ds Max session construct it directly instead of failing through
+# the unavailable names again.
+_OPENPBR_CREATE_FN_LINES = (
+    "global mcp_openPbrClass",
+    "fn mcp_createOpenPbrPreferred matName = (",
+    "    local m = undefined",
+    "    if mcp_openPbrClass != undefined do try (m = mcp_openPbrClass name:matName) catch ()",
+    "    if m == undefined do try (m = OpenPBRMaterial name:matName) catch ()",
+    "    if m == undefined do try (m = OpenPBR_Material name:matName) catch ()",
+    "    if m == undefined do try (m = OpenPBR_Mtl name:matName) catch ()",
+    "    if m == undefined do try (m = PhysicalMaterial name:matName) catch ()",
+    '    if m == undefined do throw "OpenPBRMaterial/OpenPBR_Material/OpenPBR_Mtl/PhysicalMaterial are unavailable"',
+    "    mcp_openPbrClass = classOf m",
+    "    m",
+    ")",
+)
+
+_OPENPBR_SCRIPT_HEAD = """fn mcp_setFirstMap target propNames tex = (
+        for propName in propNames do (
+            try (setProperty target (propName as name) tex; return propName) catch ()
+        )
+        undefined
+    )
+    """ + "\n    ".join(_OPENPBR_CREATE_FN_LINES) + """
+    mat = mcp_createOpenPbrPreferred "{safe_mat}"
+    summary = ((classOf mat) as string)
+    if matchPattern summary pattern:"Physical*" do summary += " (fallback; OpenPBR class unavailable)"
+    channelList = ""
+    skippedList = \"\""""
+
+# Closing lines of the Arnold/Physical/Redshift scripts; placeholder: channels.
+# Their wiring never depends on the scene, so the channel summary is
+# assembled in Python instead of by repeated MAXScript string appends.
+_CHANNEL_SUMMARY_TAIL = """summary += " | Channels: {channels}"
+    summary"""
+
+_OPENPBR_SUMMARY_TAIL = """summary += " | Channels: " + channelList
+    if skippedList != "" do summary += " | Skipped: " + skippedList
+    summary"""
+
+
+# Assigns the material in mat_var to the named nodes and counts them in
+# assignCount; placeholders: name_arr, mat_var. Several targets resolve
+# through one lower-cased name -> handle index instead of a getNodeByName
+# scene walk per name.
+_ASSIGN_TO_TEMPLATE = """nameList = {name_arr}
+    assignCount = 0
+    nodeIdx = undefined
+    if nameList.count > 1 do (
+        nodeIdx = dotNetObject "System.Collections.Hashtable"
+        for o in objects do (
+            k = toLower o.name
+            if nodeIdx.Item[k] == undefined do nodeIdx.Item[k] = o.inode.handle
+        )
+    )
+    for n in nameList do (
+        obj = if nodeIdx == undefined then getNodeByName n else (
+            h = nodeIdx.Item[toLower n]
+            if h == undefined then undefined else maxOps.getNodeByHandle h
+        )
+        if obj != undefined do (obj.material = {mat_var}; assignCount += 1)
+    )"""
+
+
+def _assign_to_lines(assign_to: Sequence[str], mat_var: str) -> str:
+    """MAXScript that assigns *mat_var* to every node named in *assign_to*."""
+    return _ASSIGN_TO_TEMPLATE.format(name_arr=_ms_name_array(assign_to), mat_var=mat_var)
+
+
+def _channel_summary_tail(tags: list[str]) -> str:
+    """Render :data:`_CHANNEL_SUMMARY_TAIL` for the wired channel *tags*."""
+    return _CHANNEL_SUMMARY_TAIL.format(channels=safe_string("".join(f"{tag}, " for tag in tags)))
+
+
+# Reports the _assign_to_lines count in the texture-material summary
+_ASSIGNED_SUMMARY_LINE = 'summary += " | Assigned to " + (assignCount as string) + " object(s)"'
+
+
+def _finish_material_script(lines: list[str], assign_to: Sequence[str] | None, tail: str) -> str:
+    """Append the shared assign block and *tail*, then wrap *lines* in one block."""
+    if assign_to:
+        lines.append(_assign_to_lines(assign_to, "mat"))
+        lines.append(_ASSIGNED_SUMMARY_LINE)
+    lines.append(tail)
+    return "(\n    " + "\n    ".join(lines) + "\n)"
+
+
+class _IdentifierTranslation(dict):
+    """str.translate table: keep alphanumerics and "_", map the rest to "_".
+
+    Code points are classified on first sight and cached, so Unicode letters
+    stay valid exactly as with str.isalnum.
+    """
+
+    def __missing__(self, code: int) -> int:
+        ch = chr(code)
+        mapped = code if ch.isalnum() or ch == "_" else 0x5F
+        self[code] = mapped
+        return mapped
+
+
+_IDENTIFIER_TRANSLATION = _IdentifierTranslation()
+
+
+@lru_cache(maxsize=1024)
+def _maxscript_identifier(base: str) -> str:
+    """Clean *base* into a valid MAXScript identifier (memoized)."""
+    ident = base.translate(_IDENTIFIER_TRANSLATION)
+    if ident[0].isdigit():
+        ident = "m_" + ident
+    return ident
+
 
 def _ms_path(p: Path) -> str:
     """Convert a Path to a MAXScript-safe forward-slash string."""
     return str(p).replace("\\", "/")
 
 
-def _ms_name_array(values: list[str]) -> str:
-    return "#(" + ", ".join(f'"{safe_string(v)}"' for v in values) + ")"
+@lru_cache(maxsize=256)
+def _ms_name_array_cached(values: tuple[str, ...]) -> str:
+    return string_array(values)
+
+
+def _ms_name_array(values: Sequence[str]) -> str:
+    # Slot-candidate lists are module constants, so the same few arrays are
+    # rendered for every channel of every material.
+    return _ms_name_array_cached(tuple(values))
 
 
 def _material_slot_hints(material_class: str) -> dict[str, str]:
@@ -492,17 +750,18 @@ def _build_arnold_maxscript(
     assign_to: list[str] | None,
 ) -> str:
     """Generate MAXScript for Arnold (ai_standard_surface) material setup."""
-    lines: list[str] = []
-    safe_mat = safe_string(material_name)
-    lines.append(f'mat = ai_standard_surface name:"{safe_mat}"')
-    lines.append('summary = "Arnold ai_standard_surface"')
-    lines.append('channelList = ""')
-
-    for channel, fpath in matched.items():
+    lines = [_ARNOLD_SCRIPT_HEAD.format(safe_mat=safe_string(material_name))]
+    # Every path is converted once; the AO and bump paths are also read
+    # from inside the diffuse and normal branches.
+    fps = {channel: _ms_path(fpath) for channel, fpath in matched.items()}
+    tags: list[str] = []
+    slots = _ARNOLD_SLOTS
+
+    # Each channel contributes its bitmap line plus one pre-joined wiring
+    # block; static lines are adjacent literals, folded at compile time.
+    for channel, fp in fps.items():
         var = f"bm_{channel}"
-        fp = _ms_path(fpath)
-        is_color = channel in _COLOR_CHANNELS
-        cs = "sRGB" if is_color else "Raw"
+        cs = "sRGB" if channel in _COLOR_CHANNELS else "Raw"
 
         # Create ai_image bitmap
         lines.append(f'{var} = ai_image name:"{channel}" filename:"{fp}" color_space:"{cs}"')
@@ -510,72 +769,70 @@ def _build_arnold_maxscript(
         if channel == "diffuse":
             # Check if AO exists to composite
             if "ao" in matched:
-                ao_fp = _ms_path(matched["ao"])
-                lines.append(f'bm_ao = ai_image name:"ao" filename:"{ao_fp}" color_space:"Raw"')
-                lines.append('comp = ai_layer_rgba name:"Diffuse_AO"')
-                lines.append(f'comp.input1_shader = {var}')
-                lines.append('comp.enable2 = true')
-                lines.append('comp.input2_shader = bm_ao')
-                lines.append('comp.operation2 = 5')  # multiply (layer 2)
-                lines.append('mat.base_color_shader = comp')
-                lines.append('channelList += "diffuse(+ao), "')
+                lines.append(
+                    f'bm_ao = ai_image name:"ao" filename:"{fps["ao"]}" color_space:"Raw"\n    '
+                    'comp = ai_layer_rgba name:"Diffuse_AO"\n    '
+                    f'comp.input1_shader = {var}\n    '
+                    'comp.enable2 = true\n    '
+                    'comp.input2_shader = bm_ao\n    '
+                    'comp.operation2 = 5\n    '  # multiply (layer 2)
+                    'mat.base_color_shader = comp'
+                )
+                tags.append("diffuse(+ao)")
             else:
                 lines.append(f'mat.base_color_shader = {var}')
-                lines.append('channelList += "diffuse, "')
+                tags.append("diffuse")
         elif channel == "ao":
             # Handled inside diffuse block above; skip standalone
             continue
         elif channel == "glossiness":
-            lines.append(f'inv = ai_color_correct name:"GlossToRough" input_shader:{var}')
-            lines.append('inv.invert = true')
-            lines.append('mat.specular_roughness_shader = inv')
-            lines.append('channelList += "glossiness(inverted), "')
+            lines.append(
+                f'inv = ai_color_correct name:"GlossToRough" input_shader:{var}\n    '
+                'inv.invert = true\n    '
+                'mat.specular_roughness_shader = inv'
+            )
+            tags.append("glossiness(inverted)")
         elif channel == "normal":
-            lines.append(f'nrmMap = ai_normal_map name:"NormalMap" input_shader:{var}')
             if "bump" in matched:
-                bump_fp = _ms_path(matched["bump"])
-                lines.append(f'bm_bump_h = ai_image name:"bump" filename:"{bump_fp}" color_space:"Raw"')
-                lines.append('bmpNode = ai_bump2d name:"Bump"')
-                lines.append('bmpNode.bump_map_shader = bm_bump_h')
-                lines.append('bmpNode.normal_shader = nrmMap')
-                lines.append('mat.normal_shader = bmpNode')
-                lines.append('channelList += "normal(+bump), "')
+                lines.append(
+                    f'nrmMap = ai_normal_map name:"NormalMap" input_shader:{var}\n    '
+                    f'bm_bump_h = ai_image name:"bump" filename:"{fps["bump"]}" color_space:"Raw"\n    '
+                    'bmpNode = ai_bump2d name:"Bump"\n    '
+                    'bmpNode.bump_map_shader = bm_bump_h\n    '
+                    'bmpNode.normal_shader = nrmMap\n    '
+                    'mat.normal_shader = bmpNode'
+                )
+                tags.append("normal(+bump)")
             else:
-                lines.append('bmpNode = ai_bump2d name:"NormalBump"')
-                lines.append('bmpNode.normal_shader = nrmMap')
-                lines.append('mat.normal_shader = bmpNode')
-                lines.append('channelList += "normal, "')
+                lines.append(
+                    f'nrmMap = ai_normal_map name:"NormalMap" input_shader:{var}\n    '
+                    'bmpNode = ai_bump2d name:"NormalBump"\n    '
+                    'bmpNode.normal_shader = nrmMap\n    '
+                    'mat.normal_shader = bmpNode'
+                )
+                tags.append("normal")
         elif channel == "bump":
             # Handled inside normal block if normal exists
             if "normal" not in matched:
-                lines.append('bmpNode = ai_bump2d name:"Bump"')
-                lines.append(f'bmpNode.bump_map_shader = {var}')
-                lines.append('mat.normal_shader = bmpNode')
-                lines.append('channelList += "bump, "')
+                lines.append(
+                    'bmpNode = ai_bump2d name:"Bump"\n    '
+                    f'bmpNode.bump_map_shader = {var}\n    '
+                    'mat.normal_shader = bmpNode'
+                )
+                tags.append("bump")
         elif channel == "displacement":
             # Displacement is modifier-based, note it but don't wire
-            lines.append('channelList += "displacement(skipped-modifier-based), "')
+            tags.append("displacement(skipped-modifier-based)")
         elif channel == "ior":
-            lines.append('channelList += "ior(skipped-no-map-slot), "')
+            tags.append("ior(skipped-no-map-slot)")
         else:
             # Standard slot wiring
-            slot = _RENDERER_CONFIGS["arnold"]["slots"].get(channel)
+            slot = slots.get(channel)
             if slot:
                 lines.append(f'mat.{slot} = {var}')
-                lines.append(f'channelList += "{channel}, "')
-
-    # Assign to objects
-    if assign_to:
-        names_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in assign_to) + ")"
-        lines.append(f'nameList = {names_arr}')
-        lines.append('assignCount = 0')
-        lines.append('for n in nameList do (obj = getNodeByName n; if obj != undefined then (obj.material = mat; assignCount += 1))')
-        lines.append('summary += " | Assigned to " + (assignCount as string) + " object(s)"')
+                tags.append(channel)
 
-    lines.append('summary += " | Channels: " + channelList')
-    lines.append('summary')
-
-    return "(\n    " + "\n    ".join(lines) + "\n)"
+    return _finish_material_script(lines, assign_to, _channel_summary_tail(tags))
 
 
 def _build_physical_maxscript(
@@ -584,81 +841,79 @@ def _build_physical_maxscript(
     assign_to: list[str] | None,
 ) -> str:
     """Generate MAXScript for PhysicalMaterial setup."""
-    lines: list[str] = []
-    safe_mat = safe_string(material_name)
-    lines.append(f'mat = PhysicalMaterial name:"{safe_mat}"')
-    lines.append('summary = "PhysicalMaterial"')
-    lines.append('channelList = ""')
+    lines = [_PHYSICAL_SCRIPT_HEAD.format(safe_mat=safe_string(material_name))]
+    fps = {channel: _ms_path(fpath) for channel, fpath in matched.items()}
+    tags: list[str] = []
+    slots = _PHYSICAL_SLOTS
 
-    for channel, fpath in matched.items():
+    for channel, fp in fps.items():
         var = f"bm_{channel}"
-        fp = _ms_path(fpath)
 
         # Create Bitmaptexture
         lines.append(f'{var} = Bitmaptexture name:"{channel}" fileName:"{fp}"')
 
         if channel == "diffuse":
             if "ao" in matched:
-                ao_fp = _ms_path(matched["ao"])
-                lines.append(f'bm_ao = Bitmaptexture name:"ao" fileName:"{ao_fp}"')
-                lines.append('comp = CompositeTexturemap()')
-                lines.append('comp.name = "Diffuse_AO"')
-                lines.append(f'comp.mapList[1] = {var}')
-                lines.append('comp.mapList[2] = bm_ao')
-                lines.append('comp.blendMode[2] = 5')  # multiply
-                lines.append('mat.base_color_map = comp')
-                lines.append('channelList += "diffuse(+ao), "')
+                lines.append(
+                    f'bm_ao = Bitmaptexture name:"ao" fileName:"{fps["ao"]}"\n    '
+                    'comp = CompositeTexturemap()\n    '
+                    'comp.name = "Diffuse_AO"\n    '
+                    f'comp.mapList[1] = {var}\n    '
+                    'comp.mapList[2] = bm_ao\n    '
+                    'comp.blendMode[2] = 5\n    '  # multiply
+                    'mat.base_color_map = comp'
+                )
+                tags.append("diffuse(+ao)")
             else:
-                lines.append('mat.base_color_map = ' + var)
-                lines.append('channelList += "diffuse, "')
+                lines.append(f'mat.base_color_map = {var}')
+                tags.append("diffuse")
         elif channel == "ao":
             continue
         elif channel == "glossiness":
-            lines.append(f'inv = Output name:"GlossToRough"')
-            lines.append(f'inv.map1 = {var}')
-            lines.append('inv.output.invert = true')
-            lines.append('mat.roughness_map = inv')
-            lines.append('channelList += "glossiness(inverted), "')
+            lines.append(
+                'inv = Output name:"GlossToRough"\n    '
+                f'inv.map1 = {var}\n    '
+                'inv.output.invert = true\n    '
+                'mat.roughness_map = inv'
+            )
+            tags.append("glossiness(inverted)")
         elif channel == "normal":
-            lines.append(f'nrmBump = Normal_Bump name:"NormalBump"')
-            lines.append(f'nrmBump.normal_map = {var}')
             if "bump" in matched:
-                bump_fp = _ms_path(matched["bump"])
-                lines.append(f'bm_bump_h = Bitmaptexture name:"bump" fileName:"{bump_fp}"')
-                lines.append('nrmBump.bump_map = bm_bump_h')
-                lines.append('mat.bump_map = nrmBump')
-                lines.append('channelList += "normal(+bump), "')
+                lines.append(
+                    'nrmBump = Normal_Bump name:"NormalBump"\n    '
+                    f'nrmBump.normal_map = {var}\n    '
+                    f'bm_bump_h = Bitmaptexture name:"bump" fileName:"{fps["bump"]}"\n    '
+                    'nrmBump.bump_map = bm_bump_h\n    '
+                    'mat.bump_map = nrmBump'
+                )
+                tags.append("normal(+bump)")
             else:
-                lines.append('mat.bump_map = nrmBump')
-                lines.append('channelList += "normal, "')
+                lines.append(
+                    'nrmBump = Normal_Bump name:"NormalBump"\n    '
+                    f'nrmBump.normal_map = {var}\n    '
+                    'mat.bump_map = nrmBump'
+                )
+                tags.append("normal")
         elif channel == "bump":
             if "normal" not in matched:
-                lines.append(f'nrmBump = Normal_Bump name:"BumpOnly"')
-                lines.append(f'nrmBump.bump_map = {var}')
-                lines.append('mat.bump_map = nrmBump')
-                lines.append('channelList += "bump, "')
+                lines.append(
+                    'nrmBump = Normal_Bump name:"BumpOnly"\n    '
+                    f'nrmBump.bump_map = {var}\n    '
+                    'mat.bump_map = nrmBump'
+                )
+                tags.append("bump")
         elif channel == "displacement":
             lines.append(f'mat.displacement_map = {var}')
-            lines.append('channelList += "displacement, "')
+            tags.append("displacement")
         elif channel == "ior":
-            lines.append('channelList += "ior(skipped-no-map-slot), "')
+            tags.append("ior(skipped-no-map-slot)")
         else:
-            slot = _RENDERER_CONFIGS["physical"]["slots"].get(channel)
+            slot = slots.get(channel)
             if slot:
                 lines.append(f'mat.{slot} = {var}')
-                lines.append(f'channelList += "{channel}, "')
+                tags.append(channel)
 
-    if assign_to:
-        names_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in assign_to) + ")"
-        lines.append(f'nameList = {names_arr}')
-        lines.append('assignCount = 0')
-        lines.append('for n in nameList do (obj = getNodeByName n; if obj != undefined then (obj.material = mat; assignCount += 1))')
-        lines.append('summary += " | Assigned to " + (assignCount as string) + " object(s)"')
-
-    lines.append('summary += " | Channels: " + channelList')
-    lines.append('summary')
-
-    return "(\n    " + "\n    ".join(lines) + "\n)"
+    return _finish_material_script(lines, assign_to, _channel_summary_tail(tags))
 
 
 def _build_openpbr_maxscript(
@@ -667,101 +922,78 @@ def _build_openpbr_maxscript(
     assign_to: list[str] | None,
 ) -> str:
     """Generate MAXScript for OpenPBR material setup with Physical fallback."""
-    lines: list[str] = []
-    safe_mat = safe_string(material_name)
-    lines.extend([
-        "fn mcp_setFirstMap target propNames tex = (",
-        "    for propName in propNames do (",
-        "        try (setProperty target (propName as name) tex; return propName) catch ()",
-        "    )",
-        "    undefined",
-        ")",
-        "fn mcp_createOpenPbrPreferred matName = (",
-        "    local m = undefined",
-        '    try (m = OpenPBRMaterial name:matName) catch ()',
-        '    if m == undefined do try (m = OpenPBR_Material name:matName) catch ()',
-        '    if m == undefined do try (m = OpenPBR_Mtl name:matName) catch ()',
-        '    if m == undefined do try (m = PhysicalMaterial name:matName) catch ()',
-        '    if m == undefined do throw "OpenPBRMaterial/OpenPBR_Material/OpenPBR_Mtl/PhysicalMaterial are unavailable"',
-        "    m",
-        ")",
-        f'mat = mcp_createOpenPbrPreferred "{safe_mat}"',
-        'summary = ((classOf mat) as string)',
-        'if matchPattern summary pattern:"Physical*" do summary += " (fallback; OpenPBR class unavailable)"',
-        'channelList = ""',
-        'skippedList = ""',
-    ])
+    lines = [_OPENPBR_SCRIPT_HEAD.format(safe_mat=safe_string(material_name))]
+    fps = {channel: _ms_path(fpath) for channel, fpath in matched.items()}
 
-    slots = _RENDERER_CONFIGS["openpbr"]["slots"]
+    slots = _OPENPBR_SLOTS
 
-    def ms_name_array(values: list[str]) -> str:
-        return "#(" + ", ".join(f'"{safe_string(v)}"' for v in values) + ")"
-
-    for channel, fpath in matched.items():
+    for channel, fp in fps.items():
         var = f"bm_{channel}"
-        fp = _ms_path(fpath)
         lines.append(f'{var} = Bitmaptexture name:"{channel}" fileName:"{fp}"')
 
         if channel == "diffuse":
             if "ao" in matched:
-                ao_fp = _ms_path(matched["ao"])
-                lines.append(f'bm_ao = Bitmaptexture name:"ao" fileName:"{ao_fp}"')
-                lines.append('comp = CompositeTexturemap()')
-                lines.append('comp.name = "Diffuse_AO"')
-                lines.append(f'comp.mapList[1] = {var}')
-                lines.append('comp.mapList[2] = bm_ao')
-                lines.append('comp.blendMode[2] = 5')
-                lines.append(f'slotName = mcp_setFirstMap mat {ms_name_array(slots["diffuse"])} comp')
-                lines.append('if slotName != undefined then channelList += "diffuse(+ao)->" + slotName + ", " else skippedList += "diffuse, "')
+                lines.append(
+                    f'bm_ao = Bitmaptexture name:"ao" fileName:"{fps["ao"]}"\n    '
+                    'comp = CompositeTexturemap()\n    '
+                    'comp.name = "Diffuse_AO"\n    '
+                    f'comp.mapList[1] = {var}\n    '
+                    'comp.mapList[2] = bm_ao\n    '
+                    'comp.blendMode[2] = 5\n    '
+                    f'slotName = mcp_setFirstMap mat {_ms_name_array(slots["diffuse"])} comp\n    '
+                    'if slotName != undefined then channelList += "diffuse(+ao)->" + slotName + ", " else skippedList += "diffuse, "'
+                )
             else:
-                lines.append(f'slotName = mcp_setFirstMap mat {ms_name_array(slots["diffuse"])} {var}')
-                lines.append('if slotName != undefined then channelList += "diffuse->" + slotName + ", " else skippedList += "diffuse, "')
+                lines.append(
+                    f'slotName = mcp_setFirstMap mat {_ms_name_array(slots["diffuse"])} {var}\n    '
+                    'if slotName != undefined then channelList += "diffuse->" + slotName + ", " else skippedList += "diffuse, "'
+                )
         elif channel == "ao":
             continue
         elif channel == "glossiness":
-            lines.append('inv = Output name:"GlossToRough"')
-            lines.append(f'inv.map1 = {var}')
-            lines.append('inv.output.invert = true')
-            lines.append(f'slotName = mcp_setFirstMap mat {ms_name_array(slots["glossiness"])} inv')
-            lines.append('if slotName != undefined then channelList += "glossiness(inverted)->" + slotName + ", " else skippedList += "glossiness, "')
+            lines.append(
+                'inv = Output name:"GlossToRough"\n    '
+                f'inv.map1 = {var}\n    '
+                'inv.output.invert = true\n    '
+                f'slotName = mcp_setFirstMap mat {_ms_name_array(slots["glossiness"])} inv\n    '
+                'if slotName != undefined then channelList += "glossiness(inverted)->" + slotName + ", " else skippedList += "glossiness, "'
+            )
         elif channel == "normal":
-            lines.append('nrmBump = Normal_Bump name:"NormalBump"')
-            lines.append(f'nrmBump.normal_map = {var}')
             if "bump" in matched:
-                bump_fp = _ms_path(matched["bump"])
-                lines.append(f'bm_bump_h = Bitmaptexture name:"bump" fileName:"{bump_fp}"')
-                lines.append('nrmBump.bump_map = bm_bump_h')
-                lines.append('slotName = mcp_setFirstMap mat #("bump_map", "normal_map") nrmBump')
-                lines.append('if slotName != undefined then channelList += "normal(+bump)->" + slotName + ", " else skippedList += "normal, "')
+                lines.append(
+                    'nrmBump = Normal_Bump name:"NormalBump"\n    '
+                    f'nrmBump.normal_map = {var}\n    '
+                    f'bm_bump_h = Bitmaptexture name:"bump" fileName:"{fps["bump"]}"\n    '
+                    'nrmBump.bump_map = bm_bump_h\n    '
+                    'slotName = mcp_setFirstMap mat #("bump_map", "normal_map") nrmBump\n    '
+                    'if slotName != undefined then channelList += "normal(+bump)->" + slotName + ", " else skippedList += "normal, "'
+                )
             else:
-                lines.append('slotName = mcp_setFirstMap mat #("bump_map", "normal_map") nrmBump')
-                lines.append('if slotName != undefined then channelList += "normal->" + slotName + ", " else skippedList += "normal, "')
+                lines.append(
+                    'nrmBump = Normal_Bump name:"NormalBump"\n    '
+                    f'nrmBump.normal_map = {var}\n    '
+                    'slotName = mcp_setFirstMap mat #("bump_map", "normal_map") nrmBump\n    '
+                    'if slotName != undefined then channelList += "normal->" + slotName + ", " else skippedList += "normal, "'
+                )
         elif channel == "bump":
             if "normal" not in matched:
-                lines.append('nrmBump = Normal_Bump name:"BumpOnly"')
-                lines.append(f'nrmBump.bump_map = {var}')
-                lines.append('slotName = mcp_setFirstMap mat #("bump_map", "normal_map") nrmBump')
-                lines.append('if slotName != undefined then channelList += "bump->" + slotName + ", " else skippedList += "bump, "')
+                lines.append(
+                    'nrmBump = Normal_Bump name:"BumpOnly"\n    '
+                    f'nrmBump.bump_map = {var}\n    '
+                    'slotName = mcp_setFirstMap mat #("bump_map", "normal_map") nrmBump\n    '
+                    'if slotName != undefined then channelList += "bump->" + slotName + ", " else skippedList += "bump, "'
+                )
         elif channel == "ior":
             lines.append('skippedList += "ior, "')
         else:
             candidates = slots.get(channel)
             if candidates:
-                lines.append(f'slotName = mcp_setFirstMap mat {ms_name_array(candidates)} {var}')
-                lines.append(f'if slotName != undefined then channelList += "{channel}->" + slotName + ", " else skippedList += "{channel}, "')
-
-    if assign_to:
-        names_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in assign_to) + ")"
-        lines.append(f'nameList = {names_arr}')
-        lines.append('assignCount = 0')
-        lines.append('for n in nameList do (obj = getNodeByName n; if obj != undefined then (obj.material = mat; assignCount += 1))')
-        lines.append('summary += " | Assigned to " + (assignCount as string) + " object(s)"')
+                lines.append(
+                    f'slotName = mcp_setFirstMap mat {_ms_name_array(candidates)} {var}\n    '
+                    f'if slotName != undefined then channelList += "{channel}->" + slotName + ", " else skippedList += "{channel}, "'
+                )
 
-    lines.append('summary += " | Channels: " + channelList')
-    lines.append('if skippedList != "" do summary += " | Skipped: " + skippedList')
-    lines.append('summary')
-
-    return "(\n    " + "\n    ".join(lines) + "\n)"
+    return _finish_material_script(lines, assign_to, _OPENPBR_SUMMARY_TAIL)
 
 
 def _build_redshift_maxscript(
@@ -770,86 +1002,206 @@ def _build_redshift_maxscript(
     assign_to: list[str] | None,
 ) -> str:
     """Generate MAXScript for Redshift (RS_Standard_Material) setup."""
-    lines: list[str] = []
-    safe_mat = safe_string(material_name)
-    lines.append(f'mat = RS_Standard_Material name:"{safe_mat}"')
-    lines.append('summary = "Redshift RS_Standard_Material"')
-    lines.append('channelList = ""')
+    lines = [_REDSHIFT_SCRIPT_HEAD.format(safe_mat=safe_string(material_name))]
+    fps = {channel: _ms_path(fpath) for channel, fpath in matched.items()}
+    tags: list[str] = []
+    slots = _REDSHIFT_SLOTS
 
-    for channel, fpath in matched.items():
+    for channel, fp in fps.items():
         var = f"bm_{channel}"
-        fp = _ms_path(fpath)
 
         lines.append(f'{var} = Bitmaptexture name:"{channel}" fileName:"{fp}"')
 
         if channel == "diffuse":
             if "ao" in matched:
-                ao_fp = _ms_path(matched["ao"])
-                lines.append(f'bm_ao = Bitmaptexture name:"ao" fileName:"{ao_fp}"')
-                lines.append('comp = CompositeTexturemap()')
-                lines.append('comp.name = "Diffuse_AO"')
-                lines.append(f'comp.mapList[1] = {var}')
-                lines.append('comp.mapList[2] = bm_ao')
-                lines.append('comp.blendMode[2] = 5')
-                lines.append('mat.base_color_map = comp')
-                lines.append('channelList += "diffuse(+ao), "')
+                lines.append(
+                    f'bm_ao = Bitmaptexture name:"ao" fileName:"{fps["ao"]}"\n    '
+                    'comp = CompositeTexturemap()\n    '
+                    'comp.name = "Diffuse_AO"\n    '
+                    f'comp.mapList[1] = {var}\n    '
+                    'comp.mapList[2] = bm_ao\n    '
+                    'comp.blendMode[2] = 5\n    '
+                    'mat.base_color_map = comp'
+                )
+                tags.append("diffuse(+ao)")
             else:
                 lines.append(f'mat.base_color_map = {var}')
-                lines.append('channelList += "diffuse, "')
+                tags.append("diffuse")
         elif channel == "ao":
             continue
         elif channel == "glossiness":
-            lines.append(f'inv = Output name:"GlossToRough"')
-            lines.append(f'inv.map1 = {var}')
-            lines.append('inv.output.invert = true')
-            lines.append('mat.refl_roughness_map = inv')
-            lines.append('channelList += "glossiness(inverted), "')
+            lines.append(
+                'inv = Output name:"GlossToRough"\n    '
+                f'inv.map1 = {var}\n    '
+                'inv.output.invert = true\n    '
+                'mat.refl_roughness_map = inv'
+            )
+            tags.append("glossiness(inverted)")
         elif channel == "normal":
-            lines.append('rsBump = RS_BumpMap name:"NormalBump"')
-            lines.append(f'rsBump.input_map = {var}')
-            lines.append('rsBump.inputType = 1')  # tangent-space normal
             if "bump" in matched:
-                bump_fp = _ms_path(matched["bump"])
-                lines.append(f'bm_bump_h = Bitmaptexture name:"bump" fileName:"{bump_fp}"')
-                # Redshift: chain bump into the bump map input
-                lines.append('rsBumpH = RS_BumpMap name:"BumpHeight"')
-                lines.append('rsBumpH.input_map = bm_bump_h')
-                lines.append('rsBumpH.inputType = 0')  # bump
-                lines.append('-- Redshift: wire normal to bump_input, height bump separate')
-                lines.append('mat.bump_input = rsBump')
-                lines.append('channelList += "normal(+bump partially), "')
+                lines.append(
+                    'rsBump = RS_BumpMap name:"NormalBump"\n    '
+                    f'rsBump.input_map = {var}\n    '
+                    'rsBump.inputType = 1\n    '  # tangent-space normal
+                    f'bm_bump_h = Bitmaptexture name:"bump" fileName:"{fps["bump"]}"\n    '
+                    # Redshift: chain bump into the bump map input
+                    'rsBumpH = RS_BumpMap name:"BumpHeight"\n    '
+                    'rsBumpH.input_map = bm_bump_h\n    '
+                    'rsBumpH.inputType = 0\n    '  # bump
+                    '-- Redshift: wire normal to bump_input, height bump separate\n    '
+                    'mat.bump_input = rsBump'
+                )
+                tags.append("normal(+bump partially)")
             else:
-                lines.append('mat.bump_input = rsBump')
-                lines.append('channelList += "normal, "')
+                lines.append(
+                    'rsBump = RS_BumpMap name:"NormalBump"\n    '
+                    f'rsBump.input_map = {var}\n    '
+                    'rsBump.inputType = 1\n    '  # tangent-space normal
+                    'mat.bump_input = rsBump'
+                )
+                tags.append("normal")
         elif channel == "bump":
             if "normal" not in matched:
-                lines.append('rsBump = RS_BumpMap name:"Bump"')
-                lines.append(f'rsBump.input_map = {var}')
-                lines.append('rsBump.inputType = 0')
-                lines.append('mat.bump_input = rsBump')
-                lines.append('channelList += "bump, "')
+                lines.append(
+                    'rsBump = RS_BumpMap name:"Bump"\n    '
+                    f'rsBump.input_map = {var}\n    '
+                    'rsBump.inputType = 0\n    '
+                    'mat.bump_input = rsBump'
+                )
+                tags.append("bump")
         elif channel == "displacement":
             lines.append(f'mat.displacement_input = {var}')
-            lines.append('channelList += "displacement, "')
+            tags.append("displacement")
         elif channel == "ior":
-            lines.append('channelList += "ior(skipped-no-map-slot), "')
+            tags.append("ior(skipped-no-map-slot)")
         else:
-            slot = _RENDERER_CONFIGS["redshift"]["slots"].get(channel)
+            slot = slots.get(channel)
             if slot:
                 lines.append(f'mat.{slot} = {var}')
-                lines.append(f'channelList += "{channel}, "')
+                tags.append(channel)
 
-    if assign_to:
-        names_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in assign_to) + ")"
-        lines.append(f'nameList = {names_arr}')
-        lines.append('assignCount = 0')
-        lines.append('for n in nameList do (obj = getNodeByName n; if obj != undefined then (obj.material = mat; assignCount += 1))')
-        lines.append('summary += " | Assigned to " + (assignCount as string) + " object(s)"')
+    return _finish_material_script(lines, assign_to, _channel_summary_tail(tags))
 
-    lines.append('summary += " | Channels: " + channelList')
-    lines.append('summary')
 
-    return "(\n    " + "\n    ".join(lines) + "\n)"
+# assign_material fallback; placeholders: material_class, name_param, params,
+# name_arr, override_lines
+_ASSIGN_MATERIAL_TEMPLATE = """(
+    try (
+        mat = {material_class}{name_param} {params}
+        nameList = {name_arr}
+        -- getNodeByName walks the scene per call; for several targets one
+        -- pass builds a lower-cased name -> handle index of first matches
+        nodeIdx = undefined
+        if nameList.count > 1 do (
+            nodeIdx = dotNetObject "System.Collections.Hashtable"
+            for o in objects do (
+                k = toLower o.name
+                if nodeIdx.Item[k] == undefined do nodeIdx.Item[k] = o.inode.handle
+            )
+        )
+        assignCount = 0
+        notFound = #()
+        for n in nameList do (
+            obj = if nodeIdx == undefined then getNodeByName n else (
+                h = nodeIdx.Item[toLower n]
+                if h == undefined then undefined else maxOps.getNodeByHandle h
+            )
+            if obj != undefined then (
+                obj.material = mat
+                assignCount += 1
+            ) else (
+                append notFound n
+            )
+        )
+        msg = "Created " + (classof mat) as string + " \\\"" + mat.name + "\\\" and assigned to " + (assignCount as string) + " object(s)"
+        if notFound.count > 0 do msg += " | Not found: " + (notFound as string)
+        {override_lines}
+        msg
+    ) catch (
+        "Error: " + (getCurrentException())
+    )
+)"""
+
+
+# Per-object overrides for _ASSIGN_MATERIAL_TEMPLATE; each entry is
+# #(objName, #(propName, ...), #(value, ...)). An overridden object gets its
+# own copy of mat so the other targets keep the shared one.
+# placeholders: overrides
+_ASSIGN_OVERRIDES_LINES = """valErrs = #()
+        overrides = #({overrides})
+        valErrs.count = {value_count}
+        overrideCount = 0
+        overrideErrs = #()
+        for ov in overrides do (
+            obj = if nodeIdx == undefined then getNodeByName ov[1] else (
+                h = nodeIdx.Item[toLower ov[1]]
+                if h == undefined then undefined else maxOps.getNodeByHandle h
+            )
+            if obj != undefined and obj.material == mat do (
+                objMat = copy mat
+                objMat.name = mat.name + "_" + obj.name
+                obj.material = objMat
+                overrideCount += 1
+                for i = 1 to ov[2].count do (
+                    err = valErrs[ov[4] + i]
+                    if err != undefined then append overrideErrs (ov[1] + "." + ov[5][i] + ": " + err)
+                    else try (
+                        -- a dotted path arrives as its segments; walk to the owner of the last one
+                        propRef = ov[2][i]
+                        propOwner = objMat
+                        if classOf propRef == Array do (
+                            for s = 1 to propRef.count - 1 do propOwner = getProperty propOwner propRef[s]
+                            propRef = propRef[propRef.count]
+                        )
+                        setProperty propOwner propRef ov[3][i]
+                    ) catch (append overrideErrs (ov[1] + "." + ov[5][i] + ": " + getCurrentException()))
+                )
+            )
+        )
+        msg += " | Overrides on " + (overrideCount as string) + " object(s)"
+        if overrideErrs.count > 0 do msg += " | Errors: " + (overrideErrs as string)"""
+
+
+def _property_ref(prop: str) -> str:
+    """Name literal for *prop*, or an array of segment names for a dotted path."""
+    if "." not in prop:
+        return f"#'{safe_name(prop)}'"
+    return "#(" + ", ".join(f"#'{safe_name(seg)}'" for seg in prop.split(".")) + ")"
+
+
+def _assign_material_maxscript(
+    names: Sequence[str],
+    material_class: str,
+    material_name: str = "",
+    params: str = "",
+    per_object_params: Mapping[str, Mapping[str, str]] | None = None,
+) -> str:
+    """Build the assign_material fallback script."""
+    safe_mat_name = safe_string(material_name)
+    name_param = f' name:"{safe_mat_name}"' if material_name else ""
+    name_arr = string_array(names)
+
+    # Every override value is guarded into one shared valErrs array; each
+    # entry carries its offset into it: #(name, props, values, offset, labels)
+    overrides = []
+    value_count = 0
+    for obj_name, props in (per_object_params or {}).items():
+        if not props:
+            continue
+        prop_names = ", ".join(_property_ref(prop) for prop in props)
+        prop_values = _guarded_values(props.values(), start=value_count + 1)
+        overrides.append(
+            f'#("{safe_string(obj_name)}", #({prop_names}), #({prop_values}), {value_count}, {string_array(list(props))})'
+        )
+        value_count += len(props)
+    override_lines = _ASSIGN_OVERRIDES_LINES.format(
+        overrides=", ".join(overrides), value_count=value_count,
+    ) if overrides else ""
+
+    return _ASSIGN_MATERIAL_TEMPLATE.format(
+        material_class=material_class, name_param=name_param, params=params, name_arr=name_arr,
+        override_lines=override_lines,
+    )
 
 
 @mcp.tool()
@@ -858,9 +1210,17 @@ def assign_material(
     material_class: str,
     material_name: str = "",
     params: str = "",
+    per_object_params: dict[str, dict[str, str]] | None = None,
 ) -> str:
-    """Create a material and assign it to one or more objects."""
-    if client.native_available:
+    """Create a material and assign it to one or more objects.
+
+    per_object_params maps an object name to property overrides; that object
+    gets its own copy of the material with the overrides applied, in the
+    same round trip.
+    """
+    invalidate_inspect_cache()
+    # The native handler has no override pass, so overrides take the script path
+    if client.native_available and not per_object_params:
         payload = {
             "names": names,
             "material_class": material_class,
@@ -870,34 +1230,60 @@ def assign_material(
         response = client.send_command(json.dumps(payload), cmd_type="native:assign_material")
         return response.get("result", "")
 
-    safe_mat_name = safe_string(material_name)
-    name_param = f' name:"{safe_mat_name}"' if material_name else ""
-    name_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in names) + ")"
+    maxscript = _assign_material_maxscript(names, material_class, material_name, params, per_object_params)
+    response = client.send_command(minify_maxscript(maxscript))
+    return response.get("result", "")
 
-    maxscript = f"""(
-        try (
-            mat = {material_class}{name_param} {params}
-            nameList = {name_arr}
-            assignCount = 0
-            notFound = #()
-            for n in nameList do (
-                obj = getNodeByName n
-                if obj != undefined then (
-                    obj.material = mat
-                    assignCount += 1
-                ) else (
-                    append notFound n
-                )
+
+# set_material_property fallback; placeholders: safe, safe_prop, set_expr,
+# get_expr, mat_expr, sub_material_index
+_SET_MATERIAL_PROPERTY_TEMPLATE = """(
+    obj = getNodeByName "{safe}"
+    if obj == undefined then (
+        "Object not found: {safe}"
+    ) else if obj.material == undefined then (
+        "No material assigned to {safe}"
+    ) else (
+        mat = {mat_expr}
+        if mat == undefined then (
+            "Error: Sub-material index {sub_material_index} not found on {safe}"
+        ) else (
+            try (
+                {set_expr}
+                readback = ({get_expr}) as string
+                "Set " + mat.name + ".{safe_prop} = " + readback
+            ) catch (
+                "Error setting {safe_prop}: " + (getCurrentException())
             )
-            msg = "Created " + (classof mat) as string + " \\\"" + mat.name + "\\\" and assigned to " + (assignCount as string) + " object(s)"
-            if notFound.count > 0 do msg += " | Not found: " + (notFound as string)
-            msg
-        ) catch (
-            "Error: " + (getCurrentException())
         )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+    )
+)"""
+
+
+@lru_cache(maxsize=256)
+def _set_material_property_maxscript(
+    name: str,
+    property: str,
+    value: str,
+    sub_material_index: int = 0,
+) -> str:
+    """Build the minified set_material_property fallback script.
+
+    Memoized on the arguments: retried and repeated calls reuse the finished
+    script, skipping the minify pass that dominates the build.
+    """
+    mat_expr = f"obj.material[{sub_material_index}]" if sub_material_index > 0 else "obj.material"
+    value = safe_value(value)
+    if "." in property:
+        # setProperty takes one name; nested paths need member access
+        set_expr, get_expr = f"mat.{property} = ({value})", f"mat.{property}"
+    else:
+        prop_name = f"#'{safe_name(property)}'"
+        set_expr, get_expr = f"setProperty mat {prop_name} ({value})", f"getProperty mat {prop_name}"
+    return minify_maxscript(_SET_MATERIAL_PROPERTY_TEMPLATE.format(
+        safe=safe_string(name), safe_prop=safe_string(property), set_expr=set_expr, get_expr=get_expr,
+        mat_expr=mat_expr, sub_material_index=sub_material_index,
+    ))
 
 
 @mcp.tool()
@@ -906,8 +1292,14 @@ def set_material_property(
     property: str,
     value: str,
     sub_material_index: int = 0,
+    await_result: bool = True,
 ) -> str:
-    """Set a property on an object's material (or sub-material)."""
+    """Set a property on an object's material (or sub-material).
+
+    With await_result=False the command is queued and the call returns at
+    once; wait_for_queued_commands reports any failures.
+    """
+    invalidate_inspect_cache()
     if client.native_available:
         payload = {
             "name": name,
@@ -915,42 +1307,103 @@ def set_material_property(
             "value": value,
             "sub_material_index": sub_material_index,
         }
-        response = client.send_command(json.dumps(payload), cmd_type="native:set_material_property")
-        return response.get("result", "")
+        return _send_or_queue(json.dumps(payload), "native:set_material_property", await_result)
 
-    safe = safe_string(name)
-    safe_prop = safe_string(property)
+    maxscript = _set_material_property_maxscript(name, property, value, sub_material_index)
+    return _send_or_queue(maxscript, "maxscript", await_result)
 
-    if sub_material_index > 0:
-        mat_expr = f"obj.material[{sub_material_index}]"
-        mat_label = f"sub-material [{sub_material_index}]"
-    else:
-        mat_expr = "obj.material"
-        mat_label = "material"
 
-    maxscript = f"""(
-        obj = getNodeByName "{safe}"
-        if obj == undefined then (
-            "Object not found: {safe}"
-        ) else if obj.material == undefined then (
-            "No material assigned to {safe}"
+def _guarded_values(values: Iterable[str], start: int = 1) -> str:
+    """Render value expressions as propVals elements that cannot abort the script.
+
+    Each value is evaluated in its own try. A failure leaves its element
+    undefined and records the error at the same index of valErrs (counting
+    from *start*), which the property loop reports against that property alone.
+    """
+    return ", ".join(
+        f"(try ({safe_value(val)}) catch (valErrs[{i}] = getCurrentException(); undefined))"
+        for i, val in enumerate(values, start=start)
+    )
+
+
+def _dotted_property_lines(target: str, items: Sequence[tuple[str, str]]) -> str:
+    """Assign nested property paths (``coords.U_Tiling``) by member access.
+
+    setProperty takes a single name, so these stay one try each after the
+    name/value loop, adding to the same okList/errList.
+    """
+    return "".join(
+        f"\n            try ({target}.{prop} = ({safe_value(val)}); okCount += 1; "
+        f'okList[okCount] = "{safe_string(prop)}") '
+        f'catch (append errList #("{safe_string(prop)}", getCurrentException()))'
+        for prop, val in items
+    )
+
+
+def _split_dotted(items: Iterable[tuple[str, str]]) -> tuple[list, list]:
+    """Split (property, value) pairs into plain names and dotted paths."""
+    plain, dotted = [], []
+    for item in items:
+        (dotted if "." in item[0] else plain).append(item)
+    return plain, dotted
+
+
+# set_material_properties fallback; placeholders: safe, mat_expr,
+# sub_material_index, prop_names, prop_values, dotted_lines
+_SET_MATERIAL_PROPERTIES_TEMPLATE = """(
+    obj = getNodeByName "{safe}"
+    if obj == undefined then (
+        "Object not found: {safe}"
+    ) else if obj.material == undefined then (
+        "No material assigned to {safe}"
+    ) else (
+        mat = {mat_expr}
+        if mat == undefined then (
+            "Error: Sub-material index {sub_material_index} not found on {safe}"
         ) else (
-            mat = {mat_expr}
-            if mat == undefined then (
-                "Sub-material index {sub_material_index} not found on {safe}"
-            ) else (
-                try (
-                    mat.{safe_prop} = {safe_value(value)}
-                    readback = (getproperty mat #{safe_prop}) as string
-                    "Set " + mat.name + ".{safe_prop} = " + readback
-                ) catch (
-                    "Error setting {safe_prop}: " + (getCurrentException())
-                )
-            )
+            okList = #()
+            errList = #()
+            valErrs = #()
+            propNames = #({prop_names})
+            propVals = #({prop_values})
+            valErrs.count = propNames.count
+            -- Sized once for the best case, trimmed to the successes afterwards
+            okList.count = propNames.count
+            okCount = 0
+            for i = 1 to propNames.count do (
+                if valErrs[i] != undefined then append errList #(propNames[i], valErrs[i])
+                else try (setProperty mat propNames[i] propVals[i]; okCount += 1; okList[okCount] = propNames[i])
+                catch (append errList #(propNames[i], getCurrentException()))
+            ){dotted_lines}
+            okList.count = okCount
+            ss = stringStream ""
+            format "Set % properties on %" okList.count mat.name to:ss
+            for i = 1 to okList.count do format (if i == 1 then ": %" else ", %") okList[i] to:ss
+            for i = 1 to errList.count do format (if i == 1 then " | Errors: %: %" else "; %: %") errList[i][1] errList[i][2] to:ss
+            ss as string
         )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+    )
+)"""
+
+
+def _set_material_properties_maxscript(
+    name: str,
+    properties: dict[str, str],
+    sub_material_index: int = 0,
+) -> str:
+    """Build the set_material_properties fallback script."""
+    mat_expr = f"obj.material[{sub_material_index}]" if sub_material_index > 0 else "obj.material"
+
+    # Names and values go out as two parallel arrays walked by one loop, so
+    # the script grows by one array element per property, not one try block
+    plain, dotted = _split_dotted(properties.items())
+    prop_names = ", ".join(f"#'{safe_name(prop)}'" for prop, _ in plain)
+    prop_values = _guarded_values(val for _, val in plain)
+
+    return _SET_MATERIAL_PROPERTIES_TEMPLATE.format(
+        safe=safe_string(name), mat_expr=mat_expr, sub_material_index=sub_material_index,
+        prop_names=prop_names, prop_values=prop_values, dotted_lines=_dotted_property_lines("mat", dotted),
+    )
 
 
 @mcp.tool()
@@ -958,69 +1411,202 @@ def set_material_properties(
     name: str,
     properties: dict[str, str],
     sub_material_index: int = 0,
+    await_result: bool = True,
 ) -> str:
-    """Set multiple properties on an object's material in a single call."""
+    """Set multiple properties on an object's material in a single call.
+
+    With await_result=False the command is queued and the call returns at
+    once; wait_for_queued_commands reports any failures.
+    """
+    if not properties:
+        return "No properties given"
+    if len(properties) == 1:
+        # The single-property script is half the size and skips the
+        # ok/error list bookkeeping
+        ((prop, value),) = properties.items()
+        return set_material_property(name, prop, value, sub_material_index, await_result)
+
+    invalidate_inspect_cache()
     if client.native_available:
         payload = {
             "name": name,
             "properties": properties,
             "sub_material_index": sub_material_index,
         }
-        response = client.send_command(json.dumps(payload), cmd_type="native:set_material_properties")
-        return response.get("result", "")
+        return _send_or_queue(json.dumps(payload), "native:set_material_properties", await_result)
 
-    safe = safe_string(name)
+    maxscript = _set_material_properties_maxscript(name, properties, sub_material_index)
+    return _send_or_queue(minify_maxscript(maxscript), "maxscript", await_result)
 
-    if sub_material_index > 0:
-        mat_expr = f"obj.material[{sub_material_index}]"
-    else:
-        mat_expr = "obj.material"
 
-    # Build the property-setting lines
-    set_lines = []
-    for prop, val in properties.items():
-        safe_prop = safe_string(prop)
-        set_lines.append(
-            f'try (mat.{safe_prop} = {safe_value(val)}; append okList "{safe_prop}") '
-            f'catch (append errList ("{safe_prop}: " + (getCurrentException())))'
+# get_material_slots fallback; placeholders: safe, mat_expr,
+# sub_material_index, include_vals, max_slots
+_GET_MATERIAL_SLOTS_TEMPLATE = """(
+    local esc = MCP_Server.escapeJsonString
+
+    fn toJsonNameArray arr = (
+        local out = "["
+        local q = (bit.intAsChar 34)
+        for i = 1 to arr.count do (
+            if i > 1 do out += ","
+            out += q + (esc arr[i]) + q
         )
-    set_block = "\n            ".join(set_lines)
+        out += "]"
+        out
+    )
 
-    maxscript = f"""(
-        obj = getNodeByName "{safe}"
-        if obj == undefined then (
-            "Object not found: {safe}"
-        ) else if obj.material == undefined then (
-            "No material assigned to {safe}"
+    fn toJsonPairArray names vals = (
+        local out = "["
+        local q = (bit.intAsChar 34)
+        local lb = (bit.intAsChar 123)
+        local rb = (bit.intAsChar 125)
+        local lim = amin #(names.count, vals.count)
+        for i = 1 to lim do (
+            if i > 1 do out += ","
+            out += lb + q + "name" + q + ":" + q + (esc names[i]) + q + "," + q + "value" + q + ":" + q + (esc vals[i]) + q + rb
+        )
+        out += "]"
+        out
+    )
+
+    fn classifyDeclType decl = (
+        local d = toLower decl
+        if (findString d "texturemap") != undefined or (findString d "texmap") != undefined then "map"
+        else if (findString d "color") != undefined then "color"
+        else if (findString d "bool") != undefined then "bool"
+        else if (findString d "float") != undefined or (findString d "integer") != undefined or (findString d "double") != undefined or (findString d "worldunits") != undefined or (findString d "percent") != undefined then "numeric"
+        else "other"
+    )
+
+    local obj = getNodeByName "{safe}"
+    if obj == undefined then (
+        "{{\\"error\\":\\"Object not found: {safe}\\"}}"
+    ) else if obj.material == undefined then (
+        "{{\\"error\\":\\"No material assigned to {safe}\\"}}"
+    ) else (
+        local mat = {mat_expr}
+        if mat == undefined then (
+            "{{\\"error\\":\\"Sub-material index {sub_material_index} not found on {safe}\\"}}"
         ) else (
-            mat = {mat_expr}
-            if mat == undefined then (
-                "Sub-material index {sub_material_index} not found on {safe}"
-            ) else (
-                okList = #()
-                errList = #()
-                {set_block}
-                msg = "Set " + (okList.count as string) + " properties on " + mat.name
-                if okList.count > 0 do (
-                    msg += ": "
-                    for i = 1 to okList.count do (
-                        if i > 1 do msg += ", "
-                        msg += okList[i]
+            local includeValues = {include_vals}
+            local maxSlots = {max_slots}
+            local subIdx = {sub_material_index}
+
+            local props = #()
+            try (props = makeUniqueArray (getPropNames mat)) catch ()
+
+            -- Build declared type map from showProperties output
+            local typeNames = #()
+            local typeVals = #()
+            try (
+                local ss = stringstream ""
+                showProperties mat to:ss
+                seek ss 0
+                while not (eof ss) do (
+                    local ln = readline ss
+                    local chunks = filterString ln ":"
+                    if chunks.count >= 2 do (
+                        local lhs = trimRight chunks[1]
+                        local rhs = trimLeft chunks[2]
+                        local lhsParts = filterString lhs ". "
+                        if lhsParts.count >= 1 do (
+                            local pnm = toLower lhsParts[lhsParts.count]
+                            append typeNames pnm
+                            append typeVals rhs
+                        )
                     )
                 )
-                if errList.count > 0 do (
-                    msg += " | Errors: "
-                    for i = 1 to errList.count do (
-                        if i > 1 do msg += "; "
-                        msg += errList[i]
+            ) catch ()
+
+            fn getDeclType pname tNames tVals = (
+                local idx = findItem tNames (toLower pname)
+                if idx != 0 then tVals[idx] else ""
+            )
+
+            local mapNames = #();     local mapVals = #()
+            local colorNames = #();   local colorVals = #()
+            local numNames = #();     local numVals = #()
+            local boolNames = #();    local boolVals = #()
+            local otherNames = #();   local otherVals = #()
+
+            local scanned = 0
+            for p in props while scanned < maxSlots do (
+                local pname = p as string
+                if pname == "materialList" or pname == "maps" then continue
+
+                local val = undefined
+                local ok = true
+                try (val = getProperty mat p) catch (ok = false)
+                if not ok then continue
+
+                local decl = getDeclType pname typeNames typeVals
+                local cls = classifyDeclType decl
+                local rt = try ((classOf val) as string) catch "undefined"
+                local valStr = try (val as string) catch ""
+
+                if valStr.count > 120 do valStr = (substring valStr 1 120) + "..."
+
+                -- Fallback map detection for undeclared cases
+                local pnameL = toLower pname
+                if cls == "other" and ((matchPattern pnameL pattern:"*_map*" ignoreCase:true) or (matchPattern pnameL pattern:"*_shader*" ignoreCase:true) or ((findString (toLower rt) "texture") != undefined)) do cls = "map"
+
+                case cls of (
+                    "map": (
+                        append mapNames pname
+                        append mapVals valStr
+                    )
+                    "color": (
+                        append colorNames pname
+                        append colorVals valStr
+                    )
+                    "numeric": (
+                        append numNames pname
+                        append numVals valStr
+                    )
+                    "bool": (
+                        append boolNames pname
+                        append boolVals valStr
+                    )
+                    default: (
+                        append otherNames pname
+                        append otherVals valStr
                     )
                 )
-                msg
+                scanned += 1
+            )
+
+            local result = "{{"
+            result += "\\"name\\":\\"" + (esc mat.name) + "\\","
+            result += "\\"class\\":\\"" + (esc ((classOf mat) as string)) + "\\","
+            result += "\\"subMaterialIndex\\":" + (subIdx as string) + ","
+            result += "\\"inspectedCount\\":" + (scanned as string) + ","
+            result += "\\"counts\\":{{"
+            result += "\\"map\\":" + (mapNames.count as string) + ","
+            result += "\\"color\\":" + (colorNames.count as string) + ","
+            result += "\\"numeric\\":" + (numNames.count as string) + ","
+            result += "\\"bool\\":" + (boolNames.count as string) + ","
+            result += "\\"other\\":" + (otherNames.count as string)
+            result += "}},"
+
+            if includeValues then (
+                result += "\\"mapSlots\\":" + (toJsonPairArray mapNames mapVals) + ","
+                result += "\\"colorSlots\\":" + (toJsonPairArray colorNames colorVals) + ","
+                result += "\\"numericSlots\\":" + (toJsonPairArray numNames numVals) + ","
+                result += "\\"boolSlots\\":" + (toJsonPairArray boolNames boolVals) + ","
+                result += "\\"otherSlots\\":" + (toJsonPairArray otherNames otherVals)
+            ) else (
+                result += "\\"mapSlots\\":" + (toJsonNameArray mapNames) + ","
+                result += "\\"colorSlots\\":" + (toJsonNameArray colorNames) + ","
+                result += "\\"numericSlots\\":" + (toJsonNameArray numNames) + ","
+                result += "\\"boolSlots\\":" + (toJsonNameArray boolNames) + ","
+                result += "\\"otherSlots\\":" + (toJsonNameArray otherNames)
             )
+
+            result += "}}"
+            result
         )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+    )
+)"""
 
 
 @mcp.tool()
@@ -1071,173 +1657,11 @@ def get_material_slots(
     else:
         mat_expr = "obj.material"
 
-    maxscript = f"""(
-        local esc = MCP_Server.escapeJsonString
-
-        fn toJsonNameArray arr = (
-            local out = "["
-            local q = (bit.intAsChar 34)
-            for i = 1 to arr.count do (
-                if i > 1 do out += ","
-                out += q + (esc arr[i]) + q
-            )
-            out += "]"
-            out
-        )
-
-        fn toJsonPairArray names vals = (
-            local out = "["
-            local q = (bit.intAsChar 34)
-            local lb = (bit.intAsChar 123)
-            local rb = (bit.intAsChar 125)
-            local lim = amin #(names.count, vals.count)
-            for i = 1 to lim do (
-                if i > 1 do out += ","
-                out += lb + q + "name" + q + ":" + q + (esc names[i]) + q + "," + q + "value" + q + ":" + q + (esc vals[i]) + q + rb
-            )
-            out += "]"
-            out
-        )
-
-        fn classifyDeclType decl = (
-            local d = toLower decl
-            if (findString d "texturemap") != undefined or (findString d "texmap") != undefined then "map"
-            else if (findString d "color") != undefined then "color"
-            else if (findString d "bool") != undefined then "bool"
-            else if (findString d "float") != undefined or (findString d "integer") != undefined or (findString d "double") != undefined or (findString d "worldunits") != undefined or (findString d "percent") != undefined then "numeric"
-            else "other"
-        )
-
-        local obj = getNodeByName "{safe}"
-        if obj == undefined then (
-            "{{\\"error\\":\\"Object not found: {safe}\\"}}"
-        ) else if obj.material == undefined then (
-            "{{\\"error\\":\\"No material assigned to {safe}\\"}}"
-        ) else (
-            local mat = {mat_expr}
-            if mat == undefined then (
-                "{{\\"error\\":\\"Sub-material index {sub_material_index} not found on {safe}\\"}}"
-            ) else (
-                local includeValues = {include_vals}
-                local maxSlots = {max_slots}
-                local subIdx = {sub_material_index}
-
-                local props = #()
-                try (props = makeUniqueArray (getPropNames mat)) catch ()
-
-                -- Build declared type map from showProperties output
-                local typeNames = #()
-                local typeVals = #()
-                try (
-                    local ss = stringstream ""
-                    showProperties mat to:ss
-                    seek ss 0
-                    while not (eof ss) do (
-                        local ln = readline ss
-                        local chunks = filterString ln ":"
-                        if chunks.count >= 2 do (
-                            local lhs = trimRight chunks[1]
-                            local rhs = trimLeft chunks[2]
-                            local lhsParts = filterString lhs ". "
-                            if lhsParts.count >= 1 do (
-                                local pnm = toLower lhsParts[lhsParts.count]
-                                append typeNames pnm
-                                append typeVals rhs
-                            )
-                        )
-                    )
-                ) catch ()
-
-                fn getDeclType pname tNames tVals = (
-                    local idx = findItem tNames (toLower pname)
-                    if idx != 0 then tVals[idx] else ""
-                )
-
-                local mapNames = #();     local mapVals = #()
-                local colorNames = #();   local colorVals = #()
-                local numNames = #();     local numVals = #()
-                local boolNames = #();    local boolVals = #()
-                local otherNames = #();   local otherVals = #()
-
-                local scanned = 0
-                for p in props while scanned < maxSlots do (
-                    local pname = p as string
-                    if pname == "materialList" or pname == "maps" then continue
-
-                    local val = undefined
-                    local ok = true
-                    try (val = getProperty mat p) catch (ok = false)
-                    if not ok then continue
-
-                    local decl = getDeclType pname typeNames typeVals
-                    local cls = classifyDeclType decl
-                    local rt = try ((classOf val) as string) catch "undefined"
-                    local valStr = try (val as string) catch ""
-
-                    if valStr.count > 120 do valStr = (substring valStr 1 120) + "..."
-
-                    -- Fallback map detection for undeclared cases
-                    local pnameL = toLower pname
-                    if cls == "other" and ((matchPattern pnameL pattern:"*_map*" ignoreCase:true) or (matchPattern pnameL pattern:"*_shader*" ignoreCase:true) or ((findString (toLower rt) "texture") != undefined)) do cls = "map"
-
-                    case cls of (
-                        "map": (
-                            append mapNames pname
-                            append mapVals valStr
-                        )
-                        "color": (
-                            append colorNames pname
-                            append colorVals valStr
-                        )
-                        "numeric": (
-                            append numNames pname
-                            append numVals valStr
-                        )
-                        "bool": (
-                            append boolNames pname
-                            append boolVals valStr
-                        )
-                        default: (
-                            append otherNames pname
-                            append otherVals valStr
-                        )
-                    )
-                    scanned += 1
-                )
-
-                local result = "{{"
-                result += "\\"name\\":\\"" + (esc mat.name) + "\\","
-                result += "\\"class\\":\\"" + (esc ((classOf mat) as string)) + "\\","
-                result += "\\"subMaterialIndex\\":" + (subIdx as string) + ","
-                result += "\\"inspectedCount\\":" + (scanned as string) + ","
-                result += "\\"counts\\":{{"
-                result += "\\"map\\":" + (mapNames.count as string) + ","
-                result += "\\"color\\":" + (colorNames.count as string) + ","
-                result += "\\"numeric\\":" + (numNames.count as string) + ","
-                result += "\\"bool\\":" + (boolNames.count as string) + ","
-                result += "\\"other\\":" + (otherNames.count as string)
-                result += "}},"
-
-                if includeValues then (
-                    result += "\\"mapSlots\\":" + (toJsonPairArray mapNames mapVals) + ","
-                    result += "\\"colorSlots\\":" + (toJsonPairArray colorNames colorVals) + ","
-                    result += "\\"numericSlots\\":" + (toJsonPairArray numNames numVals) + ","
-                    result += "\\"boolSlots\\":" + (toJsonPairArray boolNames boolVals) + ","
-                    result += "\\"otherSlots\\":" + (toJsonPairArray otherNames otherVals)
-                ) else (
-                    result += "\\"mapSlots\\":" + (toJsonNameArray mapNames) + ","
-                    result += "\\"colorSlots\\":" + (toJsonNameArray colorNames) + ","
-                    result += "\\"numericSlots\\":" + (toJsonNameArray numNames) + ","
-                    result += "\\"boolSlots\\":" + (toJsonNameArray boolNames) + ","
-                    result += "\\"otherSlots\\":" + (toJsonNameArray otherNames)
-                )
-
-                result += "}}"
-                result
-            )
-        )
-    )"""
-    response = client.send_command(maxscript, timeout=45.0)
+    maxscript = _GET_MATERIAL_SLOTS_TEMPLATE.format(
+        safe=safe, mat_expr=mat_expr, sub_material_index=sub_material_index,
+        include_vals=include_vals, max_slots=max_slots,
+    )
+    response = client.send_command(minify_maxscript(maxscript), timeout=45.0)
     raw = response.get("result", "")
     if not raw:
         return raw
@@ -1282,6 +1706,165 @@ def get_material_slots(
     return json.dumps(compact, separators=(",", ":"))
 
 
+# set_sub_materials script; placeholders: safe, slot_lines. Slots are filled
+# in order, so a slot may reference one created earlier in the same batch.
+_SET_SUB_MATERIALS_TEMPLATE = """(
+    obj = getNodeByName "{safe}"
+    if obj == undefined then "Object not found: {safe}"
+    else if obj.material == undefined then "No material on {safe}"
+    else if (classof obj.material) != Multimaterial then "Material is not Multimaterial"
+    else (
+        mm = obj.material
+        ss = stringStream ""
+        {slot_lines}
+        ss as string
+    )
+)"""
+
+# One set_sub_materials slot; placeholders: index, material_class,
+# name_param, params (new material) or index, source_index (shared slot)
+_SUB_MATERIAL_NEW_LINE = (
+    'try (m = {material_class}{name_param} {params}; mm.materialList[{index}] = m; '
+    'format "Sub[{index}] = % (%)\\n" m.name (classof m) to:ss) '
+    'catch (format "Sub[{index}] error: %\\n" (getCurrentException()) to:ss)'
+)
+_SUB_MATERIAL_REF_LINE = (
+    'try (m = mm.materialList[{source_index}]; '
+    'if m == undefined then format "Sub[{index}]: source slot {source_index} is empty\\n" to:ss '
+    'else (mm.materialList[{index}] = m; '
+    'format "Sub[{index}] = Sub[{source_index}] (%) — shared reference\\n" m.name to:ss)) '
+    'catch (format "Sub[{index}] error: %\\n" (getCurrentException()) to:ss)'
+)
+
+
+@mcp.tool()
+def set_sub_materials(name: str, slots: DictList) -> str:
+    """Fill several Multi/Sub-Object slots of one object in a single call.
+
+    Each slot takes the ``set_sub_material`` arguments: ``sub_material_index``
+    plus either ``material_class`` (with optional ``material_name`` and
+    ``params``) or ``source_index``. Returns one line per slot.
+    """
+    if not slots:
+        return "No slots given"
+
+    invalidate_inspect_cache()
+    lines = []
+    for n, slot in enumerate(slots, 1):
+        index = int(slot.get("sub_material_index", 0) or 0)
+        source_index = int(slot.get("source_index", 0) or 0)
+        material_class = slot.get("material_class", "")
+        if index < 1 or not (source_index > 0 or material_class):
+            lines.append(
+                f'format "Slot {n}: needs sub_material_index and material_class or source_index\\n" to:ss'
+            )
+        elif source_index > 0:
+            lines.append(_SUB_MATERIAL_REF_LINE.format(index=index, source_index=source_index))
+        else:
+            material_name = slot.get("material_name", "")
+            name_param = f' name:"{safe_string(material_name)}"' if material_name else ""
+            lines.append(_SUB_MATERIAL_NEW_LINE.format(
+                index=index, material_class=material_class, name_param=name_param,
+                params=slot.get("params", ""),
+            ))
+
+    maxscript = _SET_SUB_MATERIALS_TEMPLATE.format(
+        safe=safe_string(name), slot_lines="\n        ".join(lines),
+    )
+    response = client.send_command(minify_maxscript(maxscript))
+    return response.get("result", "")
+
+
+# Property block of create_texture_map, set_texture_map_properties and
+# write_osl_shader; placeholders:
+# global_var, prop_names, prop_values, dotted_lines. Only emitted when there are
+# properties, together with _GLOBAL_PROPERTY_STATUS.
+_GLOBAL_PROPERTY_LOOP = """okList = #()
+            errList = #()
+            valErrs = #()
+            propNames = #({prop_names})
+            propVals = #({prop_values})
+            valErrs.count = propNames.count
+            -- Sized once for the best case, trimmed to the successes afterwards
+            okList.count = propNames.count
+            okCount = 0
+            for i = 1 to propNames.count do (
+                if valErrs[i] != undefined then append errList #(propNames[i], valErrs[i])
+                else try (setProperty {global_var} propNames[i] propVals[i]; okCount += 1; okList[okCount] = propNames[i])
+                catch (append errList #(propNames[i], getCurrentException()))
+            ){dotted_lines}
+            okList.count = okCount"""
+
+# Appends the _GLOBAL_PROPERTY_LOOP results to the status stream ss
+_GLOBAL_PROPERTY_STATUS = """for i = 1 to okList.count do format (if i == 1 then " | Set: %" else ", %") okList[i] to:ss
+            for i = 1 to errList.count do format (if i == 1 then " | Errors: %: %" else "; %: %") errList[i][1] errList[i][2] to:ss"""
+
+
+def _global_property_lines(global_var: str, *passes: Mapping[str, str] | None) -> tuple[str, str]:
+    """Render the property loop and status lines for a map global, or two empty strings.
+
+    Properties are applied through setProperty with name literals, one loop
+    over parallel name/value arrays; dotted paths follow the loop. Each pass
+    is appended after the previous one, so a later pass can reach parameters
+    an earlier one exposed (an OSLMap's shader inputs appear once OSLPath is
+    set).
+    """
+    items = [item for props in passes if props for item in props.items()]
+    if not items:
+        return "", ""
+    plain, dotted = _split_dotted(items)
+    prop_names = ", ".join(f"#'{safe_name(prop)}'" for prop, _ in plain)
+    prop_values = _guarded_values(val for _, val in plain)
+    prop_lines = _GLOBAL_PROPERTY_LOOP.format(
+        global_var=global_var, prop_names=prop_names, prop_values=prop_values,
+        dotted_lines=_dotted_property_lines(global_var, dotted),
+    )
+    return prop_lines, _GLOBAL_PROPERTY_STATUS
+
+
+# create_texture_map fallback; placeholders: global_var, map_class, name_param,
+# params, prop_lines, prop_status
+_CREATE_TEXTURE_MAP_TEMPLATE = """(
+    try (
+        global {global_var} = {map_class}{name_param} {params}
+        {prop_lines}
+        ss = stringStream ""
+        format "Created %" (classof {global_var}) to:ss
+        if {global_var}.name != undefined do format " \\\"%\\\"" {global_var}.name to:ss
+        format " as global '{global_var}'" to:ss
+        {prop_status}
+        ss as string
+    ) catch (
+        "Error: " + (getCurrentException())
+    )
+)"""
+
+
+def _create_texture_map_maxscript(
+    map_class: str,
+    map_name: str = "",
+    params: str = "",
+    properties: dict[str, str] | None = None,
+    global_var: str = "",
+    post_properties: dict[str, str] | None = None,
+) -> str:
+    """Build the create_texture_map fallback script."""
+    safe_map_name = safe_string(map_name)
+    name_param = f' name:"{safe_map_name}"' if map_name else ""
+
+    # Generate global var name if not provided
+    if not global_var:
+        base = map_name if map_name else map_class
+        global_var = _maxscript_identifier(base)
+
+    prop_lines, prop_status = _global_property_lines(global_var, properties, post_properties)
+
+    return _CREATE_TEXTURE_MAP_TEMPLATE.format(
+        global_var=global_var, map_class=map_class, name_param=name_param, params=params,
+        prop_lines=prop_lines, prop_status=prop_status,
+    )
+
+
 @mcp.tool()
 def create_texture_map(
     map_class: str,
@@ -1289,9 +1872,18 @@ def create_texture_map(
     params: str = "",
     properties: dict[str, str] | None = None,
     global_var: str = "",
+    post_properties: dict[str, str] | None = None,
 ) -> str:
-    """Create a texture map and store it as a MAXScript global variable."""
-    if client.native_available:
+    """Create a texture map and store it as a MAXScript global variable.
+
+    post_properties are set after properties in the same round trip, so an
+    OSLMap can be given OSLPath in properties and its exposed shader inputs
+    in post_properties without a follow-up set_texture_map_properties call.
+    """
+    invalidate_inspect_cache()
+    # The shipped bridge binaries predate post_properties and would drop them,
+    # so those calls take the MAXScript path
+    if client.native_available and not post_properties:
         payload = {
             "map_class": map_class,
             "map_name": map_name,
@@ -1302,102 +1894,130 @@ def create_texture_map(
         response = client.send_command(json.dumps(payload), cmd_type="native:create_texture_map")
         return response.get("result", "")
 
-    safe_map_name = safe_string(map_name)
-    name_param = f' name:"{safe_map_name}"' if map_name else ""
+    maxscript = _create_texture_map_maxscript(
+        map_class, map_name, params, properties, global_var, post_properties,
+    )
+    response = client.send_command(minify_maxscript(maxscript))
+    return response.get("result", "")
 
-    # Generate global var name if not provided
-    if not global_var:
-        base = map_name if map_name else map_class
-        # Clean to valid MAXScript identifier
-        global_var = "".join(c if c.isalnum() or c == "_" else "_" for c in base)
-        if global_var[0].isdigit():
-            global_var = "m_" + global_var
-
-    # Build property-setting lines
-    prop_lines = ""
-    if properties:
-        lines = []
-        for prop, val in properties.items():
-            safe_prop = safe_string(prop)
-            lines.append(
-                f'try (global {global_var} ; {global_var}.{safe_prop} = {safe_value(val)}; '
-                f'append okList "{safe_prop}") '
-                f'catch (append errList ("{safe_prop}: " + (getCurrentException())))'
-            )
-        prop_lines = "\n            ".join(lines)
 
-    maxscript = f"""(
-        try (
-            global {global_var} = {map_class}{name_param} {params}
-            okList = #()
-            errList = #()
-            {"" if not prop_lines else prop_lines}
-            msg = "Created " + (classof {global_var}) as string
-            if {global_var}.name != undefined do msg += " \\\"" + {global_var}.name + "\\\""
-            msg += " as global '{global_var}'"
-            if okList.count > 0 do (
-                msg += " | Set: "
-                for i = 1 to okList.count do (if i > 1 do msg += ", "; msg += okList[i])
-            )
-            if errList.count > 0 do (
-                msg += " | Errors: "
-                for i = 1 to errList.count do (if i > 1 do msg += "; "; msg += errList[i])
-            )
-            msg
-        ) catch (
-            "Error: " + (getCurrentException())
+# set_texture_map_properties fallback; placeholders: global_var, prop_lines
+_SET_TEXTURE_MAP_PROPERTIES_TEMPLATE = """(
+    try (
+        global {global_var}
+        if {global_var} == undefined then (
+            "Error: global '{global_var}' not found"
+        ) else (
+            {prop_lines}
+            ss = stringStream ""
+            format "Set % properties on %" okList.count {global_var}.name to:ss
+            for i = 1 to okList.count do format (if i == 1 then ": %" else ", %") okList[i] to:ss
+            for i = 1 to errList.count do format (if i == 1 then " | Errors: %: %" else "; %: %") errList[i][1] errList[i][2] to:ss
+            ss as string
         )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+    ) catch (
+        "Error: " + (getCurrentException())
+    )
+)"""
+
+
+def _set_texture_map_properties_maxscript(global_var: str, properties: dict[str, str]) -> str:
+    """Build the set_texture_map_properties fallback script."""
+    # Same name/value arrays and single loop as create_texture_map; this
+    # template formats its own status line
+    prop_lines, _ = _global_property_lines(global_var, properties)
+    return _SET_TEXTURE_MAP_PROPERTIES_TEMPLATE.format(global_var=global_var, prop_lines=prop_lines)
 
 
 @mcp.tool()
 def set_texture_map_properties(
     global_var: str,
     properties: dict[str, str],
+    await_result: bool = True,
 ) -> str:
-    """Set properties on a texture map stored as a MAXScript global variable."""
+    """Set properties on a texture map stored as a MAXScript global variable.
+
+    With await_result=False the command is queued and the call returns at
+    once; wait_for_queued_commands reports any failures.
+    """
+    if not properties:
+        return "No properties given"
+
+    invalidate_inspect_cache()
     if client.native_available:
         payload = json.dumps({"global_var": global_var, "properties": properties})
-        response = client.send_command(payload, cmd_type="native:set_texture_map_properties")
-        return response.get("result", "")
+        return _send_or_queue(payload, "native:set_texture_map_properties", await_result)
 
-    lines = []
-    for prop, val in properties.items():
-        safe_prop = safe_string(prop)
-        lines.append(
-            f'try ({global_var}.{safe_prop} = {val}; append okList "{safe_prop}") '
-            f'catch (append errList ("{safe_prop}: " + (getCurrentException())))'
-        )
-    set_block = "\n            ".join(lines)
+    maxscript = _set_texture_map_properties_maxscript(global_var, properties)
+    return _send_or_queue(minify_maxscript(maxscript), "maxscript", await_result)
 
-    maxscript = f"""(
+
+# set_sub_material fallback pointing the slot at another slot's material;
+# placeholders: safe, source_index, sub_material_index
+_SET_SUB_MATERIAL_REF_TEMPLATE = """(
+    obj = getNodeByName "{safe}"
+    if obj == undefined then "Object not found: {safe}"
+    else if obj.material == undefined then "No material on {safe}"
+    else if (classof obj.material) != Multimaterial then "Material is not Multimaterial"
+    else (
         try (
-            global {global_var}
-            if {global_var} == undefined then (
-                "Error: global '{global_var}' not found"
-            ) else (
-                okList = #()
-                errList = #()
-                {set_block}
-                msg = "Set " + (okList.count as string) + " properties on " + {global_var}.name
-                if okList.count > 0 do (
-                    msg += ": "
-                    for i = 1 to okList.count do (if i > 1 do msg += ", "; msg += okList[i])
-                )
-                if errList.count > 0 do (
-                    msg += " | Errors: "
-                    for i = 1 to errList.count do (if i > 1 do msg += "; "; msg += errList[i])
-                )
-                msg
+            srcMat = obj.material.materialList[{source_index}]
+            if srcMat == undefined then "Source slot {source_index} is empty"
+            else (
+                obj.material.materialList[{sub_material_index}] = srcMat
+                "Sub[{sub_material_index}] = Sub[{source_index}] (" + srcMat.name + ") — shared reference"
             )
-        ) catch (
-            "Error: " + (getCurrentException())
+        ) catch ("Error: " + (getCurrentException()))
+    )
+)"""
+
+
+# set_sub_material fallback creating a new material in the slot; placeholders:
+# safe, material_class, name_param, params, sub_material_index
+_SET_SUB_MATERIAL_NEW_TEMPLATE = """(
+    obj = getNodeByName "{safe}"
+    if obj == undefined then "Object not found: {safe}"
+    else if obj.material == undefined then "No material on {safe}"
+    else if (classof obj.material) != Multimaterial then "Material is not Multimaterial"
+    else (
+        try (
+            newMat = {material_class}{name_param} {params}
+            obj.material.materialList[{sub_material_index}] = newMat
+            "Sub[{sub_material_index}] = " + newMat.name + " (" + (classof newMat) as string + ")"
+        ) catch ("Error: " + (getCurrentException()))
+    )
+)"""
+
+
+@lru_cache(maxsize=256)
+def _set_sub_material_maxscript(
+    name: str,
+    sub_material_index: int,
+    material_class: str = "",
+    material_name: str = "",
+    params: str = "",
+    source_index: int = 0,
+) -> str:
+    """Build the minified set_sub_material fallback script.
+
+    Memoized like _set_material_property_maxscript.
+    """
+    safe = safe_string(name)
+    safe_mat_name = safe_string(material_name)
+    name_param = f' name:"{safe_mat_name}"' if material_name else ""
+
+    if source_index > 0:
+        # Reference from another slot
+        maxscript = _SET_SUB_MATERIAL_REF_TEMPLATE.format(
+            safe=safe, source_index=source_index, sub_material_index=sub_material_index,
         )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+    else:
+        # Create new material at slot
+        maxscript = _SET_SUB_MATERIAL_NEW_TEMPLATE.format(
+            safe=safe, material_class=material_class, name_param=name_param, params=params,
+            sub_material_index=sub_material_index,
+        )
+    return minify_maxscript(maxscript)
 
 
 @mcp.tool()
@@ -1410,6 +2030,7 @@ def set_sub_material(
     source_index: int = 0,
 ) -> str:
     """Create or assign a sub-material in a Multi/Sub-Object material slot."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = {
             "name": name,
@@ -1422,47 +2043,62 @@ def set_sub_material(
         response = client.send_command(json.dumps(payload), cmd_type="native:set_sub_material")
         return response.get("result", "")
 
-    safe = safe_string(name)
-    safe_mat_name = safe_string(material_name)
-    name_param = f' name:"{safe_mat_name}"' if material_name else ""
-
-    if source_index > 0:
-        # Reference from another slot
-        maxscript = f"""(
-            obj = getNodeByName "{safe}"
-            if obj == undefined then "Object not found: {safe}"
-            else if obj.material == undefined then "No material on {safe}"
-            else if (classof obj.material) != Multimaterial then "Material is not Multimaterial"
-            else (
-                try (
-                    srcMat = obj.material.materialList[{source_index}]
-                    if srcMat == undefined then "Source slot {source_index} is empty"
-                    else (
-                        obj.material.materialList[{sub_material_index}] = srcMat
-                        "Sub[{sub_material_index}] = Sub[{source_index}] (" + srcMat.name + ") — shared reference"
-                    )
-                ) catch ("Error: " + (getCurrentException()))
-            )
-        )"""
-    else:
-        # Create new material at slot
-        maxscript = f"""(
-            obj = getNodeByName "{safe}"
-            if obj == undefined then "Object not found: {safe}"
-            else if obj.material == undefined then "No material on {safe}"
-            else if (classof obj.material) != Multimaterial then "Material is not Multimaterial"
-            else (
-                try (
-                    newMat = {material_class}{name_param} {params}
-                    obj.material.materialList[{sub_material_index}] = newMat
-                    "Sub[{sub_material_index}] = " + newMat.name + " (" + (classof newMat) as string + ")"
-                ) catch ("Error: " + (getCurrentException()))
-            )
-        )"""
+    maxscript = _set_sub_material_maxscript(
+        name, sub_material_index, material_class, material_name, params, source_index,
+    )
     response = client.send_command(maxscript)
     return response.get("result", "")
 
 
+# Shader files written by write_osl_shader; the same %TEMP%\\osl_shaders folder
+# the native handler writes to
+_OSL_SHADER_DIR = os.path.join(tempfile.gettempdir(), "osl_shaders")
+
+
+def _osl_filename(shader_name: str) -> str:
+    """File name for a shader inside _OSL_SHADER_DIR.
+
+    Separators are replaced and leading/trailing dots dropped, so names like
+    "../x" or ".." cannot leave the folder.
+    """
+    stem = _sanitize_filename(shader_name).strip(". ")
+    return f"{stem or 'shader'}.osl"
+
+
+def _escape_osl(code: str) -> str:
+    """Escape OSL source for embedding in a MAXScript "..." literal.
+
+    Chained str.replace calls are C scans that skip absent characters, and
+    stay well ahead of a translate() table or regex callback on shaders of
+    any size.
+    """
+    return code.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# write_osl_shader fallback; the shader file is already on disk, but OSLMap
+# only compiles source assigned to OSLCode as a string literal, so the code is
+# sent inline as well. placeholders: safe_shader_name, osl_path, safe_osl,
+# global_var, prop_lines, prop_status
+_WRITE_OSL_SHADER_TEMPLATE = """(
+    try (
+        oslPath = "{osl_path}"
+        global {global_var} = OSLMap name:"{safe_shader_name}"
+        {global_var}.OSLCode = "{safe_osl}"
+        {global_var}.OSLAutoUpdate = true
+        {global_var}.OSLPath = oslPath
+
+        {prop_lines}
+
+        ss = stringStream ""
+        format "OSL shader written to % | Global: {global_var}" oslPath to:ss
+        {prop_status}
+        ss as string
+    ) catch (
+        "Error: " + (getCurrentException())
+    )
+)"""
+
+
 @mcp.tool()
 def write_osl_shader(
     shader_name: str,
@@ -1470,11 +2106,14 @@ def write_osl_shader(
     global_var: str = "",
     properties: dict[str, str] | None = None,
 ) -> str:
-    """Write an OSL shader to disk and create an OSLMap from it."""
+    """Write an OSL shader to disk and create an OSLMap from it.
+
+    properties are set after OSLPath in the same script, so the shader's
+    exposed inputs can be filled here instead of with set_texture_map_properties.
+    """
+    invalidate_inspect_cache()
     if not global_var:
-        global_var = "".join(c if c.isalnum() or c == "_" else "_" for c in shader_name)
-        if global_var[0].isdigit():
-            global_var = "m_" + global_var
+        global_var = _maxscript_identifier(shader_name)
 
     if client.native_available:
         payload = {
@@ -1492,99 +2131,108 @@ def write_osl_shader(
         except Exception:
             return raw
 
-    # Escape the OSL code for MAXScript string embedding
-    safe_osl = osl_code.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
-    safe_shader_name = safe_string(shader_name)
+    # Writing the file here saves MAXScript a createFile/format pass over the source
+    osl_path = os.path.join(_OSL_SHADER_DIR, _osl_filename(shader_name))
+    try:
+        os.makedirs(_OSL_SHADER_DIR, exist_ok=True)
+        with open(osl_path, "w", encoding="utf-8", newline="") as f:
+            f.write(osl_code)
+    except OSError as e:
+        return f"Error: could not write {osl_path}: {e}"
+
+    prop_lines, prop_status = _global_property_lines(global_var, properties)
+
+    maxscript = _WRITE_OSL_SHADER_TEMPLATE.format(
+        safe_shader_name=safe_string(shader_name), osl_path=safe_string(osl_path.replace("\\", "/")),
+        safe_osl=_escape_osl(osl_code),
+        global_var=global_var, prop_lines=prop_lines, prop_status=prop_status,
+    )
+    response = client.send_command(minify_maxscript(maxscript))
+    return response.get("result", "")
 
-    # Build property-setting lines
-    prop_lines = ""
-    if properties:
-        lines = []
-        for prop, val in properties.items():
-            safe_prop = safe_string(prop)
-            lines.append(
-                f'try (global {global_var} ; {global_var}.{safe_prop} = {safe_value(val)}; '
-                f'append okList "{safe_prop}") '
-                f'catch (append errList ("{safe_prop}: " + (getCurrentException())))'
-            )
-        prop_lines = "\n            ".join(lines)
 
-    maxscript = f"""(
-        try (
-            oslDir = (getDir #temp) + "\\\\osl_shaders\\\\"
-            makeDir oslDir
-            oslPath = oslDir + "{safe_shader_name}.osl"
-            oslContent = "{safe_osl}"
-            f = createFile oslPath
-            format "%" oslContent to:f
-            close f
-
-            global {global_var} = OSLMap name:"{safe_shader_name}"
-            {global_var}.OSLCode = oslContent
-            {global_var}.OSLAutoUpdate = true
-            {global_var}.OSLPath = oslPath
+# batch op type -> fallback script builder; the op's other keys are its kwargs
+_BATCH_OP_BUILDERS: Mapping[str, Callable[..., str]] = MappingProxyType({
+    "assign_material": _assign_material_maxscript,
+    "set_material_property": _set_material_property_maxscript,
+    "set_material_properties": _set_material_properties_maxscript,
+    "create_texture_map": _create_texture_map_maxscript,
+    "set_texture_map_properties": _set_texture_map_properties_maxscript,
+    "set_sub_material": _set_sub_material_maxscript,
+    "add_modifier": _add_modifier_maxscript,
+})
 
-            okList = #()
-            errList = #()
-            {"" if not prop_lines else prop_lines}
 
-            msg = "OSL shader written to " + oslPath + " | Global: {global_var}"
-            if okList.count > 0 do (
-                msg += " | Set: "
-                for i = 1 to okList.count do (if i > 1 do msg += ", "; msg += okList[i])
-            )
-            if errList.count > 0 do (
-                msg += " | Errors: "
-                for i = 1 to errList.count do (if i > 1 do msg += "; "; msg += errList[i])
-            )
-            msg
-        ) catch (
-            "Error: " + (getCurrentException())
-        )
-    )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
+def _batch_op_maxscript(op: Mapping) -> str:
+    """Build one batch op's script block, or a string literal describing why it can't run."""
+    kwargs = dict(op)
+    op_type = str(kwargs.pop("type", ""))
+    builder = _BATCH_OP_BUILDERS.get(op_type)
+    if builder is None:
+        return f'"Error: unknown op type \'{safe_string(op_type)}\'"'
+    return builder_block(builder, kwargs, op_type)
 
 
 @mcp.tool()
-def create_material_from_textures(
+def batch_material_ops(ops: DictList) -> str:
+    """Run several material/modifier operations in one MAXScript round trip.
+
+    Each op is a dict with a "type" key (assign_material, set_material_property,
+    set_material_properties, create_texture_map, set_texture_map_properties,
+    set_sub_material, add_modifier) plus that tool's arguments. Returns a JSON
+    array with one result string per op, in order.
+    """
+    if not ops:
+        return "No operations given"
+
+    invalidate_inspect_cache()
+    maxscript = results_array_script(_batch_op_maxscript(op) for op in ops)
+    response = client.send_command(minify_maxscript(maxscript))
+    return response.get("result", "")
+
+
+# material_class substring -> texture-folder builder, checked in order
+_RENDERER_TOKENS = (
+    ("openpbr", "openpbr"),
+    ("open_pbr", "openpbr"),
+    ("ai_standard", "arnold"),
+    ("arnold", "arnold"),
+    ("physical", "physical"),
+    ("rs_standard", "redshift"),
+    ("redshift", "redshift"),
+)
+
+
+def _texture_material_script(
     texture_folder: str,
-    material_class: str = "",
-    material_name: str = "",
-    assign_to: StrList | None = None,
-    custom_patterns: dict[str, list[str]] | None = None,
-) -> str:
-    """Create a fully-wired PBR material from a folder of texture maps."""
-    # -- Step 1: Scan folder (Python-side) --
-    files = _scan_texture_folder(texture_folder)
-    if not files:
-        return f"No image files found in: {texture_folder}"
+    material_class: str,
+    material_name: str,
+    assign_to: list[str] | None,
+    custom_patterns: dict[str, list[str]] | None,
+) -> tuple[str, str]:
+    """Scan, match and build one folder's material script.
 
-    # -- Step 2: Match textures to channels (Python-side) --
-    patterns = dict(_DEFAULT_CHANNEL_PATTERNS)
-    if custom_patterns:
-        patterns.update(custom_patterns)
+    Returns ``(maxscript, "")`` on success or ``("", error_message)``.
+    """
+    # -- Steps 1-2: Scan folder and match textures to channels (Python-side,
+    # cached per folder mtime and pattern set) --
+    custom_key = tuple((channel, tuple(aliases)) for channel, aliases in (custom_patterns or {}).items())
+    files, matched = _match_texture_folder(texture_folder, custom_key)
+    if not files:
+        return "", f"No image files found in: {texture_folder}"
 
-    matched = _match_textures_to_channels(files, patterns)
+    matched = dict(matched)
     if not matched:
         suffixes = [f.stem for f in files[:10]]
-        return f"No textures matched any channel pattern. File stems: {suffixes}"
+        return "", f"No textures matched any channel pattern. File stems: {suffixes}"
 
     # -- Step 3: Determine renderer / material class --
-    renderer = ""
     if material_class:
         class_lower = material_class.lower()
-        if "openpbr" in class_lower or "open_pbr" in class_lower:
-            renderer = "openpbr"
-        elif "ai_standard" in class_lower or "arnold" in class_lower:
-            renderer = "arnold"
-        elif "physical" in class_lower:
-            renderer = "physical"
-        elif "rs_standard" in class_lower or "redshift" in class_lower:
-            renderer = "redshift"
-        else:
-            return (f"Unsupported material_class: {material_class}. "
-                    "Use OpenPBRMaterial, ai_standard_surface, PhysicalMaterial, or RS_Standard_Material.")
+        renderer = next((r for token, r in _RENDERER_TOKENS if token in class_lower), None)
+        if renderer is None:
+            return "", (f"Unsupported material_class: {material_class}. "
+                        "Use OpenPBRMaterial, ai_standard_surface, PhysicalMaterial, or RS_Standard_Material.")
     else:
         # OpenPBR is the preferred neutral PBR material. The generated script
         # falls back to PhysicalMaterial if the local Max build has no OpenPBR class.
@@ -1592,7 +2240,7 @@ def create_material_from_textures(
 
     # -- Step 4: Derive material name --
     if not material_name:
-        material_name = Path(texture_folder).name
+        material_name = os.path.basename(texture_folder.rstrip("/\\")) or texture_folder
 
     # -- Step 5: Build MAXScript --
     if renderer == "openpbr":
@@ -1603,6 +2251,24 @@ def create_material_from_textures(
         maxscript = _build_redshift_maxscript(matched, material_name, assign_to)
     else:
         maxscript = _build_physical_maxscript(matched, material_name, assign_to)
+    return maxscript, ""
+
+
+@mcp.tool()
+def create_material_from_textures(
+    texture_folder: str,
+    material_class: str = "",
+    material_name: str = "",
+    assign_to: StrList | None = None,
+    custom_patterns: dict[str, list[str]] | None = None,
+) -> str:
+    """Create a fully-wired PBR material from a folder of texture maps."""
+    invalidate_inspect_cache()
+    maxscript, error = _texture_material_script(
+        texture_folder, material_class, material_name, assign_to, custom_patterns,
+    )
+    if error:
+        return error
 
     # Wrap in try/catch
     maxscript = f"""(
@@ -1614,7 +2280,48 @@ def create_material_from_textures(
 )"""
 
     # -- Step 6: Send to Max --
-    response = client.send_command(maxscript)
+    response = client.send_command(minify_maxscript(maxscript))
+    return response.get("result", "")
+
+
+@mcp.tool()
+def create_materials_from_texture_folders(
+    texture_folders: StrList,
+    material_class: str = "",
+    custom_patterns: dict[str, list[str]] | None = None,
+) -> str:
+    """Create one PBR material per texture folder in a single round trip.
+
+    Each material is named after its folder. Returns one line per folder.
+    """
+    if not texture_folders:
+        return "No texture folders given"
+
+    invalidate_inspect_cache()
+    # Folder scans are I/O bound, so a small thread pool overlaps them; the
+    # results come back in input order.
+    workers = min(8, len(texture_folders))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        built = list(pool.map(
+            lambda folder: _texture_material_script(folder, material_class, "", None, custom_patterns),
+            texture_folders,
+        ))
+
+    # Every folder that produced a script runs in its own try block so one
+    # broken material does not abort the rest of the batch.
+    lines = ['out = stringStream ""']
+    for folder, (maxscript, error) in zip(texture_folders, built):
+        label = safe_string(folder)
+        if error:
+            lines.append(f'format "%: %\\n" "{label}" "{safe_string(error)}" to:out')
+        else:
+            lines.append(
+                f'format "%: %\\n" "{label}" (try (\n        {maxscript}\n    ) catch (\n'
+                '        "Error: " + (getCurrentException())\n    )) to:out'
+            )
+    lines.append("out as string")
+
+    response = client.send_command(minify_maxscript("(\n    " + "\n    ".join(lines) + "\n)"))
     return response.get("result", "")
 
 
@@ -1626,7 +2333,7 @@ def _scan_material_editor_palette_files(folder: str, recursive: bool) -> list[Pa
     iterator = root.rglob("*") if recursive else root.iterdir()
     files = [
         path for path in iterator
-        if path.is_file() and path.suffix.lower() in _IMAGE_EXTENSIONS
+        if path.name.lower().endswith(_IMAGE_SUFFIXES) and path.is_file()
     ]
     return sorted(files, key=lambda path: str(path).lower())
 
@@ -1651,15 +2358,7 @@ def _build_material_editor_palette_maxscript(
         "    )",
         "    undefined",
         ")",
-        "fn mcp_createOpenPbrPreferred matName = (",
-        "    local m = undefined",
-        "    try (m = OpenPBRMaterial name:matName) catch ()",
-        "    if m == undefined do try (m = OpenPBR_Material name:matName) catch ()",
-        "    if m == undefined do try (m = OpenPBR_Mtl name:matName) catch ()",
-        "    if m == undefined do try (m = PhysicalMaterial name:matName) catch ()",
-        '    if m == undefined do throw "OpenPBRMaterial/OpenPBR_Material/OpenPBR_Mtl/PhysicalMaterial are unavailable"',
-        "    m",
-        ")",
+        *_OPENPBR_CREATE_FN_LINES,
         "local loaded = #()",
         "local classes = #()",
         "local errors = #()",
@@ -1761,15 +2460,7 @@ def _build_material_editor_pbr_palette_maxscript(
         '        try (setProperty target ((slotName + "_enable") as name) true) catch ()',
         "    )",
         ")",
-        "fn mcp_createOpenPbrPreferred matName = (",
-        "    local m = undefined",
-        "    try (m = OpenPBRMaterial name:matName) catch ()",
-        "    if m == undefined do try (m = OpenPBR_Material name:matName) catch ()",
-        "    if m == undefined do try (m = OpenPBR_Mtl name:matName) catch ()",
-        "    if m == undefined do try (m = PhysicalMaterial name:matName) catch ()",
-        '    if m == undefined do throw "OpenPBRMaterial/OpenPBR_Material/OpenPBR_Mtl/PhysicalMaterial are unavailable"',
-        "    m",
-        ")",
+        *_OPENPBR_CREATE_FN_LINES,
         "local loaded = #()",
         "local classes = #()",
         "local errors = #()",
@@ -2182,7 +2873,7 @@ def _palette_laydown_impl(
         "Error: " + (getCurrentException())
     )
 )"""
-        response = client.send_command(maxscript)
+        response = client.send_command(minify_maxscript(maxscript))
         return response.get("result", "")
 
     selected = files[:max_slots]
@@ -2193,7 +2884,7 @@ def _palette_laydown_impl(
         "Error: " + (getCurrentException())
     )
 )"""
-    response = client.send_command(maxscript)
+    response = client.send_command(minify_maxscript(maxscript))
     return response.get("result", "")
 
 
@@ -2315,9 +3006,7 @@ def _build_shell_maxscript(
     # Assign to objects
     lines.append(f'assignCount = 0')
     if assign_to:
-        names_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in assign_to) + ")"
-        lines.append(f'nameList = {names_arr}')
-        lines.append(f'for n in nameList do (obj = getNodeByName n; if obj != undefined then (obj.material = shell; assignCount += 1))')
+        lines.append(_assign_to_lines(assign_to, "shell"))
     elif gltf_material_name:
         # Auto-assign to all objects using the glTF material
         lines.append(f'if gltfMat != undefined do (')
@@ -2353,6 +3042,7 @@ def create_shell_material(
     assign_to: StrList | None = None,
 ) -> str:
     """Create a Shell Material with UberBitmap-based Arnold render slot and glTF export slot."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             payload = json.dumps({
@@ -2387,5 +3077,5 @@ def create_shell_material(
     )
 )"""
 
-    response = client.send_command(maxscript)
+    response = client.send_command(minify_maxscript(maxscript))
     return response.get("result", "{}")
@@ -9,6 +9,7 @@ swapping materials across many objects at once.
 import json as _json
 from ..server import mcp, client
 from ..coerce import DictList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string
 
 
@@ -19,6 +20,7 @@ def replace_material(
     preview: bool = False,
 ) -> str:
     """Replace one material with another across all objects that use it."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = _json.dumps({"source_material": source_material, "target_material": target_material, "preview": preview})
         response = client.send_command(payload, cmd_type="native:replace_material")
@@ -101,6 +103,7 @@ def batch_replace_materials(
     preview: bool = False,
 ) -> str:
     """Replace multiple materials in a single operation."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = _json.dumps({"replacements": list(replacements), "preview": preview})
         response = client.send_command(payload, cmd_type="native:batch_replace_materials")
@@ -1,10 +1,53 @@
 import json as _json
 from ..server import mcp, client
+from src.helpers.inspect_cache import cached_inspect
+from src.helpers.maxscript import minify_maxscript
+
+
+# get_materials fallback. One pass over the scene files every object under
+# its material's name through a Hashtable index, instead of re-walking all
+# objects for each material.
+_GET_MATERIALS_SCRIPT = r"""(
+    local esc = MCP_Server.escapeJsonString
+    local matIdx = dotNetObject "System.Collections.Hashtable"
+    local matNames = #()
+    local matClasses = #()
+    local matObjs = #()
+    for obj in objects where obj.material != undefined do (
+        local mat = obj.material
+        local i = matIdx.Item[mat.name]
+        if i == undefined do (
+            append matNames mat.name
+            append matClasses ((classOf mat) as string)
+            append matObjs #()
+            i = matNames.count
+            matIdx.Item[mat.name] = i
+        )
+        append matObjs[i] obj.name
+    )
+    local out = stringStream ""
+    format "[" to:out
+    for i = 1 to matNames.count do (
+        if i > 1 do format "," to:out
+        format "{\"name\":\"%\",\"class\":\"%\",\"assignedTo\":[" (esc matNames[i]) (esc matClasses[i]) to:out
+        for j = 1 to matObjs[i].count do (
+            if j > 1 do format "," to:out
+            format "\"%\"" (esc matObjs[i][j]) to:out
+        )
+        format "]}" to:out
+    )
+    format "]" to:out
+    out as string
+)"""
 
 
 @mcp.tool()
 def get_materials() -> str:
     """List all materials assigned to objects in the current 3ds Max scene."""
+    return cached_inspect(("get_materials", None, None, None), _get_materials)
+
+
+def _get_materials() -> str:
     if client.native_available:
         try:
             response = client.send_command(_json.dumps({}), cmd_type="native:get_materials")
@@ -12,38 +55,5 @@ def get_materials() -> str:
         except RuntimeError:
             pass
 
-    maxscript = r"""(
-        local arr = #()
-        local matSet = #()
-        for obj in objects where obj.material != undefined do (
-            local mat = obj.material
-            local idx = findItem matSet mat.name
-            if idx == 0 then (
-                append matSet mat.name
-                local objNames = for o in objects where o.material != undefined \
-                    and o.material.name == mat.name collect o.name
-                local objNameArr = for n in objNames collect ("\"" + n + "\"")
-                local objStr = "["
-                for i = 1 to objNameArr.count do (
-                    if i > 1 do objStr += ","
-                    objStr += objNameArr[i]
-                )
-                objStr += "]"
-                local entry = "{" + \
-                    "\"name\":\"" + mat.name + "\"," + \
-                    "\"class\":\"" + ((classOf mat) as string) + "\"," + \
-                    "\"assignedTo\":" + objStr + \
-                "}"
-                append arr entry
-            )
-        )
-        local result = "["
-        for i = 1 to arr.count do (
-            if i > 1 do result += ","
-            result += arr[i]
-        )
-        result += "]"
-        result
-    )"""
-    response = client.send_command(maxscript)
+    response = client.send_command(minify_maxscript(_GET_MATERIALS_SCRIPT))
     return response.get("result", "[]")
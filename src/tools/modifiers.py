@@ -1,23 +1,27 @@
 from typing import Optional
 import json as _json
 from ..server import mcp, client
-from ..coerce import StrList
-from src.helpers.maxscript import safe_string
+from ..coerce import DictList, StrList
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import builder_block, results_array_script, safe_string, string_array
 
 
-@mcp.tool()
-def add_modifier(name: str, modifier: str, params: str = "") -> str:
-    """Add a modifier to an object."""
-    if client.native_available:
-        try:
-            payload = _json.dumps({"name": name, "modifier": modifier, "params": params})
-            response = client.send_command(payload, cmd_type="native:add_modifier")
-            return response.get("result", "")
-        except RuntimeError:
-            pass
+# Returned by setters called with await_result=False
+QUEUED_RESULT = "Queued; call wait_for_queued_commands to collect any errors"
 
+
+def _send_or_queue(command: str, cmd_type: str, await_result: bool) -> str:
+    """Send *command* and return its result, or queue it when not awaited."""
+    if not await_result:
+        client.send_command_async(command, cmd_type=cmd_type)
+        return QUEUED_RESULT
+    return client.send_command(command, cmd_type=cmd_type).get("result", "")
+
+
+def _add_modifier_maxscript(name: str, modifier: str, params: str = "") -> str:
+    """Build the add_modifier fallback script."""
     safe = safe_string(name)
-    maxscript = f"""(
+    return f"""(
         local obj = getNodeByName "{safe}"
         if obj != undefined then (
             try (
@@ -31,42 +35,127 @@ def add_modifier(name: str, modifier: str, params: str = "") -> str:
             "Object not found: {safe}"
         )
     )"""
-    response = client.send_command(maxscript)
-    return response.get("result", "")
 
 
 @mcp.tool()
-def remove_modifier(name: str, modifier: str) -> str:
-    """Remove a modifier from an object by name."""
+def add_modifier(name: str, modifier: str, params: str = "", await_result: bool = True) -> str:
+    """Add a modifier to an object.
+
+    With await_result=False the command is queued and the call returns at
+    once; wait_for_queued_commands reports any failures.
+    """
+    invalidate_inspect_cache()
+    if not await_result:
+        # A queued command has no reply to fall back on, so pick the path now
+        if client.native_available:
+            payload = _json.dumps({"name": name, "modifier": modifier, "params": params})
+            return _send_or_queue(payload, "native:add_modifier", await_result)
+        return _send_or_queue(_add_modifier_maxscript(name, modifier, params), "maxscript", await_result)
+
     if client.native_available:
         try:
-            payload = _json.dumps({"name": name, "modifier": modifier})
-            response = client.send_command(payload, cmd_type="native:remove_modifier")
+            payload = _json.dumps({"name": name, "modifier": modifier, "params": params})
+            response = client.send_command(payload, cmd_type="native:add_modifier")
             return response.get("result", "")
         except RuntimeError:
             pass
 
+    maxscript = _add_modifier_maxscript(name, modifier, params)
+    response = client.send_command(maxscript)
+    return response.get("result", "")
+
+
+def _remove_modifier_maxscript(name: str, modifier: str = "", modifier_index: int = 0) -> str:
+    """Build the remove_modifier fallback script.
+
+    A 1-based modifier_index is used as is; otherwise the modifier is looked
+    up by name with one findItem over the stack's names.
+    """
     safe = safe_string(name)
-    safe_mod = safe_string(modifier)
-    maxscript = f"""(
+    if modifier_index > 0:
+        find_idx = f"local idx = if {modifier_index} <= obj.modifiers.count then {modifier_index} else 0"
+        missing = (
+            f'"Modifier index {modifier_index} out of range (has " + '
+            f'(obj.modifiers.count as string) + ") on " + obj.name'
+        )
+    elif modifier:
+        safe_mod = safe_string(modifier)
+        find_idx = f'local idx = findItem (for m in obj.modifiers collect m.name) "{safe_mod}"'
+        missing = f'"Modifier \\\"{safe_mod}\\\" not found on " + obj.name'
+    else:
+        raise ValueError("modifier or modifier_index is required")
+    return f"""(
         local obj = getNodeByName "{safe}"
         if obj != undefined then (
-            local found = false
-            for i = 1 to obj.modifiers.count do (
-                if obj.modifiers[i].name == "{safe_mod}" then (
-                    deleteModifier obj i
-                    found = true
-                    exit
-                )
+            {find_idx}
+            if idx > 0 then (
+                local modName = obj.modifiers[idx].name
+                deleteModifier obj idx
+                "Removed modifier \\\"" + modName + "\\\" from " + obj.name
+            ) else (
+                {missing}
             )
-            if found then
-                "Removed modifier \\\"" + "{safe_mod}" + "\\\" from " + obj.name
-            else
-                "Modifier \\\"" + "{safe_mod}" + "\\\" not found on " + obj.name
         ) else (
             "Object not found: {safe}"
         )
     )"""
+
+
+@mcp.tool()
+def remove_modifier(name: str, modifier: str = "", modifier_index: int = 0) -> str:
+    """Remove a modifier from an object by name, or by 1-based stack index.
+
+    modifier_index wins when both are given; it skips the name lookup.
+    """
+    if not modifier and modifier_index <= 0:
+        return "No modifier given"
+
+    invalidate_inspect_cache()
+    # The shipped bridge binaries only remove by name, so index removals go
+    # straight to MAXScript rather than failing natively first
+    if client.native_available and modifier_index <= 0:
+        try:
+            payload = _json.dumps({"name": name, "modifier": modifier})
+            response = client.send_command(payload, cmd_type="native:remove_modifier")
+            return response.get("result", "")
+        except RuntimeError:
+            pass
+
+    maxscript = _remove_modifier_maxscript(name, modifier, modifier_index)
+    response = client.send_command(maxscript)
+    return response.get("result", "")
+
+
+@mcp.tool()
+def add_modifiers(targets: DictList) -> str:
+    """Add modifiers to several objects in one round trip.
+
+    Each target is a dict with name, modifier and optional params, as for
+    add_modifier. Returns a JSON array with one result string per target.
+    """
+    if not targets:
+        return "No targets given"
+
+    invalidate_inspect_cache()
+    # Same builder as add_modifier, one block per target
+    maxscript = results_array_script(builder_block(_add_modifier_maxscript, t, "add_modifier") for t in targets)
+    response = client.send_command(maxscript)
+    return response.get("result", "")
+
+
+@mcp.tool()
+def remove_modifiers(targets: DictList) -> str:
+    """Remove modifiers by name from several objects in one round trip.
+
+    Each target is a dict with name and modifier and/or modifier_index, as
+    for remove_modifier.
+    Returns a JSON array with one result string per target.
+    """
+    if not targets:
+        return "No targets given"
+
+    invalidate_inspect_cache()
+    maxscript = results_array_script(builder_block(_remove_modifier_maxscript, t, "remove_modifier") for t in targets)
     response = client.send_command(maxscript)
     return response.get("result", "")
 
@@ -81,6 +170,7 @@ def set_modifier_state(
     enabled_in_renders: Optional[bool] = None,
 ) -> str:
     """Set the enable state of a modifier with viewport/render granularity."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             payload = {"name": name, "modifier_name": modifier_name, "modifier_index": modifier_index}
@@ -145,6 +235,7 @@ def collapse_modifier_stack(
     to_index: int = 0,
 ) -> str:
     """Collapse the modifier stack on an object."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             payload = _json.dumps({"name": name, "to_index": to_index})
@@ -185,6 +276,7 @@ def collapse_modifier_stack(
 @mcp.tool()
 def make_modifier_unique(name: str, modifier_index: int) -> str:
     """Make an instanced modifier unique (de-instance it)."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             payload = _json.dumps({"name": name, "modifier_index": modifier_index})
@@ -221,6 +313,7 @@ def batch_modify(
     selection_only: bool = False,
 ) -> str:
     """Batch-set a property on all modifiers of a given class across multiple objects."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             payload = {
@@ -240,7 +333,7 @@ def batch_modify(
     safe_prop = safe_string(property_name)
 
     if names:
-        name_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in names) + ")"
+        name_arr = string_array(names)
         collect_line = f"local objsel = for n in {name_arr} where (getNodeByName n) != undefined collect (getNodeByName n)"
     elif selection_only:
         collect_line = "local objsel = selection as array"
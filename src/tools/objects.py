@@ -3,6 +3,7 @@ import re
 
 from ..server import mcp, client
 from ..coerce import FloatList, StrList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string
 
 
@@ -89,6 +90,7 @@ def get_object_properties(name: str) -> str:
 @mcp.tool()
 def set_object_property(name: str, property: str, value: str) -> str:
     """Set a property on a named object in the 3ds Max scene."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             params = _json.dumps({"name": name, "property": property, "value": value})
@@ -214,6 +216,7 @@ def create_object(
     capheight: float | None = None,
 ) -> str:
     """Create a new object in the 3ds Max scene and auto-fill common primitive sizes when omitted."""
+    invalidate_inspect_cache()
     params = _merge_create_object_params(
         type,
         params,
@@ -255,6 +258,7 @@ def create_object(
 @mcp.tool()
 def delete_objects(names: StrList) -> str:
     """Delete objects from the 3ds Max scene by name."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             params = _json.dumps({"names": names})
@@ -4,6 +4,7 @@ import json
 
 from ..server import mcp, client
 from ..coerce import StrList, IntList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 
 
 def _resolve_pattern(pattern: str) -> list[str]:
@@ -46,6 +47,7 @@ def manage_layers(
     secondaryVisibility: bool | None = None,
 ) -> str:
     """Manage scene layers — create, delete, list, set properties, move objects."""
+    invalidate_inspect_cache()
     # Resolve pattern to names for add_objects
     if action == "add_objects" and pattern and not names:
         names = _resolve_pattern(pattern)
@@ -104,6 +106,7 @@ def manage_groups(
     group: str = "",
 ) -> str:
     """Manage object groups — create, ungroup, open, close, attach, detach."""
+    invalidate_inspect_cache()
     payload = {"action": action}
     if name:
         payload["name"] = name
@@ -123,6 +126,7 @@ def manage_selection_sets(
     names: StrList | None = None,
 ) -> str:
     """Manage named selection sets — create, delete, list, select, replace."""
+    invalidate_inspect_cache()
     payload = {"action": action}
     if name:
         payload["name"] = name
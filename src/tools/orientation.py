@@ -7,11 +7,11 @@ from typing import Optional
 
 from ..coerce import StrList
 from ..server import mcp, client
-from src.helpers.maxscript import safe_string
+from src.helpers.maxscript import safe_string, string_array
 
 
 def _maxscript_name_array(names: StrList) -> str:
-    return "#(" + ", ".join(f'"{safe_string(name)}"' for name in names) + ")"
+    return string_array(names)
 
 
 @mcp.tool()
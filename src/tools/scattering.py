@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from ..server import mcp, client
 from ..coerce import StrList, FloatList
-from src.helpers.maxscript import safe_string
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import safe_string, string_array
 
 
 def _name_array(names: list[str]) -> str:
-    return "#(" + ", ".join(f'"{safe_string(name)}"' for name in names) + ")"
+    return string_array(names)
 
 
 def _float_array(values: list[float]) -> str:
@@ -37,6 +38,7 @@ def scatter_forest_pack(
     render_mode: int = 0,
 ) -> str:
     """Create a Forest Pack scatter object and wire surfaces + source geometry."""
+    invalidate_inspect_cache()
     if not surfaces:
         raise ValueError("surfaces must contain at least one object name.")
     if not geometry:
@@ -1,10 +1,12 @@
 import json as _json
 from ..server import mcp, client
+from src.helpers.inspect_cache import invalidate_inspect_cache
 
 
 @mcp.tool()
 def manage_scene(action: str) -> str:
     """Manage the 3ds Max scene state."""
+    invalidate_inspect_cache()
     action = action.lower().strip()
 
     if client.native_available:
@@ -2,7 +2,7 @@ import json as _json
 from typing import Optional
 from ..server import mcp, client
 from ..coerce import StrList
-from src.helpers.maxscript import safe_string
+from src.helpers.maxscript import safe_string, string_array
 
 
 @mcp.tool()
@@ -37,7 +37,7 @@ def select_objects(
             result
         )"""
     elif names:
-        name_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in names) + ")"
+        name_arr = string_array(names)
         maxscript = f"""(
             clearSelection()
             local nameList = {name_arr}
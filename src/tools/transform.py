@@ -2,6 +2,7 @@ import json as _json
 from typing import Optional
 from ..server import mcp, client
 from ..coerce import FloatList
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string
 
 
@@ -14,6 +15,7 @@ def transform_object(
     coordinate_system: str = "world",
 ) -> str:
     """Move, rotate, and/or scale an object by the given offsets."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             params: dict = {"name": name}
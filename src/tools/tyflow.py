@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from src.helpers.maxscript import safe_string
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import safe_string, string_array
 
 from ..server import client, mcp
 from ..coerce import StrList, FloatList, IntList, DictList
@@ -121,7 +122,7 @@ def _send_json(maxscript: str, fallback: Any) -> Any:
 
 
 def _mxs_string_array(items: list[str]) -> str:
-    return "#(" + ", ".join(f'"{safe_string(item)}"' for item in items) + ")"
+    return string_array(items)
 
 
 def _mxs_value(value: Any, raw_strings: bool = False) -> str:
@@ -200,6 +201,7 @@ def create_tyflow(
     select_created: bool = True,
 ) -> str:
     """Create tyFlow with one event and a configurable operator list."""
+    invalidate_inspect_cache()
     from .selection import select_objects
 
     pos = position or [0.0, 0.0, 0.0]
@@ -543,6 +545,7 @@ if flow == undefined then (
 @mcp.tool()
 def add_tyflow_event(name: str, event_name: str, event_position: IntList | None = None) -> str:
     """Add one event to an existing tyFlow object."""
+    invalidate_inspect_cache()
     pos = event_position or [0, 0]
     if len(pos) != 2:
         raise ValueError("event_position must be [x, y]")
@@ -572,6 +575,7 @@ def modify_tyflow_operator(
     raw_values: bool = False,
 ) -> str:
     """Set operator properties on an existing tyFlow event/operator pair."""
+    invalidate_inspect_cache()
     if not properties:
         return json.dumps({"error": "properties cannot be empty"})
 
@@ -613,6 +617,7 @@ def set_tyflow_shape(
     create_if_missing: bool = True,
 ) -> str:
     """Set Shape operator with validated 3D shape IDs."""
+    invalidate_inspect_cache()
     key = shape.strip().lower()
     if key not in SHAPE_3D_IDS:
         return json.dumps({"error": f"Unknown shape '{shape}'"})
@@ -663,6 +668,7 @@ def connect_tyflow_events(
     create_if_missing: bool = True,
 ) -> str:
     """Connect events with Send Out by applying common destination property candidates."""
+    invalidate_inspect_cache()
     maxscript = f"""(
 {HELPERS}
 local flow = getNodeByName "{safe_string(name)}"
@@ -714,6 +720,7 @@ def add_tyflow_collision(
     create_if_missing: bool = True,
 ) -> str:
     """Add/configure Collision operator and wire collider node list."""
+    invalidate_inspect_cache()
     requested = _mxs_string_array(collider_names)
     maxscript = f"""(
 {HELPERS}
@@ -771,6 +778,7 @@ def set_tyflow_physx(
     vel_iterations: int = 1,
 ) -> str:
     """Set object-level PhysX settings from tyFlow object properties."""
+    invalidate_inspect_cache()
     maxscript = f"""(
 {HELPERS}
 local flow = getNodeByName "{safe_string(name)}"
@@ -800,6 +808,7 @@ if flow == undefined then (
 @mcp.tool()
 def remove_tyflow_element(name: str, event_name: str, operator_name: str = "") -> str:
     """Remove operator from an event, or remove event when operator_name is empty."""
+    invalidate_inspect_cache()
     maxscript = f"""(
 {HELPERS}
 local flow = getNodeByName "{safe_string(name)}"
@@ -914,6 +923,7 @@ if flow == undefined then (
 @mcp.tool()
 def reset_tyflow_simulation(name: str = "") -> str:
     """Reset simulation for one tyFlow object or for all tyFlow objects."""
+    invalidate_inspect_cache()
     maxscript = f"""(
 {HELPERS}
 local targets = #()
@@ -945,6 +955,7 @@ def create_tyflow_preset(
     speed: float = 120.0,
 ) -> str:
     """Create common tyFlow presets: rain, snow, fountain, burst, debris."""
+    invalidate_inspect_cache()
     key = preset.strip().lower()
     if key not in {"rain", "snow", "fountain", "burst", "debris"}:
         return json.dumps({"error": "Unsupported preset. Use rain|snow|fountain|burst|debris"})
@@ -2,7 +2,8 @@ import json as _json
 from typing import Optional
 from ..server import mcp, client
 from ..coerce import StrList
-from src.helpers.maxscript import safe_string
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.helpers.maxscript import safe_string, string_array
 
 
 @mcp.tool()
@@ -12,6 +13,7 @@ def set_visibility(
     action: str = "hide",
 ) -> str:
     """Show, hide, freeze, or unfreeze objects."""
+    invalidate_inspect_cache()
     if client.native_available:
         try:
             params: dict = {"action": action}
@@ -41,7 +43,7 @@ def set_visibility(
         return f"Unknown action: {action}. Use hide, show, toggle, freeze, or unfreeze."
 
     if names:
-        name_arr = "#(" + ", ".join(f'"{safe_string(n)}"' for n in names) + ")"
+        name_arr = string_array(names)
         collect_line = f"""local nameList = {name_arr}
             local matched = for n in nameList where (getNodeByName n) != undefined collect (getNodeByName n)"""
     elif pattern:
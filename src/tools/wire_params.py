@@ -8,6 +8,7 @@ modifier's angle). These tools expose wiring as first-class operations.
 from typing import Optional
 import json as _json
 from ..server import mcp, client
+from src.helpers.inspect_cache import invalidate_inspect_cache
 from src.helpers.maxscript import safe_string, safe_name, normalize_subanim_path
 
 
@@ -106,6 +107,7 @@ def wire_params(
     reverse_expression: Optional[str] = None,
 ) -> str:
     """Connect parameters between objects with a wire expression."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = {
             "source_object": source_object,
@@ -229,6 +231,7 @@ def unwire_params(
     param_path: str,
 ) -> str:
     """Disconnect a wired parameter."""
+    invalidate_inspect_cache()
     if client.native_available:
         payload = _json.dumps({"object_name": object_name, "param_path": param_path})
         response = client.send_command(payload, cmd_type="native:unwire_params")
@@ -2,7 +2,7 @@ import json
 import unittest
 from unittest.mock import patch
 
-from src.tools.bridge import get_bridge_status
+from src.tools.bridge import get_bridge_status, wait_for_queued_commands
 
 
 class BridgeToolTests(unittest.TestCase):
@@ -36,6 +36,11 @@ class BridgeToolTests(unittest.TestCase):
         self.assertEqual(result["legacyTransport"], True)
         self.assertEqual(result["connected"], True)
 
+    def test_wait_for_queued_commands_reports_failures(self) -> None:
+        with patch("src.tools.bridge.client.wait_queued_commands", side_effect=[[], ["MAXScript error: x"]]):
+            self.assertEqual(wait_for_queued_commands(), "All queued commands finished")
+            self.assertEqual(wait_for_queued_commands(), "1 queued command(s) failed: MAXScript error: x")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,172 @@
+import json
+import re
+import unittest
+from unittest.mock import patch
+
+from src.tools import floor_plan
+
+_KNOT_RE = re.compile(r"addKnot ss .+? #corner #line \[([-\d.e]+),([-\d.e]+),[-\d.e]+\]")
+
+TWO_ROOMS = [
+    {"name": "Living", "cells": [[0, 0], [1, 0], [0, 1], [1, 1]]},
+    {"name": "Kitchen", "cells": [[2, 0], [2, 1]]},
+]
+
+
+def _segments(maxscript: str) -> set[tuple]:
+    """Collect wall segments from the emitted addKnot pairs as sorted tuples."""
+    pts = [(round(float(x), 4), round(float(y), 4)) for x, y in _KNOT_RE.findall(maxscript)]
+    return {tuple(sorted(pts[i:i + 2])) for i in range(0, len(pts), 2)}
+
+
+class FloorPlanGeometryTests(unittest.TestCase):
+    def test_cell_keys_round_trip_negative_coordinates(self) -> None:
+        for col, row in [(0, 0), (-3, 7), (12, -1), (-5, -9)]:
+            key = floor_plan._pack_cell(col, row)
+            self.assertEqual(floor_plan._unpack_cell(key), (col, row))
+            self.assertEqual(floor_plan._unpack_cell(key + 1), (col, row + 1))
+            self.assertEqual(floor_plan._unpack_cell(key - floor_plan._ROW_SPAN), (col - 1, row))
+
+    def test_extract_wall_edges_reports_each_boundary_once(self) -> None:
+        grid, id2name = floor_plan._build_occupancy(TWO_ROOMS)
+        walls = floor_plan._extract_wall_edges(grid)
+        edges = [edge for edge, _, _ in walls]
+
+        self.assertEqual(len(edges), 12)
+        self.assertEqual(len(set(edges)), 12)
+        shared = [(ra, rb) for _, ra, rb in walls if rb is not None]
+        self.assertEqual(len(shared), 2)
+        self.assertEqual(id2name, ["Living", "Kitchen"])
+        self.assertTrue(all({ra, rb} == {0, 1} for ra, rb in shared))
+
+    def test_merge_collinear_joins_contiguous_boundary_edges(self) -> None:
+        grid, _ = floor_plan._build_occupancy(TWO_ROOMS)
+        merged = floor_plan._merge_collinear(floor_plan._extract_wall_edges(grid))
+        edges = {tuple(sorted(edge)) for edge, _, _ in merged.values()}
+
+        self.assertEqual(len(merged), 7)
+        self.assertIn(((0, 0), (2, 0)), edges)
+        self.assertIn(((2, 0), (2, 2)), edges)
+        self.assertIn(((0, 2), (2, 2)), edges)
+        self.assertIn(((3, 0), (3, 2)), edges)
+
+    def test_merge_collinear_keeps_room_pairs_on_one_line_apart(self) -> None:
+        walls = [
+            (((0, 0), (1, 0)), "A", None),
+            (((1, 0), (2, 0)), "A", None),
+            (((2, 0), (3, 0)), "B", None),
+            (((4, 0), (5, 0)), "A", None),
+        ]
+        merged = floor_plan._merge_collinear(walls)
+
+        self.assertEqual(
+            sorted((edge, ra) for edge, ra, _ in merged.values()),
+            [
+                (((0, 0), (2, 0)), "A"),
+                (((2, 0), (3, 0)), "B"),
+                (((4, 0), (5, 0)), "A"),
+            ],
+        )
+
+
+class BuildFloorPlanTests(unittest.TestCase):
+    def _build(self, **kwargs) -> tuple[dict, list[str]]:
+        created = {"organiser": "FP_FloorPlan", "walls": "FP_Walls", "labels": ["FP_Living", "FP_Kitchen"]}
+        with patch.object(
+            floor_plan.client,
+            "send_command",
+            return_value={"result": json.dumps(created)},
+        ) as mocked_send:
+            result = floor_plan.build_floor_plan(**kwargs)
+        scripts = [c.args[0] for c in mocked_send.call_args_list]
+        return json.loads(result), scripts
+
+    def _wall_script(self, scripts: list[str]) -> str:
+        return next(s for s in scripts if "addKnot" in s)
+
+    def test_interior_door_splits_shared_wall(self) -> None:
+        result, scripts = self._build(
+            cell_size=100.0,
+            rooms=TWO_ROOMS,
+            doors=[{"between": ["Living", "Kitchen"], "position": 0.5, "width": 50}],
+        )
+
+        segs = _segments(self._wall_script(scripts))
+        self.assertEqual(result["wall_segments"], 8)
+        self.assertNotIn(((200.0, 0.0), (200.0, 200.0)), segs)
+        self.assertIn(((200.0, 0.0), (200.0, 75.0)), segs)
+        self.assertIn(((200.0, 125.0), (200.0, 200.0)), segs)
+
+    def test_exterior_door_picks_longest_exterior_segment(self) -> None:
+        _, scripts = self._build(
+            cell_size=100.0,
+            rooms=TWO_ROOMS,
+            doors=[{"between": ["Living", None], "position": 0.25, "width": 100}],
+        )
+
+        segs = _segments(self._wall_script(scripts))
+        self.assertNotIn(((0.0, 0.0), (200.0, 0.0)), segs)
+        self.assertIn(((100.0, 0.0), (200.0, 0.0)), segs)
+
+    def test_repeated_doors_reuse_split_segments(self) -> None:
+        doors = [
+            {"between": ["Kitchen", "Living"], "position": 0.25, "width": 20},
+            {"between": ["Kitchen", "Living"], "position": 0.5, "width": 20},
+        ]
+        result, scripts = self._build(cell_size=100.0, rooms=TWO_ROOMS, doors=doors)
+
+        segs = _segments(self._wall_script(scripts))
+        self.assertEqual(result["wall_segments"], 9)
+        self.assertIn(((200.0, 0.0), (200.0, 40.0)), segs)
+        self.assertIn(((200.0, 60.0), (200.0, 120.0)), segs)
+        self.assertIn(((200.0, 140.0), (200.0, 200.0)), segs)
+
+    def test_knots_are_local_and_labels_sit_on_room_centroids(self) -> None:
+        _, scripts = self._build(location=[1000, 500, 30], cell_size=100.0, rooms=TWO_ROOMS)
+
+        segs = _segments(self._wall_script(scripts))
+        self.assertIn(((300.0, 0.0), (300.0, 200.0)), segs)
+        joined = "\n".join(scripts)
+        self.assertIn('#("FP_Living", "Living", [1100.0,600.0,30])', joined)
+        self.assertIn('#("FP_Kitchen", "Kitchen", [1250.0,600.0,30])', joined)
+        self.assertIn("Text name:spec[1] text:spec[2] size:20.0 pos:spec[3]", joined)
+
+    def test_plan_is_created_in_a_single_round_trip(self) -> None:
+        result, scripts = self._build(rooms=TWO_ROOMS)
+
+        self.assertEqual(len(scripts), 1)
+        self.assertIn("for c in created do c.parent = d", scripts[0])
+        self.assertEqual(result["organiser"], "FP_FloorPlan")
+        self.assertEqual(result["walls"], "FP_Walls")
+        self.assertEqual(result["labels"], ["FP_Living", "FP_Kitchen"])
+
+    def test_hidden_labels_skip_label_loop(self) -> None:
+        _, scripts = self._build(rooms=TWO_ROOMS, options={"show_labels": False})
+        self.assertNotIn("labelSpecs", scripts[0])
+
+    def test_organiser_dummy_wraps_all_cells(self) -> None:
+        _, scripts = self._build(
+            location=[1000, 500, 30],
+            cell_size=100.0,
+            rooms=TWO_ROOMS,
+            options={"extrude_height": 120.0},
+        )
+
+        joined = "\n".join(scripts)
+        self.assertIn("pos:[1150.0,600.0,90.0] boxsize:[300.0,200.0,120.0]", joined)
+
+    def test_missing_pair_leaves_walls_untouched(self) -> None:
+        result, _ = self._build(
+            rooms=TWO_ROOMS,
+            doors=[{"between": ["Living", "Garage"]}],
+        )
+        self.assertEqual(result["wall_segments"], 7)
+
+    def test_empty_plan_reports_error(self) -> None:
+        result, scripts = self._build(rooms=[])
+        self.assertIn("error", result)
+        self.assertEqual(scripts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
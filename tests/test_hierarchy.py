@@ -0,0 +1,50 @@
+import json
+import unittest
+from unittest.mock import PropertyMock, patch
+
+from src.tools import hierarchy
+
+
+class GetHierarchyFallbackTests(unittest.TestCase):
+    def _run(self, result: str) -> tuple[str, str]:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(hierarchy.client, "send_command", return_value={"result": result}) as mocked_send,
+        ):
+            output = hierarchy.get_hierarchy("Root")
+        return output, mocked_send.call_args.args[0]
+
+    def test_fallback_rebuilds_nested_tree_from_flat_rows(self) -> None:
+        rows = (
+            "1\t0\tDummy\tRoot\n"
+            "2\t1\tBox\tChild A\n"
+            "3\t1\tSphere\tChild\\tB\n"
+            '4\t2\tTeapot\tLeaf\\n \\"2\\"\n'
+        )
+        output, maxscript = self._run(rows)
+
+        self.assertIn("(esc obj.name) to:ss", maxscript)
+        self.assertNotIn("childStr +=", maxscript)
+        self.assertEqual(
+            json.loads(output),
+            {
+                "name": "Root",
+                "class": "Dummy",
+                "children": [
+                    {
+                        "name": "Child A",
+                        "class": "Box",
+                        "children": [{"name": 'Leaf\n "2"', "class": "Teapot", "children": []}],
+                    },
+                    {"name": "Child\tB", "class": "Sphere", "children": []},
+                ],
+            },
+        )
+
+    def test_fallback_passes_not_found_message_through(self) -> None:
+        output, _ = self._run("Object not found: Root")
+        self.assertEqual(output, "Object not found: Root")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import unittest
+from unittest.mock import PropertyMock, patch
+
+from src.tools import identify
+
+
+class IsolateAndCaptureTests(unittest.TestCase):
+    def _capture_script(self, **kwargs) -> str:
+        with patch.object(identify.client, "send_command", return_value={"result": "[]"}) as mocked_send:
+            result = identify.isolate_and_capture_selected(**kwargs)
+        self.assertEqual(result, "[]")
+        mocked_send.assert_called_once()
+        return mocked_send.call_args.args[0]
+
+    def test_captures_are_saved_as_jpeg(self) -> None:
+        maxscript = self._capture_script()
+
+        self.assertIn('+ ".jpg"', maxscript)
+        self.assertNotIn('".png"', maxscript)
+        self.assertIn(f"jpeg.setQuality {identify.CAPTURE_JPEG_QUALITY}", maxscript)
+        self.assertIn("jpeg.setQuality oldJpegQuality", maxscript)
+
+    def test_capture_is_downscaled_to_max_width(self) -> None:
+        maxscript = self._capture_script()
+        self.assertIn("viewSize.x > 512", maxscript)
+        self.assertIn("bitmap 512 (amax 1 (viewSize.y * 512 / viewSize.x))", maxscript)
+
+        maxscript = self._capture_script(max_width=0)
+        self.assertIn("if 0 > 0 and", maxscript)
+
+    def test_visibility_is_toggled_per_hierarchy_not_per_scene(self) -> None:
+        maxscript = self._capture_script()
+
+        self.assertEqual(maxscript.count("with redraw off (for obj in allObjs do obj.isHidden = true)"), 1)
+        self.assertIn("for d in prevDescendants do d.isHidden = true", maxscript)
+        self.assertIn("allObjs[i].isHidden = origHidden[i]", maxscript)
+        self.assertNotIn("for obj in objects do obj.isHidden", maxscript)
+
+    def test_groups_redraw_invalidated_views_only(self) -> None:
+        maxscript = self._capture_script()
+        self.assertIn("redrawViews()", maxscript)
+        self.assertNotIn("completeredraw()", maxscript)
+
+    def test_visibility_flips_are_batched_without_redraws(self) -> None:
+        maxscript = self._capture_script()
+        self.assertEqual(maxscript.count("with redraw off"), 3)
+        self.assertEqual(maxscript.count("completeRedraw()"), 1)
+        self.assertLess(maxscript.index("completeRedraw()"), maxscript.index("out as string"))
+
+    def test_instance_groups_come_from_instance_manager(self) -> None:
+        maxscript = self._capture_script()
+
+        self.assertIn("InstanceMgr.GetInstances r &instArr", maxscript)
+        self.assertIn("rootBits = #{}", maxscript)
+        self.assertIn("for r in roots where not grouped[r.inode.handle] do", maxscript)
+        self.assertNotIn("groupBaseObjs", maxscript)
+
+    def test_captures_are_inlined_as_base64_only_on_request(self) -> None:
+        maxscript = self._capture_script()
+        self.assertIn("if false do try (", maxscript)
+
+        maxscript = self._capture_script(inline_images=True)
+        self.assertIn('(dotNetClass "System.IO.File").ReadAllBytes capturePath', maxscript)
+        self.assertIn("if true do try (", maxscript)
+
+    def test_thumbnail_bitmap_is_allocated_once_and_reused(self) -> None:
+        maxscript = self._capture_script()
+
+        self.assertEqual(maxscript.count("bitmap 512"), 1)
+        self.assertLess(maxscript.index("thumb = bitmap"), maxscript.index("for gIdx = 1 to"))
+        self.assertIn("copy vp thumb", maxscript)
+        self.assertIn("free vp", maxscript)
+        self.assertIn("if thumb != undefined do free thumb", maxscript)
+
+
+class BatchRenameFallbackTests(unittest.TestCase):
+    def _rename_script(self, renames: list[dict]) -> str:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(identify.client, "send_command", return_value={"result": "Renamed: 2"}) as mocked_send,
+        ):
+            identify.batch_rename_objects(json.dumps(renames))
+        return mocked_send.call_args.args[0]
+
+    def test_renames_resolve_through_one_scene_index(self) -> None:
+        maxscript = self._rename_script([
+            {"old_name": "Box001", "new_name": "Crate"},
+            {"old_name": 'Odd "Name"', "new_name": "Plain"},
+        ])
+
+        self.assertNotIn("getNodeByName \"", maxscript)
+        self.assertEqual(maxscript.count("for o in objects do"), 1)
+        self.assertIn('oldNames = #("Box001", "Odd \\"Name\\"")', maxscript)
+        self.assertIn('newNames = #("Crate", "Plain")', maxscript)
+
+    def test_chained_renames_are_resolved_before_any_rename(self) -> None:
+        maxscript = self._rename_script([
+            {"old_name": "A", "new_name": "B"},
+            {"old_name": "B", "new_name": "C"},
+        ])
+
+        self.assertLess(maxscript.index("targets = for n in oldNames collect"), maxscript.index("obj.name = newNames[i]"))
+
+
+class SanitizeFilenameTests(unittest.TestCase):
+    def test_windows_reserved_characters_become_underscores(self) -> None:
+        self.assertEqual(identify._sanitize_filename('a<b>c:d"e/f\\g|h?i*j'), "a_b_c_d_e_f_g_h_i_j")
+        self.assertEqual(identify._sanitize_filename("Box 001 é"), "Box 001 é")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,267 @@
+import json
+import unittest
+from unittest.mock import PropertyMock, patch
+
+from src.helpers import inspect_cache
+from src.tools import inspect
+
+
+class InspectFallbackTests(unittest.TestCase):
+    def setUp(self) -> None:
+        inspect.invalidate_inspect_cache()
+
+    def _run(self, fn, *args, result: str = "{}") -> tuple[str, str]:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(inspect.client, "send_command", return_value={"result": result}) as mocked_send,
+        ):
+            output = fn(*args)
+        return output, mocked_send.call_args.args[0]
+
+    def _script(self, fn, *args) -> str:
+        return self._run(fn, *args)[1]
+
+    def test_inspect_object_streams_json_into_buffer(self) -> None:
+        maxscript = self._script(inspect.inspect_object, "Box001")
+
+        self.assertIn('local out = stringStream ""', maxscript)
+        self.assertIn("out as string", maxscript)
+        self.assertNotIn("result +=", maxscript)
+
+    def test_inspect_object_reads_mesh_counts_without_snapshot_first(self) -> None:
+        maxscript = self._script(inspect.inspect_object, "Box001")
+
+        self.assertIn("meshCounts = getTriMeshFaceCount obj", maxscript)
+        self.assertIn("meshCounts = #(obj.numfaces, obj.numverts)", maxscript)
+        self.assertIn("if meshCounts == undefined do try (", maxscript)
+        self.assertLess(maxscript.index("getTriMeshFaceCount"), maxscript.index("snapshotAsMesh"))
+
+    def test_inspect_objects_batches_names_into_one_script(self) -> None:
+        rows = '[{"name": "Box001"}, {"name": "Odd \\"Name\\"", "error": "Object not found"}]'
+        output, maxscript = self._run(inspect.inspect_objects, ["Box001", 'Odd "Name"'], result=rows)
+
+        self.assertEqual(json.loads(output), json.loads(rows))
+        self.assertIn('#("Box001", "Odd \\"Name\\"")', maxscript)
+        self.assertIn("InstanceMgr.GetInstances obj &instArr", maxscript)
+        self.assertIn('\\"error\\": \\"Object not found\\"', maxscript)
+
+    def test_node_names_are_json_escaped(self) -> None:
+        for maxscript in (self._script(inspect.inspect_object, "Box001"), self._script(inspect.inspect_objects, ["Box002"])):
+            self.assertIn("local esc = MCP_Server.escapeJsonString", maxscript)
+            for expr in ("obj.name", "obj.parent.name", "c.name", "obj.layer.name", "mod.name", "obj.material.name"):
+                self.assertIn(f"(esc {expr})", maxscript)
+
+    def test_unparseable_or_short_batches_become_per_name_errors(self) -> None:
+        for result, error in (
+            ("-- Runtime error: boom", "-- Runtime error: boom"),
+            ('[{"name": "Box001"}]', "Expected 2 results, got 1"),
+        ):
+            with self.subTest(result=result):
+                output, _ = self._run(inspect.inspect_objects, ["Box001", "Box002"], result=result)
+
+                self.assertEqual(
+                    json.loads(output),
+                    [{"name": "Box001", "error": error}, {"name": "Box002", "error": error}],
+                )
+                self.assertIsNone(inspect.peek_inspect(inspect._inspect_object_key("Box001")))
+
+    def test_inspect_objects_with_no_names_skips_round_trip(self) -> None:
+        with patch.object(inspect.client, "send_command") as mocked_send:
+            self.assertEqual(inspect.inspect_objects([]), "[]")
+        mocked_send.assert_not_called()
+
+    def test_inspect_properties_streams_json_into_buffer(self) -> None:
+        maxscript = self._script(inspect.inspect_properties, "Box001")
+
+        self.assertIn('local out = stringStream ""', maxscript)
+        self.assertIn("MCP_Server.escapeJsonString", maxscript)
+        self.assertNotIn("substituteString valStr", maxscript)
+        self.assertNotIn("result +=", maxscript)
+
+    def test_inspect_properties_uses_hashtable_blacklist(self) -> None:
+        maxscript = self._script(inspect.inspect_properties, "Box001")
+
+        self.assertIn("blSet.Item[pKey] != undefined", maxscript)
+        self.assertIn("showproperties tgt to:ss", maxscript)
+
+    def test_inspect_properties_dedupes_names_without_makeuniquearray(self) -> None:
+        maxscript = self._script(inspect.inspect_properties, "Box001")
+
+        self.assertNotIn("makeuniquearray", maxscript)
+        self.assertIn("if seen.Item[k] == undefined do (", maxscript)
+        self.assertNotIn("finditem", maxscript)
+
+    def test_inspect_properties_shapes_rows_in_python(self) -> None:
+        dump = (
+            "  .height : float\r\n"
+            "  .mapCoords (Generate Mapping Coords) : boolean\r\n"
+            "  .Height : worldUnits\r\n"
+            "  false\r\n"
+        )
+        rows = json.dumps([
+            "Box",
+            5,
+            [
+                ["height", "25.0", "Float"],
+                ["mapcoords", "true", "BooleanClass"],
+                ["name", 'say "hi"\nthere', "String"],
+            ],
+            dump,
+        ])
+        output, _ = self._run(inspect.inspect_properties, "Box001", "baseobject", result=rows)
+
+        self.assertEqual(
+            json.loads(output),
+            {
+                "target": "baseobject",
+                "class": "Box",
+                "propertyCount": 5,
+                "properties": [
+                    {"name": "height", "value": "25.0", "runtimeType": "Float", "declaredType": "float"},
+                    {"name": "mapcoords", "value": "true", "runtimeType": "BooleanClass", "declaredType": "boolean"},
+                    {"name": "name", "value": 'say "hi"\nthere', "runtimeType": "String"},
+                ],
+            },
+        )
+
+    def test_inspect_properties_passes_errors_through(self) -> None:
+        error = '{"error": "Object not found: Box001"}'
+        output, _ = self._run(inspect.inspect_properties, "Box001", result=error)
+        self.assertEqual(output, error)
+
+
+class InspectCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        inspect.invalidate_inspect_cache()
+
+    def _patched(self, result: str):
+        return patch.object(inspect.client, "send_command", return_value={"result": result})
+
+    def test_repeat_inspection_within_ttl_is_served_from_cache(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            self._patched('{"name": "Box001"}') as mocked_send,
+        ):
+            first = inspect.inspect_object("Box001")
+            second = inspect.inspect_object("Box001")
+            inspect.inspect_properties("Box001")
+            inspect.inspect_properties("Box001", "modifier", 1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mocked_send.call_count, 3)
+
+    def test_expired_and_flushed_entries_are_refetched(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            self._patched('{"name": "Box001"}') as mocked_send,
+            patch.object(inspect_cache.time, "monotonic", side_effect=[0.0, 1.0, 5.0, 5.5]),
+        ):
+            inspect.inspect_object("Box001")
+            inspect.inspect_object("Box001")
+            inspect.inspect_object("Box001")
+            self.assertEqual(mocked_send.call_count, 2)
+            self.assertIn("1 cached", inspect.flush_inspect_cache())
+            inspect.inspect_object("Box001")
+
+        self.assertEqual(mocked_send.call_count, 3)
+
+    def test_mutating_tools_invalidate_cache(self) -> None:
+        from src.tools.execute import execute_maxscript
+
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            self._patched('{"name": "Box001"}') as mocked_send,
+        ):
+            inspect.inspect_object("Box001")
+            execute_maxscript("$Box001.pos = [0,0,10]")
+            inspect.inspect_object("Box001")
+
+        self.assertEqual(mocked_send.call_count, 3)
+
+    def test_scene_tools_invalidate_cache(self) -> None:
+        from src.tools.clone import clone_objects
+        from src.tools.organize import manage_layers
+        from src.tools.scene_manage import manage_scene
+        from src.tools.visibility import set_visibility
+
+        for tool, args in (
+            (set_visibility, (["Box001"], "hide")),
+            (manage_scene, ("fetch",)),
+            (clone_objects, (["Box001"],)),
+            (manage_layers, ("set_properties", "Layer001")),
+        ):
+            with self.subTest(tool=tool.__name__):
+                inspect.invalidate_inspect_cache()
+                with (
+                    patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+                    self._patched('{"name": "Box001"}') as mocked_send,
+                ):
+                    inspect.inspect_object("Box001")
+                    tool(*args)
+                    inspect.inspect_object("Box001")
+
+                self.assertEqual(mocked_send.call_count, 3)
+
+    def test_get_materials_is_cached_until_a_material_tool_runs(self) -> None:
+        from src.tools.material_ops import assign_material
+        from src.tools.materials import get_materials
+
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            self._patched('[{"name": "Mat"}]') as mocked_send,
+        ):
+            first = get_materials()
+            get_materials()
+            assign_material(["Box001"], "PhysicalMaterial")
+            get_materials()
+
+        self.assertEqual(first, '[{"name": "Mat"}]')
+        self.assertEqual(mocked_send.call_count, 3)
+
+    def test_inspect_objects_shares_the_inspect_object_cache(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            self._patched('[{"name": "Box002"}, {"name": "Gone", "error": "Object not found"}]') as mocked_send,
+        ):
+            with patch.object(inspect.client, "send_command", return_value={"result": '{"name": "Box001"}'}):
+                inspect.inspect_object("Box001")
+            output = inspect.inspect_objects(["Box001", "Box002", "Gone", "Box001"])
+            self.assertEqual(inspect.inspect_object("Box002"), '{"name": "Box002"}')
+
+        self.assertEqual(mocked_send.call_count, 1)
+        self.assertIn('#("Box002", "Gone")', mocked_send.call_args.args[0])
+        self.assertEqual(
+            [entry["name"] for entry in json.loads(output)], ["Box001", "Box002", "Gone", "Box001"],
+        )
+
+    def test_inspect_objects_uses_native_inspect_per_name(self) -> None:
+        def send(command, cmd_type="maxscript", timeout=None):
+            if cmd_type == "maxscript":
+                return {"result": "Object not found: Gone"}
+            name = json.loads(command)["name"]
+            if name == "Gone":
+                raise RuntimeError("MAXScript error: Object not found: Gone")
+            return {"result": json.dumps({"name": name, "native": True})}
+
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            patch.object(inspect.client, "send_command", side_effect=send) as mocked_send,
+        ):
+            output = json.loads(inspect.inspect_objects(["Box001", "Gone"]))
+
+        self.assertEqual(output, [{"name": "Box001", "native": True}, {"name": "Gone", "error": "Object not found"}])
+        self.assertEqual(mocked_send.call_args_list[0].kwargs["cmd_type"], "native:inspect_object")
+
+    def test_missing_objects_are_not_cached(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            self._patched("Object not found: Box001") as mocked_send,
+        ):
+            inspect.inspect_object("Box001")
+            inspect.inspect_object("Box001")
+
+        self.assertEqual(mocked_send.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
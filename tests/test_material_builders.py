@@ -0,0 +1,528 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+from src.tools import material_ops
+
+
+def _matched(*channels: str) -> dict[str, Path]:
+    return {channel: Path(f"C:\\textures\\Oak\\oak_{channel}.png") for channel in channels}
+
+
+class MaterialScriptBuilderTests(unittest.TestCase):
+    def test_scripts_open_with_renderer_prologue(self) -> None:
+        for builder, head in (
+            (material_ops._build_arnold_maxscript, 'mat = ai_standard_surface name:"Oak \\"A\\""'),
+            (material_ops._build_physical_maxscript, 'mat = PhysicalMaterial name:"Oak \\"A\\""'),
+            (material_ops._build_redshift_maxscript, 'mat = RS_Standard_Material name:"Oak \\"A\\""'),
+            (material_ops._build_openpbr_maxscript, 'mat = mcp_createOpenPbrPreferred "Oak \\"A\\""'),
+        ):
+            with self.subTest(builder=builder.__name__):
+                maxscript = builder(_matched("diffuse"), 'Oak "A"', None)
+                self.assertTrue(maxscript.startswith("(\n    "))
+                self.assertIn(head, maxscript)
+                self.assertTrue(maxscript.endswith("\n    summary\n)"))
+
+    def test_openpbr_helpers_are_defined_once(self) -> None:
+        maxscript = material_ops._build_openpbr_maxscript(_matched("diffuse", "roughness"), "Oak", None)
+        self.assertEqual(maxscript.count("fn mcp_setFirstMap"), 1)
+        self.assertIn('if skippedList != "" do summary += " | Skipped: " + skippedList', maxscript)
+
+    def test_openpbr_class_is_resolved_once_per_session(self) -> None:
+        maxscript = material_ops._build_openpbr_maxscript(_matched("diffuse"), "Oak", None)
+
+        self.assertIn("global mcp_openPbrClass", maxscript)
+        self.assertIn("try (m = mcp_openPbrClass name:matName) catch ()", maxscript)
+        self.assertLess(maxscript.index("mcp_openPbrClass name:matName"), maxscript.index("OpenPBRMaterial name:matName"))
+
+    def test_wiring_blocks_keep_one_statement_per_line(self) -> None:
+        maxscript = material_ops._build_physical_maxscript(_matched("diffuse", "ao", "normal", "bump"), "Oak", None)
+        lines = maxscript.splitlines()
+
+        self.assertIn('    comp.mapList[1] = bm_diffuse', lines)
+        self.assertIn('    comp.blendMode[2] = 5', lines)
+        self.assertIn('    nrmBump.bump_map = bm_bump_h', lines)
+        self.assertLess(maxscript.index("comp.mapList[2] = bm_ao"), maxscript.index("mat.base_color_map = comp"))
+
+    def test_static_channel_summary_is_emitted_once(self) -> None:
+        maxscript = material_ops._build_redshift_maxscript(_matched("diffuse", "ior", "roughness"), "Oak", None)
+
+        self.assertNotIn("channelList", maxscript)
+        self.assertIn('summary += " | Channels: diffuse, ior(skipped-no-map-slot), roughness, "', maxscript)
+
+    def test_slot_candidate_arrays_are_rendered_once(self) -> None:
+        material_ops._ms_name_array_cached.cache_clear()
+        material_ops._build_openpbr_maxscript(_matched("diffuse", "roughness", "glossiness"), "Oak", None)
+        material_ops._build_openpbr_maxscript(_matched("diffuse", "roughness", "glossiness"), "Oak", None)
+
+        info = material_ops._ms_name_array_cached.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 4)
+        self.assertEqual(material_ops._ms_name_array(['a"b', "c"]), '#("a\\"b", "c")')
+
+    def test_builders_share_one_assign_block(self) -> None:
+        block = material_ops._assign_to_lines(["Box001", "Box002"], "mat")
+        for builder in (
+            material_ops._build_arnold_maxscript,
+            material_ops._build_physical_maxscript,
+            material_ops._build_redshift_maxscript,
+            material_ops._build_openpbr_maxscript,
+        ):
+            with self.subTest(builder=builder.__name__):
+                maxscript = builder(_matched("diffuse"), "Oak", ["Box001", "Box002"])
+                self.assertIn(block, maxscript)
+                self.assertNotIn("getNodeByName n;", maxscript)
+                self.assertLess(maxscript.index("assignCount = 0"), maxscript.index('" | Assigned to "'))
+
+        self.assertIn("obj.material = shell; assignCount += 1", material_ops._assign_to_lines(["Box001"], "shell"))
+
+
+class OslEscapeTests(unittest.TestCase):
+    def test_escapes_backslashes_quotes_and_newlines(self) -> None:
+        for code, expected in (
+            ("", ""),
+            ("shader a() {}", "shader a() {}"),
+            ('printf("%s\\n", x);\n\tc = "q";', 'printf(\\"%s\\\\n\\", x);\\n\tc = \\"q\\";'),
+            ('a\\"b\n\n', 'a\\\\\\"b\\n\\n'),
+        ):
+            with self.subTest(code=code):
+                self.assertEqual(material_ops._escape_osl(code), expected)
+
+    def test_chained_replace_matches_single_pass_translation(self) -> None:
+        table = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+        source = Path(material_ops.__file__).read_text(encoding="utf-8")
+        self.assertEqual(material_ops._escape_osl(source), source.translate(table))
+
+    def test_shader_files_share_the_native_handlers_folder(self) -> None:
+        self.assertEqual(Path(material_ops._OSL_SHADER_DIR), Path(tempfile.gettempdir()) / "osl_shaders")
+
+
+class MaxscriptIdentifierTests(unittest.TestCase):
+    def test_matches_character_by_character_cleanup(self) -> None:
+        for base in ("Wood Grain-01", "3D noise", "bump.map (v2)", "Bois_é", "a—b·c", "_ok"):
+            with self.subTest(base=base):
+                expected = "".join(c if c.isalnum() or c == "_" else "_" for c in base)
+                if expected[0].isdigit():
+                    expected = "m_" + expected
+                self.assertEqual(material_ops._maxscript_identifier(base), expected)
+
+
+    def test_repeat_names_are_cleaned_once(self) -> None:
+        material_ops._maxscript_identifier.cache_clear()
+        for _ in range(3):
+            self.assertEqual(material_ops._maxscript_identifier("Wood Grain"), "Wood_Grain")
+
+        info = material_ops._maxscript_identifier.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+
+class MaterialFallbackScriptTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.osl_dir = tmp.name
+        patcher = patch.object(material_ops, "_OSL_SHADER_DIR", tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _script(self, fn, *args) -> str:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(material_ops.client, "send_command", return_value={"result": "ok"}) as mocked_send,
+        ):
+            fn(*args)
+        return mocked_send.call_args.args[0]
+
+    def test_assign_material_fills_template(self) -> None:
+        maxscript = self._script(material_ops.assign_material, ["Box001", 'Odd "A"'], "PhysicalMaterial", "Oak", "roughness:0.5")
+
+        self.assertIn('mat = PhysicalMaterial name:"Oak" roughness:0.5', maxscript)
+        self.assertIn('nameList = #("Box001", "Odd \\"A\\"")', maxscript)
+
+    def test_assign_material_indexes_scene_once_for_several_targets(self) -> None:
+        maxscript = self._script(material_ops.assign_material, ["Box001", "Box002"], "PhysicalMaterial")
+
+        self.assertEqual(maxscript.count("for o in objects do"), 1)
+        self.assertIn("if nameList.count > 1 do (", maxscript)
+        self.assertIn("maxOps.getNodeByHandle h", maxscript)
+
+    def test_assign_material_applies_per_object_overrides_in_same_script(self) -> None:
+        maxscript = self._script(
+            lambda: material_ops.assign_material(
+                ["Box001", "Box002"], "PhysicalMaterial",
+                per_object_params={"Box002": {"roughness": "0.2"}, "Box003": {}},
+            )
+        )
+
+        self.assertIn(
+            "overrides = #(#(\"Box002\", #(#'roughness'), "
+            "#((try (0.2) catch (valErrs[1] = getCurrentException(); undefined))), 0, #(\"roughness\")))",
+            maxscript,
+        )
+        self.assertIn("valErrs.count = 1", maxscript)
+        self.assertIn("objMat = copy mat", maxscript)
+        self.assertIn("setProperty propOwner propRef ov[3][i]", maxscript)
+        self.assertNotIn("Box003", maxscript)
+
+    def test_assign_material_overrides_guard_values_and_walk_dotted_paths(self) -> None:
+        maxscript = self._script(
+            lambda: material_ops.assign_material(
+                ["Box001", "Box002"], "PhysicalMaterial",
+                per_object_params={"Box001": {"roughness": "0.2"}, "Box002": {"coating.weight": "bad.x", "metalness": "1"}},
+            )
+        )
+
+        self.assertIn(
+            "#(\"Box002\", #(#(#'coating', #'weight'), #'metalness'), "
+            "#((try (bad.x) catch (valErrs[2] = getCurrentException(); undefined)), "
+            "(try (1) catch (valErrs[3] = getCurrentException(); undefined))), 1, #(\"coating.weight\", \"metalness\"))",
+            maxscript,
+        )
+        self.assertIn("valErrs.count = 3", maxscript)
+        self.assertIn("err = valErrs[ov[4] + i]", maxscript)
+        self.assertIn("for s = 1 to propRef.count - 1 do propOwner = getProperty propOwner propRef[s]", maxscript)
+
+    def test_assign_material_without_overrides_has_no_override_pass(self) -> None:
+        maxscript = self._script(material_ops.assign_material, ["Box001"], "PhysicalMaterial")
+        self.assertNotIn("overrides", maxscript)
+
+    def test_assign_material_overrides_bypass_native_path(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            patch.object(material_ops.client, "send_command", return_value={"result": "ok"}) as mocked_send,
+        ):
+            material_ops.assign_material(["Box001"], "PhysicalMaterial", per_object_params={"Box001": {"a": "1"}})
+
+        mocked_send.assert_called_once()
+        self.assertNotIn("cmd_type", mocked_send.call_args.kwargs)
+
+    def test_set_material_property_quotes_paths_verbatim(self) -> None:
+        maxscript = self._script(material_ops.set_material_property, "Box001", "base_color_map", '"C:\\tex\\a.png"', 2)
+
+        self.assertIn('mat = obj.material[2]', maxscript)
+        self.assertIn("""setProperty mat #'base_color_map' (@"C:\\tex\\a.png")""", maxscript)
+        self.assertIn("getProperty mat #'base_color_map'", maxscript)
+
+    def test_missing_sub_material_is_reported_as_an_error(self) -> None:
+        for fn, args in (
+            (material_ops.set_material_property, ("Box001", "roughness", "0.4", 3)),
+            (material_ops.set_material_properties, ("Box001", {"roughness": "0.4", "metalness": "1"}, 3)),
+        ):
+            with self.subTest(fn=fn.__name__):
+                self.assertIn('"Error: Sub-material index 3 not found on Box001"', self._script(fn, *args))
+
+    def test_set_material_property_assigns_dotted_paths_directly(self) -> None:
+        maxscript = self._script(material_ops.set_material_property, "Box001", "base_color_map.coords.U_Tiling", "2")
+
+        self.assertIn("mat.base_color_map.coords.U_Tiling = (2)", maxscript)
+        self.assertIn("readback = (mat.base_color_map.coords.U_Tiling) as string", maxscript)
+        self.assertNotIn("setProperty", maxscript)
+
+    def test_write_osl_shader_sets_properties_by_name(self) -> None:
+        maxscript = self._script(
+            material_ops.write_osl_shader, "Ripple", "shader x() {}", "rip", {"Scale": "2.5", "Tint": "color 255 0 0"},
+        )
+
+        self.assertIn("propNames = #(#'Scale', #'Tint')", maxscript)
+        self.assertIn("propVals = #(" + material_ops._guarded_values(["2.5", "color 255 0 0"]) + ")", maxscript)
+        self.assertIn("setProperty rip propNames[i] propVals[i]", maxscript)
+        self.assertNotIn("rip.Scale", maxscript)
+
+    def test_set_texture_map_properties_loops_over_one_property_array(self) -> None:
+        maxscript = self._script(
+            material_ops.set_texture_map_properties, "noise1", {"size": "4", "phase": "0.5", "map": '"C:\\t.png"'},
+        )
+
+        self.assertIn("propNames = #(#'size', #'phase', #'map')", maxscript)
+        self.assertIn("propVals = #(" + material_ops._guarded_values(["4", "0.5", '"C:\\t.png"']) + ")", maxscript)
+        self.assertEqual(maxscript.count("try (setProperty noise1 propNames[i] propVals[i]"), 1)
+        self.assertIn('format "Set % properties on %" okList.count noise1.name to:ss', maxscript)
+
+    def test_set_texture_map_properties_assigns_dotted_paths_directly(self) -> None:
+        maxscript = self._script(material_ops.set_texture_map_properties, "bm1", {"coords.U_Tiling": "3"})
+
+        self.assertIn("propNames = #()", maxscript)
+        self.assertIn("try (bm1.coords.U_Tiling = (3); okCount += 1", maxscript)
+
+    def test_status_messages_stream_into_one_buffer(self) -> None:
+        for fn, args in (
+            (material_ops.set_material_properties, ("Box001", {"roughness": "0.4", "metalness": "1"})),
+            (material_ops.create_texture_map, ("Noise", "", "", {"size": "4"}, "n1")),
+            (material_ops.set_texture_map_properties, ("n1", {"size": "4"})),
+            (material_ops.write_osl_shader, ("A", "shader a() {}", "a", {"Scale": "2"})),
+        ):
+            with self.subTest(tool=fn.__name__):
+                maxscript = self._script(fn, *args)
+                self.assertIn('ss = stringStream ""', maxscript)
+                self.assertIn('format (if i == 1 then " | Errors: %: %" else "; %: %") errList[i][1] errList[i][2] to:ss', maxscript)
+                self.assertNotIn("msg +=", maxscript)
+
+    def test_empty_property_sets_skip_round_trip(self) -> None:
+        with patch.object(material_ops.client, "send_command") as mocked_send:
+            self.assertEqual(material_ops.set_material_properties("Box001", {}), "No properties given")
+            self.assertEqual(material_ops.set_texture_map_properties("n1", {}), "No properties given")
+        mocked_send.assert_not_called()
+
+    def test_repeated_setter_calls_reuse_the_built_script(self) -> None:
+        material_ops._set_material_property_maxscript.cache_clear()
+        first = self._script(material_ops.set_material_property, "Box001", "metalness", "1.0")
+        second = self._script(material_ops.set_material_property, "Box001", "metalness", "1.0")
+
+        self.assertIs(first, second)
+        self.assertEqual(material_ops._set_material_property_maxscript.cache_info().hits, 1)
+        self.assertEqual(first, material_ops.minify_maxscript(first))
+
+    def test_single_property_set_uses_set_material_property(self) -> None:
+        maxscript = self._script(material_ops.set_material_properties, "Box001", {"roughness": "0.4"}, 2)
+
+        self.assertEqual(maxscript, self._script(material_ops.set_material_property, "Box001", "roughness", "0.4", 2))
+        self.assertNotIn("okList", maxscript)
+
+    def test_scripts_without_properties_skip_status_lists(self) -> None:
+        for fn, args in (
+            (material_ops.create_texture_map, ("Noise", "", "", None, "n1")),
+            (material_ops.write_osl_shader, ("A", "shader a() {}", "a")),
+        ):
+            with self.subTest(tool=fn.__name__):
+                maxscript = self._script(fn, *args)
+                self.assertNotIn("okList", maxscript)
+                self.assertNotIn("errList", maxscript)
+                self.assertIn("ss as string", maxscript)
+
+    def test_map_globals_are_declared_once(self) -> None:
+        props = {"Scale": "2", "Tint": "red", "Amount": "0.5"}
+        for fn, args in (
+            (material_ops.create_texture_map, ("Noise", "", "", props, "n1")),
+            (material_ops.write_osl_shader, ("A", "shader a() {}", "n1", props)),
+        ):
+            with self.subTest(tool=fn.__name__):
+                maxscript = self._script(fn, *args)
+                self.assertEqual(maxscript.count("global n1"), 1)
+                # outer catch, property loop catch, and one per value
+                self.assertEqual(maxscript.count("getCurrentException()"), 2 + len(props))
+
+    def test_set_sub_materials_fills_every_slot_in_one_script(self) -> None:
+        with patch.object(material_ops.client, "send_command", return_value={"result": "ok"}) as mocked_send:
+            result = material_ops.set_sub_materials("Head", [
+                {"sub_material_index": 1, "material_class": "PhysicalMaterial", "material_name": 'Eye "L"'},
+                {"sub_material_index": 2, "source_index": 1},
+                {"material_class": "PhysicalMaterial"},
+            ])
+
+        self.assertEqual(result, "ok")
+        mocked_send.assert_called_once()
+        maxscript = mocked_send.call_args.args[0]
+        self.assertEqual(maxscript.count('getNodeByName "Head"'), 1)
+        self.assertIn('try (m = PhysicalMaterial name:"Eye \\"L\\"" ; mm.materialList[1] = m;', maxscript)
+        self.assertIn("try (m = mm.materialList[1]; if m == undefined", maxscript)
+        self.assertIn('format "Slot 3: needs sub_material_index', maxscript)
+        self.assertLess(maxscript.index("mm.materialList[1] = m"), maxscript.index("mm.materialList[2] = m"))
+
+    def test_set_sub_materials_without_slots_skips_round_trip(self) -> None:
+        with patch.object(material_ops.client, "send_command") as mocked_send:
+            self.assertEqual(material_ops.set_sub_materials("Head", []), "No slots given")
+        mocked_send.assert_not_called()
+
+    def test_write_osl_shader_writes_source_and_compiles_it_inline(self) -> None:
+        source = 'shader b(string s = "x\\y")\r\n{}\n'
+        maxscript = self._script(material_ops.write_osl_shader, "B", source, "b")
+
+        osl_path = Path(self.osl_dir) / "B.osl"
+        self.assertEqual(osl_path.read_bytes().decode("utf-8"), source)
+        self.assertIn(f'oslPath = "{osl_path.as_posix()}"', maxscript)
+        self.assertIn(f'b.OSLCode = "{material_ops._escape_osl(source)}"', maxscript)
+        self.assertLess(maxscript.index("b.OSLCode ="), maxscript.index("b.OSLPath = oslPath"))
+
+    def test_write_osl_shader_keeps_the_file_inside_its_folder(self) -> None:
+        for shader_name, file_name in (("../../evil", "_.._evil.osl"), ("..", "shader.osl"), ('a:b"c', "a_b_c.osl")):
+            with self.subTest(shader_name=shader_name):
+                maxscript = self._script(material_ops.write_osl_shader, shader_name, "shader x() {}", "x")
+
+                self.assertTrue((Path(self.osl_dir) / file_name).is_file())
+                self.assertIn(f'OSLMap name:"{material_ops.safe_string(shader_name)}"', maxscript)
+
+    def test_write_osl_shader_reports_unwritable_folder(self) -> None:
+        blocker = Path(self.osl_dir) / "file"
+        blocker.write_text("")
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(material_ops, "_OSL_SHADER_DIR", str(blocker)),
+            patch.object(material_ops.client, "send_command") as mocked_send,
+        ):
+            result = material_ops.write_osl_shader("A", "shader a() {}", "a")
+
+        self.assertTrue(result.startswith("Error: could not write "))
+        mocked_send.assert_not_called()
+
+    def test_set_material_properties_loops_over_name_value_arrays(self) -> None:
+        maxscript = self._script(
+            material_ops.set_material_properties,
+            "Box001",
+            {"roughness": "0.4", "metalness": "1", "base_color_map": '"C:\\tex\\a.png"'},
+        )
+
+        self.assertIn("propNames = #(#'roughness', #'metalness', #'base_color_map')", maxscript)
+        self.assertIn(
+            'propVals = #((try (0.4) catch (valErrs[1] = getCurrentException(); undefined)), '
+            '(try (1) catch (valErrs[2] = getCurrentException(); undefined)), '
+            '(try (@"C:\\tex\\a.png") catch (valErrs[3] = getCurrentException(); undefined)))',
+            maxscript,
+        )
+        self.assertEqual(maxscript.count("try (setProperty"), 1)
+        self.assertIn("setProperty mat propNames[i] propVals[i]", maxscript)
+        self.assertIn("catch (append errList #(propNames[i], getCurrentException()))", maxscript)
+        self.assertIn("okList.count = propNames.count", maxscript)
+        self.assertNotIn("append okList", maxscript)
+        self.assertIn("mat = obj.material\n", maxscript)
+
+    def test_dotted_paths_are_assigned_after_the_name_loop(self) -> None:
+        maxscript = self._script(
+            material_ops.set_material_properties, "Box001", {"roughness": "0.4", "coating.weight": "0.5"},
+        )
+
+        self.assertIn("propNames = #(#'roughness')", maxscript)
+        self.assertNotIn("#'coating.weight'", maxscript)
+        self.assertIn(
+            'try (mat.coating.weight = (0.5); okCount += 1; okList[okCount] = "coating.weight") '
+            'catch (append errList #("coating.weight", getCurrentException()))',
+            maxscript,
+        )
+        self.assertLess(maxscript.index("mat.coating.weight ="), maxscript.index("okList.count = okCount"))
+
+    def test_bad_value_is_reported_against_its_own_property(self) -> None:
+        maxscript = self._script(
+            material_ops.set_material_properties, "Box001", {"roughness": "0.4", "base_color": "undefinedGlobal.x"},
+        )
+
+        self.assertIn("(try (undefinedGlobal.x) catch (valErrs[2] = getCurrentException(); undefined))", maxscript)
+        self.assertIn("valErrs.count = propNames.count", maxscript)
+        self.assertIn(
+            "if valErrs[i] != undefined then append errList #(propNames[i], valErrs[i])\n"
+            "else try (setProperty mat propNames[i] propVals[i]",
+            maxscript,
+        )
+
+    def test_create_texture_map_sets_post_properties_after_properties(self) -> None:
+        maxscript = self._script(
+            lambda: material_ops.create_texture_map(
+                "OSLMap",
+                properties={"OSLPath": '"C:\\osl\\noise.osl"'},
+                post_properties={"scale": "4", "OSLPath": '"C:\\osl\\noise2.osl"'},
+                global_var="noiseMap",
+            )
+        )
+
+        self.assertIn("propNames = #(#'OSLPath', #'scale', #'OSLPath')", maxscript)
+        self.assertIn(
+            "propVals = #(" + material_ops._guarded_values(['"C:\\osl\\noise.osl"', "4", '"C:\\osl\\noise2.osl"']) + ")", maxscript,
+        )
+        self.assertEqual(maxscript.count("setProperty noiseMap"), 1)
+
+    def test_texture_map_bad_values_are_reported_against_their_own_property(self) -> None:
+        scripts = {
+            "set_texture_map_properties": self._script(
+                material_ops.set_texture_map_properties, "noise1", {"size": "4", "phase": "undefinedGlobal.x"},
+            ),
+            "create_texture_map": self._script(
+                lambda: material_ops.create_texture_map(
+                    "Noise", properties={"size": "4"}, post_properties={"phase": "undefinedGlobal.x"},
+                    global_var="noise1",
+                )
+            ),
+        }
+        for tool, maxscript in scripts.items():
+            with self.subTest(tool=tool):
+                self.assertIn("(try (undefinedGlobal.x) catch (valErrs[2] = getCurrentException(); undefined))", maxscript)
+                self.assertIn(
+                    "if valErrs[i] != undefined then append errList #(propNames[i], valErrs[i])\n"
+                    "else try (setProperty noise1 propNames[i] propVals[i]",
+                    maxscript,
+                )
+                self.assertLess(maxscript.index("valErrs = #()"), maxscript.index("propVals = #("))
+
+    def test_create_texture_map_post_properties_bypass_native_path(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            patch.object(material_ops.client, "send_command", return_value={"result": "ok"}) as mocked_send,
+        ):
+            material_ops.create_texture_map("OSLMap", post_properties={"scale": "4"}, global_var="osl1")
+            material_ops.create_texture_map("OSLMap", properties={"scale": "4"}, global_var="osl2")
+
+        first, second = mocked_send.call_args_list
+        self.assertNotIn("cmd_type", first.kwargs)
+        self.assertIn("propNames = #(#'scale')", first.args[0])
+        self.assertEqual(second.kwargs["cmd_type"], "native:create_texture_map")
+
+
+class QueuedMaterialSetterTests(unittest.TestCase):
+    def test_unawaited_setters_queue_the_native_payload(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            patch.object(material_ops.client, "send_command") as mocked_send,
+            patch.object(material_ops.client, "send_command_async") as mocked_queue,
+        ):
+            material_ops.set_material_property("Box001", "roughness", "0.5", await_result=False)
+            material_ops.set_material_properties("Box001", {"a": "1", "b": "2"}, await_result=False)
+            material_ops.set_texture_map_properties("tex", {"a": "1"}, await_result=False)
+
+        mocked_send.assert_not_called()
+        self.assertEqual(
+            [c.kwargs["cmd_type"] for c in mocked_queue.call_args_list],
+            ["native:set_material_property", "native:set_material_properties", "native:set_texture_map_properties"],
+        )
+
+
+class BatchMaterialOpsTests(unittest.TestCase):
+    def test_ops_are_sent_as_one_script_in_order(self) -> None:
+        ops = [
+            {"type": "assign_material", "names": ["Box001"], "material_class": "PhysicalMaterial"},
+            {"type": "set_material_property", "name": "Box001", "property": "roughness", "value": "0.4"},
+            {"type": "add_modifier", "name": "Box001", "modifier": "TurboSmooth"},
+        ]
+        with patch.object(material_ops.client, "send_command", return_value={"result": "[]"}) as mocked_send:
+            self.assertEqual(material_ops.batch_material_ops(ops), "[]")
+
+        mocked_send.assert_called_once()
+        maxscript = mocked_send.call_args.args[0]
+        self.assertIn("results.count = 3\n", maxscript)
+        self.assertIn("results[3] = try ((", maxscript)
+        self.assertNotIn("append results", maxscript)
+        self.assertLess(maxscript.index("PhysicalMaterial"), maxscript.index("#'roughness'"))
+        self.assertLess(maxscript.index("#'roughness'"), maxscript.index("TurboSmooth"))
+        self.assertIn("(esc results[i])", maxscript)
+
+    def test_bad_ops_become_error_results_without_aborting_batch(self) -> None:
+        ops = [
+            {"type": "explode"},
+            {"type": "set_material_property", "name": "Box001"},
+            {"type": "add_modifier", "name": "Box001", "modifier": "Bend"},
+        ]
+        with patch.object(material_ops.client, "send_command", return_value={"result": "[]"}) as mocked_send:
+            material_ops.batch_material_ops(ops)
+
+        maxscript = mocked_send.call_args.args[0]
+        self.assertIn("""(("Error: unknown op type 'explode'") as string)""", maxscript)
+        self.assertIn('"Error: set_material_property missing 2 required positional arguments', maxscript)
+        self.assertIn("local m = Bend", maxscript)
+
+    def test_numeric_values_are_written_as_literals(self) -> None:
+        ops = [
+            {"type": "set_material_property", "name": "Box", "property": "roughness", "value": 0.5},
+            {"type": "set_material_properties", "name": "Box", "properties": {"metalness": 1}},
+        ]
+        with patch.object(material_ops.client, "send_command", return_value={"result": "[]"}) as mocked_send:
+            material_ops.batch_material_ops(ops)
+
+        maxscript = mocked_send.call_args.args[0]
+        self.assertIn("setProperty mat #'roughness' (0.5)", maxscript)
+        self.assertIn("(try (1) catch (valErrs[1]", maxscript)
+
+    def test_empty_batch_skips_round_trip(self) -> None:
+        with patch.object(material_ops.client, "send_command") as mocked_send:
+            self.assertEqual(material_ops.batch_material_ops([]), "No operations given")
+        mocked_send.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
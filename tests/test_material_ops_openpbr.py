@@ -1,9 +1,10 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from src.tools.material_ops import create_material_from_textures
+from src.tools.material_ops import create_material_from_textures, create_materials_from_texture_folders
 
 
 class OpenPBRMaterialTests(unittest.TestCase):
@@ -41,6 +42,85 @@ class OpenPBRMaterialTests(unittest.TestCase):
 
         build_openpbr.assert_called_once()
 
+    def test_create_material_from_textures_is_one_round_trip_per_class(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "asset_basecolor.png").write_bytes(b"fake")
+
+            for material_class, head in (
+                ("", "mcp_createOpenPbrPreferred"),
+                ("ai_standard_surface", "ai_standard_surface name:"),
+                ("PhysicalMaterial", "PhysicalMaterial name:"),
+                ("RS_Standard_Material", "RS_Standard_Material name:"),
+            ):
+                with self.subTest(material_class=material_class):
+                    with patch("src.tools.material_ops.client.send_command", return_value={"result": "ok"}) as send:
+                        create_material_from_textures(tmp, material_class=material_class)
+
+                    send.assert_called_once()
+                    maxscript = send.call_args.args[0]
+                    self.assertIn(head, maxscript)
+                    self.assertNotIn("renderers.current", maxscript)
+
+
+    def test_material_class_picks_builder_from_token_table(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "asset_basecolor.png").write_bytes(b"fake")
+
+            for material_class, head in (
+                ("Open_PBR_Mtl", "mcp_createOpenPbrPreferred"),
+                ("ArnoldStandard", "ai_standard_surface name:"),
+                ("redshift", "RS_Standard_Material name:"),
+            ):
+                with self.subTest(material_class=material_class):
+                    with patch("src.tools.material_ops.client.send_command", return_value={"result": "ok"}) as send:
+                        create_material_from_textures(tmp, material_class=material_class)
+                    self.assertIn(head, send.call_args.args[0])
+
+            with patch("src.tools.material_ops.client.send_command") as send:
+                result = create_material_from_textures(tmp, material_class="VRayMtl")
+        send.assert_not_called()
+        self.assertTrue(result.startswith("Unsupported material_class: VRayMtl."))
+
+
+class TextureFolderBatchTests(unittest.TestCase):
+    def test_batch_sends_one_script_with_a_block_per_folder(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            folders = []
+            for name in ("Oak", "Brick", "Empty"):
+                folder = Path(tmp) / name
+                folder.mkdir()
+                folders.append(str(folder))
+            (Path(folders[0]) / "oak_basecolor.png").write_bytes(b"fake")
+            (Path(folders[1]) / "brick_roughness.png").write_bytes(b"fake")
+
+            with patch("src.tools.material_ops.client.send_command", return_value={"result": "ok"}) as send:
+                result = create_materials_from_texture_folders(folders, material_class="PhysicalMaterial")
+
+        self.assertEqual(result, "ok")
+        send.assert_called_once()
+        maxscript = send.call_args.args[0]
+        self.assertIn('mat = PhysicalMaterial name:"Oak"', maxscript)
+        self.assertIn('mat = PhysicalMaterial name:"Brick"', maxscript)
+        self.assertEqual(maxscript.count("getCurrentException()"), 2)
+        self.assertIn("No image files found in: ", maxscript)
+        self.assertLess(maxscript.index('name:"Oak"'), maxscript.index('name:"Brick"'))
+
+    def test_material_is_named_after_folder_even_with_trailing_separator(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp) / "Walnut"
+            folder.mkdir()
+            (folder / "walnut_basecolor.png").write_bytes(b"fake")
+
+            with patch("src.tools.material_ops.client.send_command", return_value={"result": "ok"}) as send:
+                create_materials_from_texture_folders([str(folder) + os.sep], material_class="PhysicalMaterial")
+
+        self.assertIn('mat = PhysicalMaterial name:"Walnut"', send.call_args.args[0])
+
+    def test_batch_without_folders_skips_round_trip(self) -> None:
+        with patch("src.tools.material_ops.client.send_command") as send:
+            self.assertEqual(create_materials_from_texture_folders([]), "No texture folders given")
+        send.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
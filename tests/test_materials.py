@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import PropertyMock, patch
+
+from src.helpers.inspect_cache import invalidate_inspect_cache
+from src.tools import materials
+
+
+class GetMaterialsFallbackTests(unittest.TestCase):
+    def setUp(self) -> None:
+        invalidate_inspect_cache()
+
+    def _script(self) -> str:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(materials.client, "send_command", return_value={"result": "[]"}) as mocked_send,
+        ):
+            self.assertEqual(materials.get_materials(), "[]")
+        return mocked_send.call_args.args[0]
+
+    def test_scene_is_walked_once_through_a_name_index(self) -> None:
+        maxscript = self._script()
+
+        self.assertEqual(maxscript.count("in objects"), 1)
+        self.assertIn('matIdx = dotNetObject "System.Collections.Hashtable"', maxscript)
+        self.assertIn("append matObjs[i] obj.name", maxscript)
+        self.assertNotIn("findItem", maxscript)
+
+    def test_names_are_json_escaped(self) -> None:
+        maxscript = self._script()
+
+        self.assertIn("(esc matNames[i]) (esc matClasses[i])", maxscript)
+        self.assertIn("(esc matObjs[i][j])", maxscript)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,61 @@ class MaxClientTests(unittest.TestCase):
             with self.assertRaisesRegex(RuntimeError, "Mismatched response requestId"):
                 client.send_command("x")
 
+    def test_native_probe_reuses_connected_pipe_handle(self) -> None:
+        client = MaxClient(timeout=1.0)
+        client._pipe_handle = 1234
+
+        with patch("src.max_client._kernel32") as kernel32:
+            self.assertTrue(client.native_available)
+        kernel32.CreateFileW.assert_not_called()
+
+    def test_queued_commands_run_in_order_before_the_next_send(self) -> None:
+        client = MaxClient(timeout=1.0, transport="tcp")
+        sent = []
+
+        def fake_send(command, cmd_type, timeout):
+            sent.append(command)
+            if command == "bad":
+                raise RuntimeError("MAXScript error: boom")
+            return {"result": command}
+
+        with patch.object(client, "_send_command", side_effect=fake_send):
+            client.send_command_async("a")
+            client.send_command_async("bad")
+            client.send_command_async("b")
+            self.assertEqual(client.send_command("read")["result"], "read")
+            self.assertEqual(sent, ["a", "bad", "b", "read"])
+            self.assertEqual(client.wait_queued_commands(), ["MAXScript error: boom"])
+            self.assertEqual(client.wait_queued_commands(), [])
+
+    def test_queued_failures_reported_in_the_reply_are_kept(self) -> None:
+        client = MaxClient(timeout=1.0, transport="tcp")
+        replies = {
+            "a": "Set Box001.roughness = 0.4",
+            "b": "Object not found: Box002",
+            "c": "Set 1 properties on Mat: metalness | Errors: coating.weight: -- Unknown property",
+            "d": "Error setting roughness: -- Unable to convert",
+            "e": "Error: Sub-material index 3 not found on Box001",
+        }
+
+        with patch.object(client, "_send_command", side_effect=lambda command, *_: {"result": replies[command]}):
+            for command in replies:
+                client.send_command_async(command)
+            self.assertEqual(client.wait_queued_commands(), [replies[c] for c in "bcde"])
+
+    def test_send_command_reassembles_chunked_tcp_response(self) -> None:
+        payload = "x" * 100_000
+        body = ('{"success":true,"result":"' + payload + '","error":""}\n').encode("utf-8")
+        fake_socket = MagicMock()
+        fake_socket.recv.side_effect = [body[i:i + 30_000] for i in range(0, len(body), 30_000)]
+
+        with patch("src.max_client.socket.socket", return_value=fake_socket):
+            client = MaxClient(timeout=1.0, transport="tcp")
+            response = client.send_command("x")
+
+        self.assertEqual(response["result"], payload)
+        self.assertEqual(fake_socket.recv.call_count, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
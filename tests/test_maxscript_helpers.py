@@ -1,6 +1,6 @@
 import unittest
 
-from src.helpers.maxscript import safe_name, safe_string
+from src.helpers.maxscript import builder_block, minify_maxscript, safe_name, safe_string, safe_value, string_array
 
 
 class MaxscriptHelperTests(unittest.TestCase):
@@ -12,6 +12,65 @@ class MaxscriptHelperTests(unittest.TestCase):
         value = 'Box "A"\\B\'s'
         self.assertEqual(safe_name(value), 'Box \\"A\\"\\\\B\\\'s')
 
+    def test_safe_string_passes_plain_names_through(self) -> None:
+        self.assertEqual(safe_string("Box001"), "Box001")
+        self.assertEqual(safe_name("Box001"), "Box001")
+
+    def test_safe_value_writes_json_scalars_as_literals(self) -> None:
+        self.assertEqual(safe_value(0.5), "0.5")
+        self.assertEqual(safe_value(3), "3")
+        self.assertEqual(safe_value(True), "True")
+
+    def test_builder_block_reports_any_builder_error_as_a_literal(self) -> None:
+        def explode(name: str) -> str:
+            return name.strip()
+
+        self.assertEqual(
+            builder_block(explode, {"name": 1}, "op"), '"Error: \'int\' object has no attribute \'strip\'"',
+        )
+
+    def test_plain_names_are_returned_as_is(self) -> None:
+        name = "".join(["Material", "_042"])
+        self.assertIs(safe_string.__wrapped__(name), name)
+        self.assertIs(safe_name.__wrapped__(name), name)
+        self.assertEqual(safe_name.__wrapped__("it's"), "it\\'s")
+
+    def test_escapes_are_memoized_in_one_shared_cache(self) -> None:
+        from src.tools import material_ops, modifiers
+
+        self.assertIs(material_ops.safe_name, safe_name)
+        self.assertIs(modifiers.safe_string, safe_string)
+        safe_name.cache_clear()
+        for _ in range(3):
+            safe_name("Box's \"lid\"")
+        self.assertEqual(safe_name.cache_info().hits, 2)
+        self.assertEqual(safe_name.cache_info().maxsize, 4096)
+
+    def test_string_array_matches_per_element_escaping(self) -> None:
+        for values in ([], [""], ["Box001"], ["a", "", 'b "c"', "C:\\x\\", "d, e"], ["nul\0in", "name"]):
+            with self.subTest(values=values):
+                expected = "#(" + ", ".join(f'"{safe_string(v)}"' for v in values) + ")"
+                self.assertEqual(string_array(values), expected)
+
+    def test_minify_drops_indentation_blank_lines_and_comments(self) -> None:
+        script = '(\n    -- set "it"\n    x = 1  -- trailing\n\n        y = x\n)'
+        self.assertEqual(minify_maxscript(script), "(\nx = 1\ny = x\n)")
+
+    def test_minify_keeps_literals_verbatim(self) -> None:
+        script = (
+            '(\n    a = "x -- \\"b\\"  \\\\"\n'
+            '    p = @"C:\\dir\\"\n'
+            '    s = @"line1\n        line2"\n'
+            '    n = #(#\'b\\"--c\', $\'Box -- 1\')\n)'
+        )
+        self.assertEqual(
+            minify_maxscript(script),
+            '(\na = "x -- \\"b\\"  \\\\"\n'
+            'p = @"C:\\dir\\"\n'
+            's = @"line1\n        line2"\n'
+            'n = #(#\'b\\"--c\', $\'Box -- 1\')\n)',
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import PropertyMock, patch
+
+from src.tools import modifiers
+
+
+class ModifierBatchTests(unittest.TestCase):
+    def _script(self, fn, targets) -> str:
+        with patch.object(modifiers.client, "send_command", return_value={"result": "[]"}) as mocked_send:
+            self.assertEqual(fn(targets), "[]")
+        mocked_send.assert_called_once()
+        return mocked_send.call_args.args[0]
+
+    def test_add_modifiers_reuses_single_target_blocks(self) -> None:
+        maxscript = self._script(
+            modifiers.add_modifiers,
+            [
+                {"name": "Box001", "modifier": "TurboSmooth", "params": "iterations:2"},
+                {"name": "Box002", "modifier": "Bend"},
+            ],
+        )
+
+        self.assertIn(modifiers._add_modifier_maxscript("Box001", "TurboSmooth", "iterations:2"), maxscript)
+        self.assertIn(modifiers._add_modifier_maxscript("Box002", "Bend"), maxscript)
+        self.assertIn("results.count = 2\n", maxscript)
+        self.assertIn("results[2] = try ((", maxscript)
+        self.assertNotIn("append results", maxscript)
+        self.assertIn("(esc results[i])", maxscript)
+
+    def test_remove_modifiers_reports_bad_targets_in_place(self) -> None:
+        maxscript = self._script(
+            modifiers.remove_modifiers,
+            [{"name": "Box001"}, {"name": "Box002", "modifier": "Bend"}],
+        )
+
+        self.assertIn('"Error: modifier or modifier_index is required"', maxscript)
+        self.assertIn('local idx = findItem (for m in obj.modifiers collect m.name) "Bend"', maxscript)
+        self.assertLess(maxscript.index("Error: modifier"), maxscript.index('"Bend"'))
+
+    def test_malformed_targets_do_not_abort_the_batch(self) -> None:
+        maxscript = self._script(
+            modifiers.remove_modifiers,
+            [{"name": 7, "modifier": "Bend"}, {"name": "Box002", "modifier_index": "x"}, {"name": "Box003", "modifier": "Bend"}],
+        )
+
+        self.assertIn('results[1] = try (("Error: ', maxscript)
+        self.assertIn('results[2] = try (("Error: ', maxscript)
+        self.assertIn('getNodeByName "Box003"', maxscript)
+
+    def test_empty_batches_skip_round_trip(self) -> None:
+        with patch.object(modifiers.client, "send_command") as mocked_send:
+            self.assertEqual(modifiers.add_modifiers([]), "No targets given")
+            self.assertEqual(modifiers.remove_modifiers([]), "No targets given")
+        mocked_send.assert_not_called()
+
+
+class RemoveModifierTests(unittest.TestCase):
+    def _script(self, *args, **kwargs) -> str:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(modifiers.client, "send_command", return_value={"result": "ok"}) as mocked_send,
+        ):
+            self.assertEqual(modifiers.remove_modifier(*args, **kwargs), "ok")
+        return mocked_send.call_args.args[0]
+
+    def test_name_lookup_is_one_find_item_without_a_loop(self) -> None:
+        maxscript = self._script("Box001", "Bend")
+
+        self.assertIn('local idx = findItem (for m in obj.modifiers collect m.name) "Bend"', maxscript)
+        self.assertIn("deleteModifier obj idx", maxscript)
+        self.assertNotIn("exit", maxscript)
+
+    def test_index_skips_the_name_lookup(self) -> None:
+        maxscript = self._script("Box001", "Bend", modifier_index=2)
+
+        self.assertIn("local idx = if 2 <= obj.modifiers.count then 2 else 0", maxscript)
+        self.assertNotIn("findItem", maxscript)
+        self.assertNotIn('"Bend"', maxscript)
+
+    def test_index_removal_bypasses_native_path(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=True),
+            patch.object(modifiers.client, "send_command", return_value={"result": "ok"}) as mocked_send,
+        ):
+            modifiers.remove_modifier("Box001", "Bend", modifier_index=2)
+            modifiers.remove_modifier("Box001", "Bend")
+
+        by_index, by_name = mocked_send.call_args_list
+        self.assertNotIn("cmd_type", by_index.kwargs)
+        self.assertEqual(by_name.kwargs["cmd_type"], "native:remove_modifier")
+
+    def test_missing_modifier_skips_round_trip(self) -> None:
+        with patch.object(modifiers.client, "send_command") as mocked_send:
+            self.assertEqual(modifiers.remove_modifier("Box001"), "No modifier given")
+        mocked_send.assert_not_called()
+
+
+class QueuedSetterTests(unittest.TestCase):
+    def test_unawaited_add_modifier_is_queued_without_a_reply(self) -> None:
+        with (
+            patch("src.max_client.MaxClient.native_available", new_callable=PropertyMock, return_value=False),
+            patch.object(modifiers.client, "send_command") as mocked_send,
+            patch.object(modifiers.client, "send_command_async") as mocked_queue,
+        ):
+            result = modifiers.add_modifier("Box001", "Bend", await_result=False)
+
+        self.assertEqual(result, modifiers.QUEUED_RESULT)
+        mocked_send.assert_not_called()
+        mocked_queue.assert_called_once_with(
+            modifiers._add_modifier_maxscript("Box001", "Bend"), cmd_type="maxscript"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
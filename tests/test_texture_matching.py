@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.tools import material_ops
+
+
+def _detect(name: str):
+    index = material_ops._index_channel_patterns(material_ops._DEFAULT_CHANNEL_PATTERNS)
+    return material_ops._detect_texture_channel(Path("C:/textures/Set") / name, index)
+
+
+class TextureChannelDetectionTests(unittest.TestCase):
+    def test_token_sequences_strip_channel_and_variant_tokens_from_key(self) -> None:
+        self.assertEqual(_detect("Oak_Floor_Roughness_2K.jpg"), ("roughness", "oak_floor", "roughness"))
+        self.assertEqual(_detect("brick_normal_gl.png"), ("normal", "brick", "normal gl"))
+
+    def test_compact_suffix_fallback_matches_camel_case_names(self) -> None:
+        self.assertEqual(_detect("woodBaseColor.png"), ("diffuse", "woodbasecolor", "basecolor"))
+
+    def test_trailing_channel_token_outscores_earlier_one(self) -> None:
+        self.assertEqual(_detect("tile_ao_color.png"), ("diffuse", "tile_ao", "color"))
+
+    def test_single_letter_aliases_still_match_alone(self) -> None:
+        self.assertEqual(_detect("rock_d.png"), ("diffuse", "rock", "_d"))
+        self.assertIsNone(_detect("plain.png"))
+
+    def test_default_patterns_are_frozen(self) -> None:
+        with self.assertRaises(TypeError):
+            material_ops._DEFAULT_CHANNEL_PATTERNS["sheen"] = ("sheen",)
+        self.assertIsInstance(material_ops._DEFAULT_CHANNEL_PATTERNS["diffuse"], tuple)
+
+    def test_default_pattern_index_is_built_once(self) -> None:
+        self.assertIs(
+            material_ops._channel_index(material_ops._DEFAULT_CHANNEL_PATTERNS),
+            material_ops._DEFAULT_CHANNEL_INDEX,
+        )
+        custom = dict(material_ops._DEFAULT_CHANNEL_PATTERNS)
+        self.assertEqual(material_ops._channel_index(custom), material_ops._DEFAULT_CHANNEL_INDEX)
+        self.assertIsNot(material_ops._channel_index(custom), material_ops._DEFAULT_CHANNEL_INDEX)
+
+    def test_index_skips_aliases_without_tokens(self) -> None:
+        by_first_token, by_compact, lengths, suffixes = material_ops._index_channel_patterns(
+            {"diffuse": ["_", "_basecolor"], "roughness": ["_r"]}
+        )
+        self.assertEqual(sorted(by_first_token), ["basecolor", "r"])
+        self.assertEqual(by_compact, {"basecolor": [(0, "diffuse", "_basecolor")]})
+        self.assertEqual(lengths, (9,))
+        self.assertEqual(suffixes, ("basecolor",))
+
+
+class TextureFolderScanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        material_ops._scan_texture_folder_cached.cache_clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = self._tmp.name
+        for name in ("wood_color.PNG", "wood_rough.jpg", "notes.txt", "README"):
+            Path(self.folder, name).write_text("")
+        os.mkdir(os.path.join(self.folder, "sub.png"))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_only_image_files_are_returned(self) -> None:
+        names = sorted(p.name for p in material_ops._scan_texture_folder(self.folder))
+        self.assertEqual(names, ["wood_color.PNG", "wood_rough.jpg"])
+
+    def test_rescan_is_cached_until_folder_changes(self) -> None:
+        material_ops._scan_texture_folder(self.folder)
+        material_ops._scan_texture_folder(self.folder)
+        self.assertEqual(material_ops._scan_texture_folder_cached.cache_info().hits, 1)
+
+        Path(self.folder, "wood_normal.png").write_text("")
+        stat = os.stat(self.folder)
+        os.utime(self.folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(len(material_ops._scan_texture_folder(self.folder)), 3)
+
+    def test_scan_hands_back_the_cached_tuple(self) -> None:
+        self.assertIs(material_ops._scan_texture_folder(self.folder), material_ops._scan_texture_folder(self.folder))
+
+    def test_missing_folder_returns_empty_tuple(self) -> None:
+        self.assertEqual(material_ops._scan_texture_folder(os.path.join(self.folder, "nope")), ())
+
+
+class TextureMatchCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        material_ops._match_texture_folder_cached.cache_clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = self._tmp.name
+        for name in ("oak_basecolor.png", "oak_rough.png", "oak_sheen.png"):
+            Path(self.folder, name).write_text("")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_same_folder_and_patterns_are_matched_once(self) -> None:
+        first = material_ops._match_texture_folder(self.folder, ())
+        second = material_ops._match_texture_folder(self.folder, ())
+
+        self.assertIs(first, second)
+        self.assertEqual(material_ops._match_texture_folder_cached.cache_info().misses, 1)
+        files, matched = first
+        self.assertEqual(matched, material_ops._match_textures_to_channels(list(files), material_ops._DEFAULT_CHANNEL_PATTERNS))
+
+    def test_custom_patterns_are_part_of_the_key(self) -> None:
+        self.assertNotIn("sheen", material_ops._match_texture_folder(self.folder, ())[1])
+        _, matched = material_ops._match_texture_folder(self.folder, (("sheen", ("sheen",)),))
+        self.assertEqual(matched["sheen"].name, "oak_sheen.png")
+
+    def test_folder_change_is_a_new_key(self) -> None:
+        material_ops._match_texture_folder(self.folder, ())
+        Path(self.folder, "oak_normal.png").write_text("")
+        stat = os.stat(self.folder)
+        os.utime(self.folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertIn("normal", material_ops._match_texture_folder(self.folder, ())[1])
+
+    def test_missing_folder_matches_nothing(self) -> None:
+        self.assertEqual(material_ops._match_texture_folder(os.path.join(self.folder, "nope"), ()), ((), {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import ast
+import unittest
+from collections import Counter
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "src" / "tools"
+
+
+def _tool_names(path: Path) -> list[str]:
+    """Names of the functions in *path* decorated with ``@mcp.tool()``."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    names = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for deco in node.decorator_list:
+            target = deco.func if isinstance(deco, ast.Call) else deco
+            if isinstance(target, ast.Attribute) and target.attr == "tool":
+                names.append(node.name)
+    return names
+
+
+class ToolRegistryTests(unittest.TestCase):
+    def test_tool_names_are_registered_once(self) -> None:
+        counts = Counter(
+            name for path in sorted(TOOLS_DIR.glob("*.py")) for name in _tool_names(path)
+        )
+        duplicates = sorted(name for name, count in counts.items() if count > 1)
+        self.assertEqual(duplicates, [])
+        self.assertEqual(counts["inspect_object"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()